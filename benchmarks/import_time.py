@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Cold-start import budget check for the Site24x7 CLI
+
+Runs ``python -X importtime -c "import site24x7_cli.main"`` several times and
+fails (exit status 1) when the best cumulative import time exceeds the
+budget, or when a module that should load lazily is imported at startup.
+
+    python benchmarks/import_time.py --budget-ms 150
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Heavy dependencies that must only be imported once a command needs them
+LAZY_MODULES = ('requests', 'rich', 'aiohttp', 'site24x7_cli.base', 'site24x7_cli.commands')
+
+LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def measure(module: str) -> dict:
+    """Import ``module`` in a fresh interpreter and parse the importtime report"""
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            capture_output=True, text=True, env=env)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            cumulative[match.group(4)] = int(match.group(2))
+    return cumulative
+
+
+def eager_imports(runs: list, lazy: tuple = LAZY_MODULES) -> list:
+    """The modules under ``lazy`` that any of the measured imports loaded"""
+    return sorted({name for run in runs for name in run
+                   if any(name == module or name.startswith(module + '.') for module in lazy)})
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--module', default='site24x7_cli.main', help='Module to import')
+    parser.add_argument('--budget-ms', type=float,
+                        default=float(os.getenv('SITE24X7_IMPORT_BUDGET_MS', 150)),
+                        help='Maximum cumulative import time in milliseconds')
+    parser.add_argument('--runs', type=int, default=5, help='Number of cold imports to time')
+    parser.add_argument('--output', help='Write the result as JSON to this file')
+    args = parser.parse_args()
+
+    runs = [measure(args.module) for _ in range(args.runs)]
+    best_ms = min(run.get(args.module, 0) for run in runs) / 1000.0
+    eager = eager_imports(runs)
+
+    result = {
+        'module': args.module,
+        'best_ms': round(best_ms, 2),
+        'budget_ms': args.budget_ms,
+        'eager_imports': eager,
+        'passed': best_ms <= args.budget_ms and not eager,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(result, f, indent=2)
+    print(json.dumps(result, indent=2))
+
+    if eager:
+        print(f"FAIL: imported at startup: {', '.join(eager)}", file=sys.stderr)
+    if best_ms > args.budget_ms:
+        print(f"FAIL: {best_ms:.1f} ms exceeds the {args.budget_ms:.0f} ms budget", file=sys.stderr)
+    return 0 if result['passed'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Site24x7 API used by the benchmarks
+
+Serves ``/api/website-monitors``, ``/api/api-monitors``,
+``/api/performance-reports`` and ``/current_status`` from generated data,
+with configurable latency, page size cap, record size and 429/5xx
+injection. Point the CLI at it with ``SITE24X7_BASE_URL``:
+
+    python benchmarks/mock_server.py --port 8099 --monitors 5000 --latency-ms 40
+    SITE24X7_BASE_URL=http://127.0.0.1:8099 site24x7 -o ndjson \\
+        monitor-management website-monitors list --all
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+MONITOR_TYPES = ('website-monitors', 'api-monitors')
+STATUSES = ('1', '1', '1', '1', '0', '2', '5')
+
+
+def make_monitor(monitor_type: str, index: int, config_entries: int = 0) -> Dict[str, Any]:
+    """A generated monitor record, with ``config_entries`` nested settings when given"""
+    record = {
+        'monitor_id': str(100000 + index),
+        'display_name': f'{monitor_type[:-9]}-{index:06d}',
+        'type': 'URL' if monitor_type == 'website-monitors' else 'RESTAPI',
+        'website': f'https://service-{index % 97}.example.com/health',
+        'status': STATUSES[index % len(STATUSES)],
+        'group_id': str(index % 20),
+        'check_frequency': '5',
+        'timeout': 30,
+        'location_profile_id': '1000',
+        'threshold_profile_id': '2000',
+        'notification_profile_id': '3000',
+        'user_group_ids': ['4000'],
+    }
+    if config_entries:
+        record['custom_headers'] = [{'name': f'X-Header-{i}', 'value': f'value-{index}-{i}'}
+                                    for i in range(config_entries)]
+        record['match_content'] = {'keywords': [f'keyword-{i}' for i in range(config_entries)],
+                                   'case_sensitive': False}
+    return record
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 drops connections from highly concurrent clients
+    request_queue_size = 1024
+
+
+class MockSite24x7:
+    """Threaded HTTP server emulating the Site24x7 endpoints the CLI uses"""
+
+    def __init__(self, monitors: int = 1000, latency_ms: float = 0.0,
+                 max_page_size: Optional[int] = None, error_rate: float = 0.0,
+                 throttle_rate: float = 0.0, retry_after: float = 0.0,
+                 samples: int = 288, config_entries: int = 0, host: str = '127.0.0.1',
+                 port: int = 0, seed: int = 0):
+        self.latency = latency_ms / 1000.0
+        self.max_page_size = max_page_size
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.samples = samples
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = {'requests': 0, 'throttled': 0, 'errors': 0, 'bytes_out': 0}
+        self.data: Dict[str, List[Dict[str, Any]]] = {
+            monitor_type: [make_monitor(monitor_type, i, config_entries) for i in range(monitors)]
+            for monitor_type in MONITOR_TYPES
+        }
+        self.data['performance-reports'] = [
+            {'monitor_id': record['monitor_id'], 'display_name': record['display_name'],
+             'group_id': record['group_id']}
+            for record in self.data['website-monitors']
+        ]
+        self.next_id = 900000
+        self.server = _Server((host, port), self._handler_class())
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> str:
+        """Serve on a background thread and return the base URL"""
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self.url
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> 'MockSite24x7':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def count(self, key: str, amount: int = 1) -> None:
+        with self.lock:
+            self.stats[key] += amount
+
+    def inject(self) -> Optional[int]:
+        """Pick an injected failure status for this request, if any"""
+        with self.lock:
+            roll = self.random.random()
+        if roll < self.throttle_rate:
+            self.count('throttled')
+            return 429
+        if roll < self.throttle_rate + self.error_rate:
+            self.count('errors')
+            return 503
+        return None
+
+    def route(self, method: str, path: str, query: Dict[str, str], body: Any):
+        """Return ``(status, payload)`` for a request"""
+        parts = [part for part in path.split('/') if part]
+        if parts and parts[0] == 'api':
+            parts = parts[1:]
+        if parts == ['current_status']:
+            return 200, {'code': 0, 'data': {'monitors': [
+                {'monitor_id': m['monitor_id'], 'name': m['display_name'], 'status': int(m['status'])}
+                for m in self.data['website-monitors']]}}
+        if not parts or parts[0] not in self.data:
+            return 404, {'code': 404, 'message': 'Not found'}
+
+        collection = self.data[parts[0]]
+        if len(parts) == 1 and method == 'GET':
+            records = [record for record in collection
+                       if all(record.get(key) == query[key] for key in ('status', 'group_id')
+                              if key in query)]
+            offset = int(query.get('offset', 0))
+            limit = int(query.get('limit', 50))
+            if self.max_page_size:
+                limit = min(limit, self.max_page_size)
+            return 200, {'code': 0, 'data': records[offset:offset + limit]}
+        if len(parts) == 1 and method == 'POST':
+            with self.lock:
+                self.next_id += 1
+                record = dict(body or {}, monitor_id=str(self.next_id))
+                collection.append(record)
+            return 201, {'code': 0, 'message': 'success', 'data': record}
+
+        record = next((r for r in collection if r['monitor_id'] == parts[1]), None)
+        if record is None:
+            return 404, {'code': 404, 'message': 'Resource not found'}
+        if method == 'GET' and parts[0] == 'performance-reports':
+            return 200, {'code': 0, 'data': {'chart_data': self.report(record, query)}}
+        if method == 'GET':
+            return 200, {'code': 0, 'data': record}
+        if method == 'PUT':
+            record.update(body or {})
+            return 200, {'code': 0, 'message': 'success', 'data': record}
+        if method == 'DELETE':
+            collection.remove(record)
+            return 200, {'code': 0, 'message': 'success'}
+        return 405, {'code': 405, 'message': 'Method not allowed'}
+
+    def report(self, record: Dict[str, Any], query: Dict[str, str]) -> List[Dict[str, Any]]:
+        """Generated 5-minute samples for one monitor"""
+        end = int(time.time()) // 300 * 300
+        rng = random.Random(int(record['monitor_id']))
+        return [{'collection_time': end - (self.samples - i) * 300,
+                 'response_time': round(rng.lognormvariate(5, 0.4), 1),
+                 'availability': 100.0 if rng.random() > 0.01 else 0.0}
+                for i in range(self.samples)]
+
+    def _handler_class(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Headers and body are written separately; avoid delayed-ACK stalls
+            disable_nagle_algorithm = True
+
+            def handle_request(self, method: str) -> None:
+                mock.count('requests')
+                length = int(self.headers.get('Content-Length') or 0)
+                raw = self.rfile.read(length) if length else b''
+                if mock.latency:
+                    time.sleep(mock.latency)
+
+                injected = mock.inject()
+                if injected:
+                    status, payload = injected, {'code': injected, 'message': 'injected failure'}
+                else:
+                    url = urlparse(self.path)
+                    query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+                    try:
+                        body = json.loads(raw) if raw else None
+                    except ValueError:
+                        body = None
+                    status, payload = mock.route(method, url.path, query, body)
+
+                data = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+                mock.count('bytes_out', len(data))
+                try:
+                    self.send_response(status)
+                    self.send_header('Content-Type', 'application/json;charset=UTF-8')
+                    self.send_header('Content-Length', str(len(data)))
+                    if status == 429:
+                        self.send_header('Retry-After', str(mock.retry_after))
+                    self.end_headers()
+                    self.wfile.write(data)
+                except (BrokenPipeError, ConnectionResetError):
+                    # The client gave up on this request (e.g. a read timeout)
+                    self.close_connection = True
+
+            def do_GET(self) -> None:
+                self.handle_request('GET')
+
+            def do_POST(self) -> None:
+                self.handle_request('POST')
+
+            def do_PUT(self) -> None:
+                self.handle_request('PUT')
+
+            def do_DELETE(self) -> None:
+                self.handle_request('DELETE')
+
+            def log_message(self, *args) -> None:
+                pass
+
+        return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8099)
+    parser.add_argument('--monitors', type=int, default=1000, help='Monitors per type')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Added latency per request')
+    parser.add_argument('--max-page-size', type=int, help='Cap on records per list page')
+    parser.add_argument('--config-entries', type=int, default=0,
+                        help='Nested config entries added to each monitor')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of 503 responses')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='Fraction of 429 responses')
+    parser.add_argument('--retry-after', type=float, default=0.0, help='Retry-After sent with 429s')
+    args = parser.parse_args()
+
+    mock = MockSite24x7(monitors=args.monitors, latency_ms=args.latency_ms,
+                        max_page_size=args.max_page_size, error_rate=args.error_rate,
+                        throttle_rate=args.throttle_rate, retry_after=args.retry_after,
+                        config_entries=args.config_entries, host=args.host, port=args.port)
+    print(f'Mock Site24x7 API on {mock.url} (Ctrl+C to stop)', flush=True)
+    try:
+        mock.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        mock.server.server_close()
+
+
+if __name__ == '__main__':
+    main()
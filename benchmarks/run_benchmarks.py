@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the Site24x7 CLI against a local mock API
+
+Measures list throughput, bulk create rate (with and without 429
+injection, and on the asyncio engine when aiohttp is installed), report
+aggregation, request coalescing, memory use with --fields, output
+rendering for 10k/100k rows and cold start, and writes the results as
+JSON so runs on different commits can be compared:
+
+    python benchmarks/run_benchmarks.py --output before.json
+    python benchmarks/run_benchmarks.py --output after.json --compare before.json
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mock_server import MockSite24x7, make_monitor  # noqa: E402
+
+# Metric suffixes compared between runs
+HIGHER_IS_BETTER = ('_per_s',)
+LOWER_IS_BETTER = ('_ms', '_s', '_mb')
+
+
+def timed(func: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def client(base_url: str, **kwargs):
+    os.environ['SITE24X7_BASE_URL'] = base_url
+    from site24x7_cli.base import Site24x7Client
+    return Site24x7Client('benchmark-token-0000000000', **kwargs)
+
+
+def bench_list(args) -> Dict[str, Any]:
+    """Records per second for a paginated list at several page sizes"""
+    results = {}
+    with MockSite24x7(monitors=args.monitors, latency_ms=args.latency_ms) as mock:
+        for page_size in (50, 200):
+            api = client(mock.url)
+            count = 0
+
+            def consume():
+                nonlocal count
+                for _ in api.iter_pages('/api/website-monitors', page_size=page_size,
+                                        key='website-monitors'):
+                    count += 1
+
+            elapsed = timed(consume)
+            results[f'page_{page_size}'] = {'records': count, 'elapsed_s': round(elapsed, 3),
+                                            'records_per_s': round(count / elapsed, 1)}
+    return results
+
+
+def bench_bulk_create(args) -> Dict[str, Any]:
+    """Bulk create rate on the worker pool, clean and with throttling"""
+    from site24x7_cli.bulk import BulkStats, run_bulk
+
+    results = {}
+    for name, throttle_rate in (('clean', 0.0), ('throttled_5pct', 0.05)):
+        with MockSite24x7(monitors=0, latency_ms=args.latency_ms,
+                          throttle_rate=throttle_rate) as mock:
+            api = client(mock.url, max_retries=10)
+            records = [make_monitor('website-monitors', i) for i in range(args.creates)]
+            stats = BulkStats()
+            for result in run_bulk(lambda record: api.post('/api/website-monitors', data=record),
+                                   records, args.concurrency):
+                stats.add(result)
+            summary = stats.summary()
+            summary['throttled'] = mock.stats['throttled']
+            results[name] = summary
+
+    from site24x7_cli import async_client
+    if async_client.aiohttp is not None:
+        async def create(api, record):
+            return await api.post('/api/website-monitors', data=record)
+
+        with MockSite24x7(monitors=0, latency_ms=args.latency_ms) as mock:
+            os.environ['SITE24X7_BASE_URL'] = mock.url
+            records = [make_monitor('website-monitors', i) for i in range(args.creates)]
+            stats = BulkStats()
+            for result in async_client.run_bulk_async(create, records, args.async_concurrency,
+                                                      oauth_token='benchmark-token-0000000000'):
+                stats.add(result)
+            results[f'async_{args.async_concurrency}'] = stats.summary()
+    return results
+
+
+def bench_aggregate(args) -> Dict[str, Any]:
+    """Fetch and summarise performance reports for many monitors"""
+    from site24x7_cli.aggregate import ReportAggregator
+    from site24x7_cli.bulk import run_bulk
+
+    with MockSite24x7(monitors=args.reports, latency_ms=args.latency_ms) as mock:
+        api = client(mock.url)
+        aggregator = ReportAggregator()
+        monitors = list(api.iter_pages('/api/performance-reports', page_size=200))
+        start = time.perf_counter()
+        for result in run_bulk(lambda m: (m, api.get(f"/api/performance-reports/{m['monitor_id']}")),
+                               monitors, args.concurrency):
+            monitor, report = result.result
+            aggregator.add(monitor['monitor_id'], report, monitor['display_name'], monitor['group_id'])
+        fetched = time.perf_counter()
+        rows = aggregator.rows()
+        done = time.perf_counter()
+    return {'monitors': len(monitors), 'fetch_s': round(fetched - start, 3),
+            'summarise_ms': round((done - fetched) * 1000, 1), 'rows': len(rows)}
+
+
+def bench_coalesce(args) -> Dict[str, Any]:
+    """Requests sent when many workers GET the same few endpoints at once"""
+    from site24x7_cli.bulk import run_bulk
+
+    results = {}
+    for name, coalesce in (('off', False), ('on', True)):
+        with MockSite24x7(monitors=20, latency_ms=args.latency_ms) as mock:
+            api = client(mock.url, coalesce=coalesce)
+            endpoints = [f'/api/website-monitors/{100000 + i % 5}' for i in range(args.reports)]
+            start = time.perf_counter()
+            for _ in run_bulk(api.get, endpoints, args.concurrency):
+                pass
+            elapsed = time.perf_counter() - start
+            results[name] = {'calls': len(endpoints), 'requests': mock.stats['requests'],
+                             'elapsed_s': round(elapsed, 3)}
+            if api.single_flight is not None:
+                results[name].update(api.single_flight.stats())
+    return results
+
+
+def bench_projection(args) -> Dict[str, Any]:
+    """Peak memory and time decoding a page of large records whole and with --fields"""
+    import tracemalloc
+
+    # Serve from another process so its allocations are not traced
+    server = subprocess.Popen([sys.executable, os.path.join(ROOT, 'benchmarks', 'mock_server.py'),
+                               '--port', '0', '--monitors', str(args.projection_records),
+                               '--config-entries', '50'],
+                              stdout=subprocess.PIPE, text=True)
+    try:
+        url = server.stdout.readline().split()[4]
+        api = client(url)
+        results = {}
+        fields = ['monitor_id', 'display_name', 'status']
+        for name, selected in (('full', None), ('fields', fields)):
+            tracemalloc.start()
+            start = time.perf_counter()
+            records = api.get_records('/api/website-monitors',
+                                      {'limit': args.projection_records}, fields=selected)
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            results[name] = {'records': len(records), 'elapsed_ms': round(elapsed * 1000, 1),
+                             'peak_mb': round(peak / 2 ** 20, 1)}
+            del records
+        return results
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def bench_render(args) -> Dict[str, Any]:
+    """Time to render N rows in each output format"""
+    from site24x7_cli.output import get_sink
+
+    results = {}
+    for rows in args.rows:
+        records = [make_monitor('website-monitors', i) for i in range(rows)]
+        for fmt in args.formats:
+            stream = io.StringIO()
+
+            def render():
+                with get_sink(fmt, stream) as sink:
+                    sink.write_all(records)
+
+            elapsed = timed(render)
+            results[f'{fmt}_{rows}'] = {'elapsed_ms': round(elapsed * 1000, 1),
+                                        'rows_per_s': round(rows / elapsed, 1),
+                                        'bytes': len(stream.getvalue())}
+    return results
+
+
+def bench_cold_start(args) -> Dict[str, Any]:
+    """Wall time of 'site24x7 --help' in a fresh interpreter"""
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get('PYTHONPATH', ''),
+               SITE24X7_NO_DAEMON='1')
+    code = "import sys; from site24x7_cli.daemon import main; sys.argv = ['site24x7', '--help']; main()"
+    samples = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return {'best_ms': round(min(samples), 1), 'median_ms': round(statistics.median(samples), 1),
+            'runs': args.runs}
+
+
+BENCHMARKS = {
+    'list': bench_list,
+    'bulk_create': bench_bulk_create,
+    'aggregate': bench_aggregate,
+    'coalesce': bench_coalesce,
+    'projection': bench_projection,
+    'render': bench_render,
+    'cold_start': bench_cold_start,
+}
+
+
+def flatten(data: Dict[str, Any], prefix: str = '') -> Dict[str, float]:
+    flat = {}
+    for key, value in data.items():
+        name = f'{prefix}{key}'
+        if isinstance(value, dict):
+            flat.update(flatten(value, name + '.'))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = value
+    return flat
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Print metric changes against a baseline run and return the regressions"""
+    old = flatten(baseline.get('results', {}))
+    regressions = []
+    for name, value in flatten(current['results']).items():
+        before = old.get(name)
+        if not before or not name.endswith(HIGHER_IS_BETTER + LOWER_IS_BETTER):
+            continue
+        change = (value - before) / before * 100
+        worse = change < -threshold if name.endswith(HIGHER_IS_BETTER) else change > threshold
+        print(f"{'REGRESSION' if worse else 'ok':>10}  {name:<45} {before:>12} -> {value:<12} "
+              f"({change:+.1f}%)", file=sys.stderr)
+        if worse:
+            regressions.append(name)
+    return regressions
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                              capture_output=True, text=True).stdout.strip()
+    except OSError:
+        return ''
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--only', action='append', choices=list(BENCHMARKS),
+                        help='Benchmark to run (repeatable, default: all)')
+    parser.add_argument('--monitors', type=int, default=5000, help='Monitors listed')
+    parser.add_argument('--creates', type=int, default=1000, help='Monitors bulk-created')
+    parser.add_argument('--reports', type=int, default=500, help='Reports aggregated')
+    parser.add_argument('--projection-records', type=int, default=5000,
+                        help='Records in the page decoded by the projection benchmark')
+    parser.add_argument('--concurrency', type=int, default=8, help='Bulk worker count')
+    parser.add_argument('--async-concurrency', type=int, default=100,
+                        help='In-flight requests for the asyncio engine (needs aiohttp)')
+    parser.add_argument('--latency-ms', type=float, default=20.0, help='Mock server latency')
+    parser.add_argument('--rows', type=int, nargs='+', default=[10000, 100000],
+                        help='Row counts rendered')
+    parser.add_argument('--formats', nargs='+', default=['ndjson', 'json', 'csv', 'table'],
+                        help='Output formats rendered')
+    parser.add_argument('--runs', type=int, default=5, help='Cold start runs')
+    parser.add_argument('--output', help='Write results as JSON to this file')
+    parser.add_argument('--compare', help='Baseline results JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=10.0,
+                        help='Percent change counted as a regression')
+    args = parser.parse_args()
+
+    result = {
+        'commit': git_commit(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'settings': {key: value for key, value in vars(args).items()
+                     if key not in ('only', 'output', 'compare')},
+        'results': {},
+    }
+    for name in args.only or BENCHMARKS:
+        print(f'Running {name}...', file=sys.stderr)
+        result['results'][name] = BENCHMARKS[name](args)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(result, f, indent=2)
+    print(json.dumps(result, indent=2))
+
+    if args.compare:
+        with open(args.compare) as f:
+            return 1 if compare(result, json.load(f), args.threshold) else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -56,7 +56,7 @@ setup(
     python_requires='>=3.8',
     entry_points={
         'console_scripts': [
-            'site24x7=site24x7_cli.main:cli',
+            'site24x7=site24x7_cli.daemon:main',
         ],
     },
     classifiers=[
@@ -110,6 +110,9 @@ setup(
         'yaml': [
             'PyYAML>=6.0',
         ],
+        'async': [
+            'aiohttp>=3.8.0',
+        ],
         'completion': [
             'click-completion>=0.5.2',
         ],
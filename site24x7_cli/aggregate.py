@@ -0,0 +1,163 @@
+"""
+Performance report aggregation for Site24x7 CLI
+
+Time series are loaded into compact array-backed columns (NumPy arrays when
+NumPy is installed, ``array('d')`` otherwise) and summarised per monitor and
+per monitor group.
+"""
+
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+RESPONSE_TIME_KEYS = ('response_time', 'average_response_time', 'value')
+AVAILABILITY_KEYS = ('availability', 'availability_percentage')
+UP_STATUSES = {1, '1', 'up', 'UP'}
+
+PERCENTILES = (50, 95, 99)
+
+
+def extract_points(report: Any) -> Iterable[Tuple[float, Optional[float]]]:
+    """Yield ``(response_time, availability)`` points from a performance report
+
+    Accepts a list of sample objects, ``[timestamp, value]`` pairs, or an
+    object wrapping either under ``data``/``chart_data``/``report``.
+    """
+    if isinstance(report, dict):
+        for key in ('data', 'chart_data', 'report'):
+            if key in report:
+                yield from extract_points(report[key])
+                return
+        report = [report]
+
+    for sample in report or []:
+        if isinstance(sample, (list, tuple)) and len(sample) >= 2:
+            try:
+                yield float(sample[1]), None
+            except (TypeError, ValueError):
+                continue
+            continue
+        if not isinstance(sample, dict):
+            continue
+
+        value = next((sample[key] for key in RESPONSE_TIME_KEYS if sample.get(key) is not None), None)
+        if value is None:
+            continue
+        availability = next((sample[key] for key in AVAILABILITY_KEYS
+                             if sample.get(key) is not None), None)
+        if availability is None and 'status' in sample:
+            availability = 100.0 if sample['status'] in UP_STATUSES else 0.0
+        try:
+            yield float(value), None if availability is None else float(availability)
+        except (TypeError, ValueError):
+            continue
+
+
+class SeriesColumns:
+    """Response time and availability columns for one monitor"""
+
+    __slots__ = ('response_times', 'availability')
+
+    def __init__(self):
+        self.response_times = array('d')
+        self.availability = array('d')
+
+    def extend(self, points: Iterable[Tuple[float, Optional[float]]]) -> None:
+        for value, availability in points:
+            self.response_times.append(value)
+            if availability is not None:
+                self.availability.append(availability)
+
+
+def summarise(values, availability) -> Dict[str, Any]:
+    """Compute count, mean, min/max, percentiles and availability of a column"""
+    count = len(values)
+    summary: Dict[str, Any] = {'samples': count}
+    if count == 0:
+        summary.update({'mean': None, 'min': None, 'max': None})
+        summary.update({f'p{pct}': None for pct in PERCENTILES})
+    elif np is not None:
+        column = np.frombuffer(values, dtype=np.float64) if isinstance(values, array) else values
+        summary.update({'mean': float(column.mean()), 'min': float(column.min()),
+                        'max': float(column.max())})
+        for pct, value in zip(PERCENTILES, _np_percentiles(column)):
+            summary[f'p{pct}'] = float(value)
+    else:
+        ordered = sorted(values)
+        summary.update({'mean': sum(ordered) / count, 'min': ordered[0], 'max': ordered[-1]})
+        for pct in PERCENTILES:
+            summary[f'p{pct}'] = ordered[min(max(-(-pct * count // 100) - 1, 0), count - 1)]
+
+    summary['availability'] = (round(sum(availability) / len(availability), 3)
+                               if len(availability) else None)
+    for key in ('mean', 'min', 'max') + tuple(f'p{pct}' for pct in PERCENTILES):
+        if summary[key] is not None:
+            summary[key] = round(summary[key], 3)
+    return summary
+
+
+def _np_percentiles(column) -> Any:
+    """Nearest-rank percentiles of a NumPy column"""
+    try:
+        return np.percentile(column, PERCENTILES, method='inverted_cdf')
+    except TypeError:
+        # NumPy < 1.22 names the keyword 'interpolation'
+        return np.percentile(column, PERCENTILES, interpolation='lower')
+
+
+class ReportAggregator:
+    """Accumulate per-monitor columns and summarise monitors and groups"""
+
+    def __init__(self):
+        self.columns: Dict[str, SeriesColumns] = {}
+        self.names: Dict[str, str] = {}
+        self.groups: Dict[str, str] = {}
+
+    def add(self, monitor_id: str, report: Any, name: Optional[str] = None,
+            group_id: Optional[str] = None) -> None:
+        """Load one monitor's report into its columns"""
+        columns = self.columns.setdefault(monitor_id, SeriesColumns())
+        columns.extend(extract_points(report))
+        if name:
+            self.names[monitor_id] = name
+        if group_id:
+            self.groups[monitor_id] = group_id
+
+    def monitor_rows(self) -> List[Dict[str, Any]]:
+        rows = []
+        for monitor_id, columns in self.columns.items():
+            row = {'scope': 'monitor', 'id': monitor_id, 'name': self.names.get(monitor_id, ''),
+                   'group_id': self.groups.get(monitor_id, '')}
+            row.update(summarise(columns.response_times, columns.availability))
+            rows.append(row)
+        return rows
+
+    def group_rows(self) -> List[Dict[str, Any]]:
+        members: Dict[str, List[SeriesColumns]] = {}
+        for monitor_id, group_id in self.groups.items():
+            members.setdefault(group_id, []).append(self.columns[monitor_id])
+
+        rows = []
+        for group_id, group_columns in members.items():
+            if np is not None:
+                values = np.concatenate([np.frombuffer(c.response_times, dtype=np.float64)
+                                         for c in group_columns])
+            else:
+                values = array('d')
+                for c in group_columns:
+                    values.extend(c.response_times)
+            availability = array('d')
+            for c in group_columns:
+                availability.extend(c.availability)
+            row = {'scope': 'group', 'id': group_id, 'name': '', 'group_id': group_id}
+            row.update(summarise(values, availability))
+            rows.append(row)
+        return rows
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Summary rows for every monitor followed by every group"""
+        return self.monitor_rows() + self.group_rows()
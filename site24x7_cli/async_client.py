@@ -0,0 +1,248 @@
+"""
+Asyncio client for Site24x7 API fan-out
+
+``AsyncSite24x7Client`` mirrors the ``get/post/put/delete`` surface of
+``Site24x7Client`` on aiohttp, with one shared connection pool and a
+semaphore bounding the requests in flight, so a single thread can keep
+hundreds of requests open at once. aiohttp is optional:
+
+    pip install 'site24x7-cli[async]'
+"""
+
+import asyncio
+import os
+import queue
+import threading
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, Optional
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from site24x7_cli.bulk import BulkResult
+from site24x7_cli.config import Config
+from site24x7_cli.ratelimit import TokenBucket
+from site24x7_cli.retry import RetryPolicy
+from site24x7_cli.transport import TransportConfig
+
+INSTALL_HINT = "The async engine requires aiohttp. Install with: pip install 'site24x7-cli[async]'"
+
+DEFAULT_CONCURRENCY = 100
+
+
+class _ResponseInfo:
+    """The parts of a response that RetryPolicy inspects"""
+
+    __slots__ = ('status_code', 'headers')
+
+    def __init__(self, status_code: int, headers: Any):
+        self.status_code = status_code
+        self.headers = headers
+
+
+class AsyncSite24x7Client:
+    """Asyncio client for Site24x7 API interactions
+
+    Use as an async context manager; the connection pool is opened on entry
+    and closed on exit.
+    """
+
+    def __init__(self, oauth_token: Optional[str] = None, max_retries: Optional[int] = None,
+                 rate_limit: Optional[float] = None, transport: Optional[TransportConfig] = None,
+                 concurrency: int = DEFAULT_CONCURRENCY):
+        if aiohttp is None:
+            raise ImportError(INSTALL_HINT)
+        self.oauth_token = oauth_token or os.getenv('SITE24X7_OAUTH_TOKEN')
+        self.base_url = Config.get_base_url().rstrip('/')
+        self.transport = transport or TransportConfig.from_config()
+        self.retry_policy = RetryPolicy(
+            Config.get_max_retries() if max_retries is None else max_retries)
+        self.rate_limiter = TokenBucket(
+            Config.get_rate_limit() if rate_limit is None else rate_limit)
+        self.concurrency = max(concurrency, 1)
+        self.semaphore: Optional[asyncio.Semaphore] = None
+        self.session: Optional['aiohttp.ClientSession'] = None
+
+    async def __aenter__(self) -> 'AsyncSite24x7Client':
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def open(self) -> None:
+        """Create the connection pool (sized to the concurrency limit)"""
+        headers = dict(self.transport.headers, **{
+            'Accept': 'application/json; version=2.0',
+            'Content-Type': 'application/json;charset=UTF-8',
+        })
+        if self.oauth_token:
+            headers['Authorization'] = f'Zoho-oauthtoken {self.oauth_token}'
+        connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.concurrency)
+        timeout = aiohttp.ClientTimeout(sock_connect=self.transport.connect_timeout or None,
+                                        sock_read=self.transport.read_timeout or None)
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        self.session = aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers)
+
+    async def close(self) -> None:
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """Make API request with retries, returning the decoded JSON body"""
+        if self.session is None:
+            raise RuntimeError('AsyncSite24x7Client must be opened (use "async with") first')
+        url = f"{self.base_url}{endpoint}"
+        attempt = 0
+
+        while True:
+            wait = self.rate_limiter.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                async with self.semaphore:
+                    async with self.session.request(method, url, **kwargs) as response:
+                        info = _ResponseInfo(response.status, response.headers)
+                        if not self.retry_policy.should_retry(method, attempt, response=info):
+                            response.raise_for_status()
+                            return await response.json(content_type=None)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if not self._retry_error(method, attempt, e):
+                    raise
+                await asyncio.sleep(self.retry_policy.delay(attempt))
+                attempt += 1
+                continue
+
+            delay = self.retry_policy.delay(attempt, info)
+            if info.status_code == 429:
+                # Hold back every request sharing this client, not just this one
+                self.rate_limiter.pause(delay)
+            else:
+                await asyncio.sleep(delay)
+            attempt += 1
+
+    def _retry_error(self, method: str, attempt: int, error: Exception) -> bool:
+        if attempt >= self.retry_policy.max_retries:
+            return False
+        if isinstance(error, aiohttp.ClientConnectorError):
+            # The request never reached the server
+            return True
+        return method.upper() in self.retry_policy.IDEMPOTENT_METHODS
+
+    async def get(self, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """GET request"""
+        return await self.request('GET', endpoint, **kwargs)
+
+    async def post(self, endpoint: str, data: Dict[str, Any] = None, **kwargs) -> Dict[str, Any]:
+        """POST request"""
+        return await self.request('POST', endpoint, json=data, **kwargs)
+
+    async def put(self, endpoint: str, data: Dict[str, Any] = None, **kwargs) -> Dict[str, Any]:
+        """PUT request"""
+        return await self.request('PUT', endpoint, json=data, **kwargs)
+
+    async def delete(self, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """DELETE request"""
+        return await self.request('DELETE', endpoint, **kwargs)
+
+    async def map(self, func: Callable[['AsyncSite24x7Client', Any], Awaitable[Any]],
+                  items: Iterable[Any]) -> AsyncIterator[BulkResult]:
+        """Apply ``func(client, item)`` to every item, yielding results as they complete
+
+        Items are pulled lazily, keeping at most twice the concurrency limit
+        of tasks alive.
+        """
+        async def call(index: int, item: Any) -> BulkResult:
+            started = time.monotonic()
+            try:
+                return BulkResult(index, item, result=await func(self, item),
+                                  latency=time.monotonic() - started)
+            except Exception as e:
+                return BulkResult(index, item, error=e, latency=time.monotonic() - started)
+
+        pending = set()
+        try:
+            for index, item in enumerate(items, 1):
+                pending.add(asyncio.ensure_future(call(index, item)))
+                if len(pending) >= self.concurrency * 2:
+                    finished, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in finished:
+                        yield task.result()
+        except (GeneratorExit, asyncio.CancelledError):
+            raise
+        except BaseException:
+            # Report what is in flight before the input error, as run_bulk does
+            for task in asyncio.as_completed(pending):
+                yield await task
+            raise
+        for task in asyncio.as_completed(pending):
+            yield await task
+
+
+def run_bulk_async(func: Callable[[AsyncSite24x7Client, Any], Awaitable[Any]], items: Iterable[Any],
+                   concurrency: int = DEFAULT_CONCURRENCY, **client_options) -> Iterator[BulkResult]:
+    """Synchronous counterpart of ``run_bulk`` driving ``func`` on an event loop
+
+    The loop runs on a background thread and results are yielded as they
+    complete, so callers written against ``run_bulk`` can switch engines.
+    At most ``2 * concurrency`` results wait for the consumer; the loop
+    awaits a free slot instead of blocking on a full queue. Closing the
+    generator early cancels the outstanding requests.
+    """
+    if aiohttp is None:
+        raise ImportError(INSTALL_HINT)
+    results: "queue.Queue" = queue.Queue()
+    done = object()
+    control: Dict[str, Any] = {}
+    ready = threading.Event()
+
+    async def drive() -> None:
+        slots = asyncio.Semaphore(concurrency * 2)
+        control.update(loop=asyncio.get_running_loop(), task=asyncio.current_task(), slots=slots)
+        ready.set()
+        async with AsyncSite24x7Client(concurrency=concurrency, **client_options) as client:
+            async for result in client.map(func, items):
+                # Applies backpressure when the consumer falls behind
+                await slots.acquire()
+                results.put_nowait(result)
+
+    def run() -> None:
+        try:
+            asyncio.run(drive())
+        except asyncio.CancelledError:
+            pass
+        except BaseException as e:
+            results.put(e)
+        finally:
+            ready.set()
+            results.put(done)
+
+    def call_in_loop(callback: Callable[[], Any]) -> None:
+        try:
+            control['loop'].call_soon_threadsafe(callback)
+        except (KeyError, RuntimeError):
+            # The loop never started or has already finished
+            pass
+
+    thread = threading.Thread(target=run, name='site24x7-async', daemon=True)
+    thread.start()
+    finished = False
+    try:
+        while True:
+            result = results.get()
+            if result is done:
+                finished = True
+                return
+            if isinstance(result, BaseException):
+                finished = True
+                raise result
+            call_in_loop(control['slots'].release)
+            yield result
+    finally:
+        if not finished:
+            ready.wait()
+            call_in_loop(lambda: control['task'].cancel())
+        thread.join()
@@ -4,51 +4,129 @@ Authentication module for Site24x7 CLI
 
 import os
 import json
-from typing import Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 import click
-from rich.console import Console
 
-console = Console()
+from site24x7_cli.config import Config
+
+# Name of the token stored at the top level of the credentials file
+DEFAULT_PROFILE = Config.DEFAULT_PROFILE
 
 class AuthManager:
-    """Manage authentication credentials"""
+    """Manage authentication credentials
+    
+    The credentials file keeps the default token at the top level and named
+    profiles (one per account) under ``profiles``.
+    """
     
     CONFIG_FILE = os.path.expanduser('~/.site24x7/credentials.json')
     
+    # (mtime, contents) of the last parse, so long-lived processes skip re-reading
+    _loaded: Optional[Tuple[float, Dict[str, Any]]] = None
+    
+    @classmethod
+    def _read(cls) -> Dict[str, Any]:
+        """Parse the credentials file (empty when it does not exist)"""
+        if not os.path.exists(cls.CONFIG_FILE):
+            return {}
+        mtime = os.path.getmtime(cls.CONFIG_FILE)
+        if cls._loaded and cls._loaded[0] == mtime:
+            return cls._loaded[1]
+        with open(cls.CONFIG_FILE, 'r') as f:
+            config = json.load(f)
+        cls._loaded = (mtime, config)
+        return config
+    
+    @classmethod
+    def _write(cls, config: Dict[str, Any]) -> None:
+        """Write the credentials file, readable by its owner only"""
+        os.makedirs(os.path.dirname(cls.CONFIG_FILE), mode=0o700, exist_ok=True)
+        fd = os.open(cls.CONFIG_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(config, f, indent=2)
+        # The mode above only applies on creation; tighten files written before
+        os.chmod(cls.CONFIG_FILE, 0o600)
+        cls._loaded = None
+    
     @classmethod
-    def save_credentials(cls, oauth_token: str) -> None:
-        """Save OAuth token to config file"""
-        os.makedirs(os.path.dirname(cls.CONFIG_FILE), exist_ok=True)
+    def save_credentials(cls, oauth_token: str, profile: Optional[str] = None) -> None:
+        """Save OAuth token to config file, as the default or a named profile"""
+        try:
+            config = dict(cls._read())
+        except ValueError:
+            config = {}
         
-        config = {
+        entry = {
             'oauth_token': oauth_token,
             'saved_at': str(datetime.utcnow())
         }
+        if profile in (None, DEFAULT_PROFILE):
+            config.update(entry)
+        else:
+            Config.validate_profile(profile)
+            config['profiles'] = dict(config.get('profiles') or {}, **{profile: entry})
         
-        with open(cls.CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=2)
+        cls._write(config)
         
-        console.print("[green]Credentials saved successfully[/green]")
+        click.echo(click.style('Credentials saved successfully', fg='green'))
     
     @classmethod
-    def load_credentials(cls) -> Optional[str]:
-        """Load OAuth token from config file"""
-        if os.path.exists(cls.CONFIG_FILE):
-            try:
-                with open(cls.CONFIG_FILE, 'r') as f:
-                    config = json.load(f)
-                    return config.get('oauth_token')
-            except Exception as e:
-                console.print(f"[red]Error loading credentials: {e}[/red]")
+    def load_credentials(cls, profile: Optional[str] = None) -> Optional[str]:
+        """Load the OAuth token of the default or a named profile from config file"""
+        try:
+            config = cls._read()
+        except Exception as e:
+            click.echo(click.style(f'Error loading credentials: {e}', fg='red'), err=True)
+            return None
         
-        return None
+        if profile in (None, DEFAULT_PROFILE):
+            return config.get('oauth_token')
+        return ((config.get('profiles') or {}).get(profile) or {}).get('oauth_token')
+    
+    @classmethod
+    def list_profiles(cls) -> List[str]:
+        """Names of every configured profile, the default first"""
+        try:
+            config = cls._read()
+        except Exception:
+            return []
+        names = [DEFAULT_PROFILE] if config.get('oauth_token') else []
+        return names + sorted(config.get('profiles') or {})
     
     @classmethod
-    def clear_credentials(cls) -> None:
-        """Clear saved credentials"""
-        if os.path.exists(cls.CONFIG_FILE):
+    def clear_credentials(cls, profile: Optional[str] = None) -> None:
+        """Clear the saved credentials of the default or a named profile
+        
+        Other profiles are kept; the file is removed once none remain.
+        """
+        try:
+            config = dict(cls._read())
+        except ValueError:
+            config = {}
+        
+        if profile in (None, DEFAULT_PROFILE):
+            name = DEFAULT_PROFILE
+            found = config.pop('oauth_token', None) is not None
+            config.pop('saved_at', None)
+        else:
+            name = profile
+            profiles = dict(config.get('profiles') or {})
+            found = profiles.pop(profile, None) is not None
+            if profiles:
+                config['profiles'] = profiles
+            else:
+                config.pop('profiles', None)
+        
+        if not found:
+            click.echo(f"Profile '{name}' is not configured")
+            return
+        if config:
+            cls._write(config)
+        elif os.path.exists(cls.CONFIG_FILE):
             os.remove(cls.CONFIG_FILE)
-            console.print("[green]Credentials cleared[/green]")
+            cls._loaded = None
+        click.echo(click.style(f"Profile '{name}' cleared", fg='green'))
 
 @click.command()
 @click.option('--token', required=True, help='Site24x7 OAuth token')
@@ -2,26 +2,104 @@
 Base classes for Site24x7 CLI
 """
 
+import contextvars
 import json
 import os
-from typing import Dict, Any, Optional
+import queue
+import threading
+import time
+from typing import Dict, Any, Iterable, Iterator, List, Optional
 import click
 import requests
 from rich.console import Console
-from rich.table import Table
+
+from site24x7_cli.bulk import (BulkResult, BulkStats, in_order, match_name, print_result,
+                               print_summary, read_ids, record_id, run_bulk)
+from site24x7_cli.cache import ResponseCache, cache_scope
+from site24x7_cli.config import Config
+from site24x7_cli.exceptions import ValidationError
+from site24x7_cli.jsonstream import CHUNK_SIZE, iter_records, parse_fields, project
+from site24x7_cli.output import get_sink
+from site24x7_cli.profiling import PHASES, Profiler, connection_phases, get_profiler, span
+from site24x7_cli.ratelimit import TokenBucket
+from site24x7_cli.retry import RetryPolicy
+from site24x7_cli.singleflight import SingleFlight
+from site24x7_cli.transport import TransportConfig
+from site24x7_cli.utils import validate_monitor_id
 
 console = Console()
 
+# One warmed session per OAuth token and transport, shared by every client once enabled
+_shared_sessions: Optional[Dict[tuple, requests.Session]] = None
+_shared_sessions_lock = threading.Lock()
+_shared_clients: Optional[Dict[tuple, 'Site24x7Client']] = None
+_shared_clients_lock = threading.Lock()
+
+
+def share_sessions() -> None:
+    """Make every client in this process reuse one session (and its connections) per token"""
+    global _shared_sessions
+    with _shared_sessions_lock:
+        if _shared_sessions is None:
+            _shared_sessions = {}
+
+
+def _new_session(transport: TransportConfig) -> requests.Session:
+    session = requests.Session()
+    transport.mount(session)
+    return session
+
+
+def _session_for(oauth_token: Optional[str], transport: TransportConfig) -> requests.Session:
+    if _shared_sessions is None:
+        return _new_session(transport)
+    key = (oauth_token, transport.key())
+    with _shared_sessions_lock:
+        session = _shared_sessions.get(key)
+        if session is None:
+            session = _shared_sessions[key] = _new_session(transport)
+        return session
+
+
+def share_clients() -> None:
+    """Make every command in this process reuse one client per set of client options
+
+    Shared clients also share their rate limiter and response cache, so
+    commands running in parallel respect ``--rate-limit`` together.
+    """
+    global _shared_clients
+    share_sessions()
+    with _shared_clients_lock:
+        if _shared_clients is None:
+            _shared_clients = {}
+
+
 class Site24x7Client:
     """Base client for Site24x7 API interactions"""
     
-    def __init__(self, oauth_token: str = None):
+    def __init__(self, oauth_token: str = None, max_retries: Optional[int] = None,
+                 rate_limit: Optional[float] = None, cache: Optional[ResponseCache] = None,
+                 refresh: bool = False, transport: Optional[TransportConfig] = None,
+                 coalesce: Optional[bool] = None):
         self.oauth_token = oauth_token or os.getenv('SITE24X7_OAUTH_TOKEN')
-        self.base_url = 'https://www.site24x7.com/api'
-        self.session = requests.Session()
-        
+        self.base_url = Config.get_base_url().rstrip('/')
+        self.transport = transport or TransportConfig.from_config()
+        self.session = _session_for(self.oauth_token, self.transport)
+        self.pool_lock = threading.Lock()
+        self.retry_policy = RetryPolicy(
+            Config.get_max_retries() if max_retries is None else max_retries)
+        self.rate_limiter = TokenBucket(
+            Config.get_rate_limit() if rate_limit is None else rate_limit)
+        self.cache = cache
+        self.refresh = refresh
+        if coalesce is None:
+            coalesce = Config.get_coalesce_enabled()
+        self.single_flight = SingleFlight() if coalesce else None
+        self._authorize(self.session)
+    
+    def _authorize(self, session: requests.Session) -> None:
         if self.oauth_token:
-            self.session.headers.update({
+            session.headers.update({
                 'Authorization': f'Zoho-oauthtoken {self.oauth_token}',
                 'Accept': 'application/json; version=2.0',
                 'Content-Type': 'application/json;charset=UTF-8'
@@ -29,19 +107,167 @@ class Site24x7Client:
     
     def request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
         """Make API request"""
+        return self.send(method, endpoint, **kwargs).json()
+    
+    def size_pool(self, workers: int) -> None:
+        """Keep enough pooled connections open for ``workers`` concurrent requests
+        
+        A shared session is keyed by its transport, pool size included, so the
+        client moves to the shared session of the larger pool rather than
+        resizing one that other clients use. A private session has its old
+        adapter closed and the larger one mounted.
+        """
+        with self.pool_lock:
+            if workers <= self.transport.pool_maxsize:
+                return
+            transport = self.transport.replace(pool_maxsize=workers)
+            if _shared_sessions is not None:
+                self.session = _session_for(self.oauth_token, transport)
+                self._authorize(self.session)
+            else:
+                for adapter in set(self.session.adapters.values()):
+                    adapter.close()
+                transport.mount(self.session)
+            self.transport = transport
+    
+    def send(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        """Send an API request with retries, returning the successful response"""
         url = f"{self.base_url}{endpoint}"
+        kwargs.setdefault('timeout', self.transport.timeout)
+        attempt = 0
+        profiler = get_profiler()
+        
+        while True:
+            self.rate_limiter.acquire()
+            try:
+                if profiler is None:
+                    response = self.session.request(method, url, **kwargs)
+                else:
+                    response = self._send_profiled(profiler, method, endpoint, attempt, **kwargs)
+            except requests.exceptions.RequestException as e:
+                if not self.retry_policy.should_retry(method, attempt, error=e):
+                    console.print(f"[red]API Error: {e}[/red]")
+                    raise
+                time.sleep(self.retry_policy.delay(attempt))
+                attempt += 1
+                continue
+            
+            if self.retry_policy.should_retry(method, attempt, response=response):
+                delay = self.retry_policy.delay(attempt, response)
+                if response.status_code == 429:
+                    # Hold back every thread sharing this client, not just this one
+                    self.rate_limiter.pause(delay)
+                else:
+                    time.sleep(delay)
+                attempt += 1
+                continue
+            
+            try:
+                response.raise_for_status()
+                return response
+            except requests.exceptions.RequestException as e:
+                console.print(f"[red]API Error: {e}[/red]")
+                raise
+    
+    def _send_profiled(self, profiler: Profiler, method: str, endpoint: str, attempt: int,
+                       **kwargs) -> requests.Response:
+        """Send one attempt, recording its connection, server and body-read phases
         
+        A streamed response is handed back unread; its body phase and size are
+        recorded once the caller has finished iterating over it.
+        """
+        args: Dict[str, Any] = {'method': method, 'endpoint': endpoint, 'attempt': attempt}
+        start = time.perf_counter()
         try:
-            response = self.session.request(method, url, **kwargs)
-            response.raise_for_status()
-            return response.json()
+            with connection_phases() as phases:
+                response = self.session.request(method, f"{self.base_url}{endpoint}",
+                                                **dict(kwargs, stream=True))
         except requests.exceptions.RequestException as e:
-            console.print(f"[red]API Error: {e}[/red]")
+            args['error'] = str(e)
+            profiler.record(f"{method} {endpoint}", 'http', start, time.perf_counter(), **args)
             raise
+        headers_at = time.perf_counter()
+        
+        sent = response.request.body or b''
+        phases['server'] = max(headers_at - start - sum(phases.values()), 0.0)
+        args.update({'status': response.status_code,
+                     'bytes_out': len(sent.encode('utf-8') if isinstance(sent, str) else sent)})
+        
+        def finish(received: int) -> None:
+            end = time.perf_counter()
+            phases['body'] = end - headers_at
+            args['bytes_in'] = received
+            args.update({f'{name}_ms': round(seconds * 1000, 3) for name, seconds in phases.items()})
+            profiler.record(f"{method} {endpoint}", 'http', start, end, **args)
+            
+            # Lay the phases out back to back so they nest under the request in the trace
+            cursor = start
+            for name in PHASES:
+                if phases[name]:
+                    profiler.record(name, 'phase', cursor, cursor + phases[name])
+                    cursor += phases[name]
+        
+        if not kwargs.get('stream') or response.status_code >= 400:
+            try:
+                body = response.content
+            except requests.exceptions.RequestException as e:
+                args['error'] = str(e)
+                profiler.record(f"{method} {endpoint}", 'http', start, time.perf_counter(), **args)
+                raise
+            finish(len(body))
+            return response
+        
+        # response.content reads through iter_content too, so this counts either way
+        iter_content = response.iter_content
+        finished = []
+        
+        def counted(*iter_args, **iter_kwargs) -> Iterator[bytes]:
+            received = 0
+            try:
+                for chunk in iter_content(*iter_args, **iter_kwargs):
+                    received += len(chunk)
+                    yield chunk
+            finally:
+                if not finished:
+                    finished.append(True)
+                    finish(received)
+        
+        response.iter_content = counted
+        return response
     
     def get(self, endpoint: str, **kwargs) -> Dict[str, Any]:
-        """GET request"""
-        return self.request('GET', endpoint, **kwargs)
+        """GET request, shared with identical in-flight GETs when coalescing is on"""
+        if self.single_flight is None:
+            return self._get(endpoint, **kwargs)
+        
+        key = json.dumps([endpoint, kwargs], sort_keys=True, default=str)
+        started = time.perf_counter()
+        data, shared = self.single_flight.do(key, lambda: self._get(endpoint, **kwargs))
+        profiler = get_profiler()
+        if shared and profiler is not None:
+            profiler.record('coalesced', 'coalesced', started, time.perf_counter(), endpoint=endpoint)
+        return data
+    
+    def _get(self, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """GET request, served from the response cache when one is enabled"""
+        if self.cache is None:
+            return self.request('GET', endpoint, **kwargs)
+        
+        params = kwargs.get('params')
+        entry = None if self.refresh else self.cache.lookup(endpoint, params)
+        if entry and self.cache.is_fresh(entry):
+            return entry['data']
+        
+        kwargs['headers'] = dict(self.cache.validators(entry), **kwargs.get('headers', {}))
+        response = self.send('GET', endpoint, **kwargs)
+        if response.status_code == 304 and entry:
+            self.cache.refresh(entry)
+            return entry['data']
+        
+        data = response.json()
+        self.cache.store(endpoint, params, data, response.headers.get('ETag'),
+                         response.headers.get('Last-Modified'))
+        return data
     
     def post(self, endpoint: str, data: Dict[str, Any] = None, **kwargs) -> Dict[str, Any]:
         """POST request"""
@@ -54,36 +280,316 @@ class Site24x7Client:
     def delete(self, endpoint: str, **kwargs) -> Dict[str, Any]:
         """DELETE request"""
         return self.request('DELETE', endpoint, **kwargs)
+    
+    def get_records(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                    key: Optional[str] = None,
+                    fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """GET a list endpoint and return its records, keeping only ``fields`` if given
+        
+        With a field list the body is decoded incrementally as it streams in,
+        so the full payload is never held in memory; cached responses are
+        stored whole and projected afterwards.
+        """
+        if not fields:
+            return extract_records(self.get(endpoint, params=params), key)
+        if self.cache is not None:
+            return [project(record, fields)
+                    for record in extract_records(self.get(endpoint, params=params), key)]
+        
+        response = self.send('GET', endpoint, params=params, stream=True)
+        try:
+            return list(iter_records(response.iter_content(CHUNK_SIZE), key, fields))
+        finally:
+            response.close()
+    
+    def iter_pages(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                   page_size: int = 50, offset: int = 0, prefetch: int = 2,
+                   key: Optional[str] = None,
+                   fields: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+        """Yield every record of a paginated endpoint, one page at a time
+        
+        Pages are fetched on a background thread up to ``prefetch`` pages ahead
+        of the consumer, so at most ``prefetch + 1`` pages are held in memory.
+        With ``fields``, records are projected as each page is decoded.
+        """
+        if page_size < 1:
+            raise ValidationError(f"Page size must be at least 1, got {page_size}")
+        pages: "queue.Queue" = queue.Queue(maxsize=max(prefetch, 1))
+        stop = threading.Event()
+        done = object()
+        
+        def put(item: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def fetch() -> None:
+            page_offset = offset
+            try:
+                while not stop.is_set():
+                    page_params = dict(params or {}, limit=page_size, offset=page_offset)
+                    records = self.get_records(endpoint, page_params, key, fields)
+                    if records and not put(records):
+                        return
+                    if len(records) < page_size:
+                        break
+                    page_offset += page_size
+            except Exception as e:
+                put(e)
+                return
+            put(done)
+        
+        worker = threading.Thread(target=contextvars.copy_context().run, args=(fetch,),
+                                  name='site24x7-prefetch', daemon=True)
+        worker.start()
+        try:
+            while True:
+                page = pages.get()
+                if page is done:
+                    return
+                if isinstance(page, Exception):
+                    raise page
+                yield from page
+        finally:
+            stop.set()
+
+def extract_records(response: Dict[str, Any], key: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Pull the record list out of a list response"""
+    if 'data' in response:
+        return response['data']
+    return response.get(key, []) if key else []
+
 
 class BaseCommand:
     """Base class for all CLI commands"""
     
     def __init__(self):
-        self.client = Site24x7Client()
+        self.client = self._client_for(self._client_options())
+        self.fields = self._output_fields()
+        self.profile = self._active_profile()
+        self.fetch_stats: Optional[BulkStats] = None
+        profiler = get_profiler()
+        if profiler is not None and self.client.single_flight is not None:
+            # --timings reports how many GETs were coalesced
+            profiler.track('single-flight', self.client.single_flight)
+    
+    @staticmethod
+    def _client_for(options: Dict[str, Any]) -> Site24x7Client:
+        if _shared_clients is None:
+            return Site24x7Client(**options)
+        key = tuple(options[name] is not None if name == 'cache' else options[name]
+                    for name in sorted(options))
+        with _shared_clients_lock:
+            client = _shared_clients.get(key)
+            if client is None:
+                client = _shared_clients[key] = Site24x7Client(**options)
+            return client
+    
+    @staticmethod
+    def _client_options() -> Dict[str, Any]:
+        """Collect client settings from the global CLI options"""
+        ctx = click.get_current_context(silent=True)
+        obj = (ctx.find_root().obj if ctx else None) or {}
+        cache = None
+        if obj.get('cache', Config.get_cache_enabled()):
+            token = obj.get('oauth_token') or os.getenv('SITE24X7_OAUTH_TOKEN')
+            cache = ResponseCache(Config.get_cache_dir(), Config.get_cache_max_bytes(),
+                                  ttls=Config.get_cache_ttls(),
+                                  scope=cache_scope(Config.get_base_url(), token))
+        return {
+            'oauth_token': obj.get('oauth_token'),
+            'max_retries': obj.get('max_retries'),
+            'rate_limit': obj.get('rate_limit'),
+            'cache': cache,
+            'refresh': bool(obj.get('refresh')),
+            'coalesce': obj.get('coalesce'),
+            'transport': TransportConfig.from_config(
+                pool_connections=obj.get('pool_connections'), pool_maxsize=obj.get('pool_maxsize'),
+                connect_timeout=obj.get('connect_timeout'), read_timeout=obj.get('read_timeout'),
+                compression=obj.get('compression'), keepalive=obj.get('keepalive')),
+        }
+    
+    @staticmethod
+    def _output_fields() -> Optional[List[str]]:
+        """The fields selected with the global --fields option, if any"""
+        ctx = click.get_current_context(silent=True)
+        obj = (ctx.find_root().obj if ctx else None) or {}
+        return parse_fields(obj.get('fields'))
+    
+    @staticmethod
+    def _active_profile() -> Optional[str]:
+        """The credentials profile selected with --account, if any"""
+        ctx = click.get_current_context(silent=True)
+        obj = (ctx.find_root().obj if ctx else None) or {}
+        return obj.get('profile')
+    
+    def fetch_fields(self, query: Optional[Any] = None) -> Optional[List[str]]:
+        """Fields to decode from list responses: the output fields plus any ``query`` reads"""
+        if self.fields is None:
+            return None
+        return list(dict.fromkeys(self.fields + (query.fields if query else [])))
+    
+    def async_client_options(self) -> Dict[str, Any]:
+        """Client settings for AsyncSite24x7Client (which does not cache responses)"""
+        options = self._client_options()
+        return {key: options[key] for key in ('oauth_token', 'max_retries', 'rate_limit', 'transport')}
     
     def format_output(self, data: Any, output_format: str = 'table') -> None:
-        """Format and display output"""
-        if output_format == 'json':
-            console.print_json(json.dumps(data, indent=2))
-        elif output_format == 'table' and isinstance(data, list):
-            self._display_table(data)
-        else:
-            console.print(data)
-    
-    def _display_table(self, data: List[Dict[str, Any]]) -> None:
-        """Display data as a rich table"""
-        if not data:
-            console.print("[yellow]No data to display[/yellow]")
-            return
-        
-        table = Table()
-        
-        # Add columns from first item keys
-        for key in data[0].keys():
-            table.add_column(key.replace('_', ' ').title())
-        
-        # Add rows
-        for item in data:
-            table.add_row(*[str(value) for value in item.values()])
-        
-        console.print(table)
+        """Format and display output, streaming lists and iterators record by record"""
+        if self.fields:
+            data = self._project(data)
+        with span('render', 'render', format=output_format) as args, get_sink(output_format) as sink:
+            if isinstance(data, (list, Iterator)):
+                sink.write_all(data)
+                args['records'] = sink.count
+            else:
+                sink.write_document(data)
+    
+    def _project(self, data: Any) -> Any:
+        fields = self.fields
+        if isinstance(data, list):
+            return [project(record, fields) for record in data]
+        if isinstance(data, Iterator):
+            return (project(record, fields) for record in data)
+        if isinstance(data, dict) and any(field.split('.')[0] in data for field in fields):
+            return project(data, fields)
+        # Not a record (e.g. a summary); show it whole
+        return data
+    
+    def select_ids(self, endpoint: str, key: str, status: Optional[str] = None,
+                   group_id: Optional[str] = None, name_pattern: Optional[str] = None,
+                   ids_file: Optional[Any] = None, force: bool = False) -> List[str]:
+        """Resolve bulk operation targets from an ID file or list filters"""
+        if ids_file is not None:
+            if status or group_id or name_pattern:
+                raise ValidationError('--ids-file cannot be combined with --status, '
+                                      '--group-id or --name-pattern')
+            if getattr(ids_file, 'name', None) == '<stdin>' and not force:
+                # The confirmation prompt would read from the ID list
+                raise ValidationError('--force is required when reading IDs from stdin')
+            ids = read_ids(ids_file)
+            invalid = [id for id in ids if not validate_monitor_id(id)]
+            if invalid:
+                raise ValidationError(f"Invalid ID format in --ids-file: {', '.join(invalid[:5])}"
+                                      + (f" and {len(invalid) - 5} more" if len(invalid) > 5 else ''))
+            return ids
+        if not (status or group_id or name_pattern):
+            raise ValidationError('Specify --status, --group-id, --name-pattern or --ids-file')
+        
+        params = {}
+        if status:
+            params['status'] = status
+        if group_id:
+            params['group_id'] = group_id
+        
+        ids = []
+        for record in self.client.iter_pages(endpoint, params, page_size=200, key=key):
+            if match_name(record, name_pattern):
+                ids.append(record_id(record))
+        return [id for id in ids if id]
+    
+    def collect_ids(self, ids: Iterable[str], ids_file: Optional[Any] = None) -> List[str]:
+        """IDs given as arguments ('-' alone reads them from stdin) plus those in ``ids_file``"""
+        collected = list(ids)
+        if collected == ['-']:
+            collected = read_ids(click.get_text_stream('stdin'))
+        if ids_file is not None:
+            collected.extend(read_ids(ids_file))
+        if not collected:
+            raise ValidationError('Specify one or more IDs, --ids-file, or - to read IDs from stdin')
+        return collected
+    
+    def get_many(self, fetch, ids: List[str], concurrency: int = 8,
+                 unordered: bool = False) -> Iterator[Any]:
+        """Yield ``fetch(id)`` for every ID, fetching up to ``concurrency`` at a time
+        
+        Results come out in input order, or as they complete with ``unordered``.
+        A failed ID is reported on stderr and counted in ``fetch_stats``
+        without stopping the others.
+        """
+        self.fetch_stats = stats = BulkStats()
+        self.client.size_pool(concurrency)
+        results = run_bulk(fetch, ids, concurrency)
+        if not unordered:
+            results = in_order(results)
+        for result in results:
+            stats.add(result)
+            if result.ok:
+                yield result.result
+            else:
+                click.echo(click.style(f'✗ {result.item}: {result.error}', fg='red'), err=True)
+    
+    def run_bulk(self, func, items: Iterable[Any], concurrency: int = 8,
+                 output_format: str = 'table', label: str = 'record',
+                 resume: Optional[str] = None, journal: bool = True, async_func=None,
+                 payload: Any = None, confirm: Optional[str] = None) -> BulkStats:
+        """Run ``func`` over ``items`` concurrently, reporting each outcome and a summary
+        
+        Unless ``journal`` is off, each outcome is appended to a job journal
+        in the profile's jobs directory; ``resume`` names an earlier job whose
+        completed items are skipped. ``payload`` is what every item is sent
+        (an update's fields), which a resumed job must not change. Given
+        ``confirm``, a prompt with a ``{count}`` placeholder, the items still
+        to do are counted and confirmed first. Given ``async_func``, a
+        coroutine function taking an AsyncSite24x7Client and an item, the
+        items run on the asyncio engine instead of the thread pool.
+        """
+        stats = BulkStats()
+        if not journal:
+            if confirm:
+                items = list(items)
+                click.confirm(confirm.format(count=len(items)), abort=True)
+            for result in self._bulk_engine(func, async_func, items, concurrency):
+                stats.add(result)
+                print_result(result, output_format, label)
+            print_summary(stats, output_format)
+            return stats
+        
+        job = self._job_journal(resume, payload)
+        pending = job.pending(items)
+        if confirm:
+            # Count only what this run will do, after the earlier run's items are skipped
+            pending = list(pending)
+            if pending and not click.confirm(confirm.format(count=len(pending))):
+                job.discard()
+                raise click.Abort()
+        click.echo(f'Job {job.job_id} (resume with --resume {job.job_id})', err=True)
+        try:
+            results = self._bulk_engine(lambda pair: func(pair[1]),
+                                        async_func and (lambda client, pair: async_func(client, pair[1])),
+                                        pending, concurrency)
+            for result in results:
+                # Report items by their position in the full input, not the remainder
+                result.index, result.item = result.item
+                job.record(result.index, result.item, result)
+                stats.add(result)
+                print_result(result, output_format, label)
+        finally:
+            job.close()
+        if job.skipped:
+            click.echo(f'{job.skipped} items completed by an earlier run were skipped', err=True)
+        print_summary(stats, output_format)
+        return stats
+    
+    def _bulk_engine(self, func, async_func, items: Iterable[Any], concurrency: int) -> Iterator[BulkResult]:
+        if async_func is not None:
+            from site24x7_cli.async_client import run_bulk_async
+
+            return run_bulk_async(async_func, items, concurrency, **self.async_client_options())
+        self.client.size_pool(concurrency)
+        return run_bulk(func, items, concurrency)
+    
+    def _job_journal(self, resume: Optional[str] = None, payload: Any = None) -> 'JobJournal':
+        from site24x7_cli.journal import JobJournal
+
+        ctx = click.get_current_context(silent=True)
+        # The command path without the program name, which differs between entry points
+        operation = ' '.join(ctx.command_path.split()[1:]) if ctx else 'bulk'
+        directory = Config.get_jobs_dir(self.profile)
+        if resume:
+            return JobJournal.resume(resume, operation, directory, payload)
+        return JobJournal.start(operation, directory, payload)
@@ -0,0 +1,207 @@
+"""
+Bulk operation helpers for Site24x7 CLI
+"""
+
+import contextvars
+import csv
+import fnmatch
+import json
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO
+
+import click
+
+from site24x7_cli.exceptions import ValidationError
+from site24x7_cli.utils import percentile
+
+
+def read_records(stream: TextIO, input_format: str = 'auto') -> Iterator[Dict[str, Any]]:
+    """Stream record definitions from an NDJSON or CSV file"""
+    if input_format == 'auto':
+        name = getattr(stream, 'name', '') or ''
+        input_format = 'csv' if str(name).lower().endswith('.csv') else 'ndjson'
+
+    if input_format == 'csv':
+        for row in csv.DictReader(stream):
+            yield {key: value for key, value in row.items() if key and value not in (None, '')}
+        return
+
+    for line_number, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            raise ValidationError(f"Line {line_number}: invalid JSON ({e})")
+        if not isinstance(record, dict):
+            raise ValidationError(f"Line {line_number}: expected a JSON object")
+        yield record
+
+
+def read_ids(stream: TextIO) -> List[str]:
+    """Read one ID per line, ignoring blank lines and comments"""
+    ids = []
+    for line in stream:
+        line = line.split('#', 1)[0].strip()
+        if line:
+            ids.append(line)
+    return ids
+
+
+def match_name(record: Dict[str, Any], pattern: Optional[str]) -> bool:
+    """Check a record's display name against a shell-style pattern"""
+    if not pattern:
+        return True
+    return fnmatch.fnmatch(str(record.get('display_name', record.get('name', ''))), pattern)
+
+
+def new_monitor(record: Dict[str, Any], monitor_type: str) -> Dict[str, Any]:
+    """Fill in the fields a new monitor of ``monitor_type`` defaults to when the definition omits them"""
+    data = dict(record)
+    if 'name' in data:
+        data.setdefault('display_name', data.pop('name'))
+    data.setdefault('monitor_type', monitor_type.upper())
+    data.setdefault('check_frequency', '5')
+    data.setdefault('timeout', '30')
+    return data
+
+
+def record_id(record: Dict[str, Any]) -> Optional[str]:
+    """Return the ID of an API record"""
+    for key in ('monitor_id', 'id'):
+        if record.get(key) is not None:
+            return str(record[key])
+    return None
+
+
+class BulkResult:
+    """Outcome of one bulk operation"""
+
+    def __init__(self, index: int, item: Any, result: Any = None,
+                 error: Optional[Exception] = None, latency: float = 0.0):
+        self.index = index
+        self.item = item
+        self.result = result
+        self.error = error
+        self.latency = latency
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class BulkStats:
+    """Throughput and latency summary for a bulk run"""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.latencies: List[float] = []
+        self.succeeded = 0
+        self.failed = 0
+
+    def add(self, result: BulkResult) -> None:
+        self.latencies.append(result.latency)
+        if result.ok:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+
+    def summary(self) -> Dict[str, Any]:
+        elapsed = time.monotonic() - self.started
+        total = self.succeeded + self.failed
+        return {
+            'total': total,
+            'succeeded': self.succeeded,
+            'failed': self.failed,
+            'elapsed_s': round(elapsed, 3),
+            'records_per_s': round(total / elapsed, 2) if elapsed > 0 else 0.0,
+            'p50_ms': round(percentile(self.latencies, 50) * 1000, 1),
+            'p95_ms': round(percentile(self.latencies, 95) * 1000, 1),
+        }
+
+
+def run_bulk(func: Callable[[Any], Any], items: Iterable[Any],
+             concurrency: int = 8) -> Iterator[BulkResult]:
+    """Apply ``func`` to every item on a bounded worker pool
+
+    Items are pulled from ``items`` lazily, keeping at most ``2 * concurrency``
+    in flight, and results are yielded as they complete. If reading ``items``
+    fails, the operations already submitted are still yielded before the
+    error is re-raised.
+    """
+    concurrency = max(concurrency, 1)
+
+    def call(index: int, item: Any) -> BulkResult:
+        started = time.monotonic()
+        try:
+            return BulkResult(index, item, result=func(item), latency=time.monotonic() - started)
+        except Exception as e:
+            return BulkResult(index, item, error=e, latency=time.monotonic() - started)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        pending = set()
+        try:
+            for index, item in enumerate(items, 1):
+                # Workers run in the caller's context so they see its profiler
+                pending.add(pool.submit(contextvars.copy_context().run, call, index, item))
+                if len(pending) >= concurrency * 2:
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        yield future.result()
+        except GeneratorExit:
+            raise
+        except BaseException:
+            # Report what is in flight so it is printed, counted and journaled
+            for future in as_completed(pending):
+                yield future.result()
+            raise
+        for future in as_completed(pending):
+            yield future.result()
+
+
+def print_result(result: BulkResult, output_format: str = 'table', label: str = 'record') -> None:
+    """Print the outcome of a single bulk operation"""
+    name = result.item if isinstance(result.item, str) else getattr(result.item, 'label', result.index)
+    if output_format in ('json', 'ndjson'):
+        line = {'index': result.index, 'ok': result.ok, 'latency_ms': round(result.latency * 1000, 1)}
+        if isinstance(result.item, str):
+            line['id'] = result.item
+        elif hasattr(result.item, 'label'):
+            line['item'] = result.item.label
+        if result.ok:
+            line['result'] = result.result
+        else:
+            line['error'] = str(result.error)
+        click.echo(json.dumps(line, default=str))
+    elif result.ok:
+        click.echo(click.style(f'✓ {label} {name}', fg='green') +
+                   f' ({result.latency * 1000:.0f} ms)')
+    else:
+        click.echo(click.style(f'✗ {label} {name}: {result.error}', fg='red'), err=True)
+
+
+def print_summary(stats: BulkStats, output_format: str = 'table') -> None:
+    """Print the throughput summary of a bulk run"""
+    summary = stats.summary()
+    if output_format in ('json', 'ndjson'):
+        click.echo(json.dumps({'summary': summary}))
+        return
+    click.echo(f"{summary['succeeded']} succeeded, {summary['failed']} failed in "
+               f"{summary['elapsed_s']}s ({summary['records_per_s']} records/s, "
+               f"p50 {summary['p50_ms']} ms, p95 {summary['p95_ms']} ms)", err=True)
+
+
+def in_order(results: Iterable[BulkResult]) -> Iterator[BulkResult]:
+    """Re-sequence ``run_bulk`` results into input order
+
+    Results that complete early are held until every earlier one is out.
+    """
+    waiting: Dict[int, BulkResult] = {}
+    next_index = 1
+    for result in results:
+        waiting[result.index] = result
+        while next_index in waiting:
+            yield waiting.pop(next_index)
+            next_index += 1
@@ -0,0 +1,169 @@
+"""
+On-disk response cache for Site24x7 CLI
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from site24x7_cli.config import Config
+
+
+def cache_scope(base_url: str, oauth_token: Optional[str]) -> str:
+    """Identify the account a response belongs to without storing its token"""
+    raw = f"{base_url.rstrip('/')}\n{oauth_token or ''}"
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()[:16]
+
+
+class ResponseCache:
+    """Persistent cache of GET responses keyed by endpoint and params
+
+    Entries expire after a per-endpoint TTL (longest matching prefix wins) and
+    keep the server's ETag/Last-Modified so stale entries can be revalidated.
+    The directory is kept under ``max_bytes`` by evicting the least recently
+    used entries; a hit refreshes the entry's modification time. Keys include
+    ``scope`` (see ``cache_scope``), so accounts sharing the directory never
+    see each other's responses.
+    """
+
+    DEFAULT_TTLS = {
+        '/current_status': 30,
+        '/api/performance-reports': 300,
+    }
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = 50 * 1024 * 1024,
+                 default_ttl: float = 60, ttls: Optional[Dict[str, float]] = None,
+                 scope: str = ''):
+        self.directory = directory or Config.get_cache_dir()
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.ttls = dict(self.DEFAULT_TTLS, **(ttls or {}))
+        self.scope = scope
+        self.size: Optional[int] = None
+        self.lock = threading.Lock()
+
+    def key(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Return the cache key for a request"""
+        raw = json.dumps([self.scope, endpoint, sorted((params or {}).items())], default=str)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def ttl(self, endpoint: str) -> float:
+        """Return the TTL for an endpoint"""
+        matches = [prefix for prefix in self.ttls if endpoint.startswith(prefix)]
+        if not matches:
+            return self.default_ttl
+        return self.ttls[max(matches, key=len)]
+
+    def lookup(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Return the stored entry for a request, fresh or not"""
+        path = self._path(self.key(endpoint, params))
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return entry
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """Check whether an entry is still within its TTL"""
+        return time.time() - entry.get('stored_at', 0) < self.ttl(entry.get('endpoint', ''))
+
+    def validators(self, entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Conditional request headers for revalidating an entry"""
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, endpoint: str, params: Optional[Dict[str, Any]], data: Any,
+              etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """Store a response body together with its validators"""
+        entry = {
+            'endpoint': endpoint,
+            'params': params or {},
+            'stored_at': time.time(),
+            'etag': etag,
+            'last_modified': last_modified,
+            'data': data,
+        }
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(self.key(endpoint, params))
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            previous = os.path.getsize(path)
+        except OSError:
+            previous = 0
+        with open(tmp_path, 'w') as f:
+            json.dump(entry, f, default=str)
+        os.replace(tmp_path, path)
+
+        with self.lock:
+            if self.size is None:
+                self.size = self._disk_usage()
+            else:
+                self.size += os.path.getsize(path) - previous
+            if self.size > self.max_bytes:
+                self._evict()
+
+    def refresh(self, entry: Dict[str, Any]) -> None:
+        """Restart an entry's TTL after the server confirmed it is unchanged"""
+        self.store(entry['endpoint'], entry.get('params'), entry['data'],
+                   entry.get('etag'), entry.get('last_modified'))
+
+    def clear(self) -> None:
+        """Remove every cached entry"""
+        for name in self._entries():
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+        self.size = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _entries(self):
+        try:
+            return [name for name in os.listdir(self.directory) if name.endswith('.json')]
+        except OSError:
+            return []
+
+    def _disk_usage(self) -> int:
+        total = 0
+        for name in self._entries():
+            try:
+                total += os.path.getsize(os.path.join(self.directory, name))
+            except OSError:
+                pass
+        return total
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache fits again"""
+        entries = []
+        for name in self._entries():
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+        self.size = total
@@ -0,0 +1,79 @@
+"""
+Site24x7 CLI - Batch Commands
+
+This module runs a script of CLI commands inside one process, so scripts
+pay for interpreter startup and connection setup once instead of per
+command.
+"""
+
+import json
+import time
+
+import click
+from typing import Dict, Any, List, Tuple
+
+from site24x7_cli.base import share_clients
+from site24x7_cli.bulk import run_bulk
+from site24x7_cli.config import Config
+from site24x7_cli.invoke import parse_script, run_captured
+
+# Commands that cannot run from a batch script
+EXCLUDED_COMMANDS = {'batch', 'daemon'}
+
+
+def _run(command: Tuple[int, List[str]], defaults: Dict[str, Any]) -> Dict[str, Any]:
+    line, args = command
+    started = time.monotonic()
+    if args and args[0] in EXCLUDED_COMMANDS:
+        result = {'exit_code': 2, 'stdout': '', 'stderr': f"'{args[0]}' cannot be used in a batch script\n"}
+    else:
+        result = run_captured(args, defaults=defaults)
+    return dict({'line': line, 'args': args}, elapsed_ms=round((time.monotonic() - started) * 1000, 1),
+                **result)
+
+
+@click.command(name='batch')
+@click.argument('script', type=click.File('r'))
+@click.option('--parallel', '-j', type=click.IntRange(1), default=1,
+              help='Commands run concurrently (lines must be independent)')
+@click.option('--stop-on-error', is_flag=True, help='Start no further commands after a failure')
+@click.pass_context
+def batch(ctx, script, parallel, stop_on_error):
+    """Run CLI commands from SCRIPT (or - for stdin) in one process
+
+    SCRIPT holds one command per line, without the leading 'site24x7', or a
+    JSON array of command strings or argument lists. Global options given
+    before 'batch' apply to every command. One NDJSON result per command is
+    written, tagged with its line number; with --parallel, results appear
+    in completion order.
+    """
+    commands = parse_script(script.read())
+    root = ctx.find_root()
+    defaults = {name: value for name, value in root.params.items() if value is not None}
+    if parallel > 1:
+        # Commands share clients, so their pools must hold a connection per worker
+        defaults['pool_maxsize'] = max(defaults.get('pool_maxsize') or Config.get_pool_maxsize(),
+                                       parallel)
+    share_clients()
+
+    failed = 0
+
+    def pending():
+        for command in commands:
+            if stop_on_error and failed:
+                return
+            yield command
+
+    if parallel <= 1:
+        results = (_run(command, defaults) for command in pending())
+    else:
+        results = (outcome.result for outcome in run_bulk(lambda c: _run(c, defaults), pending(), parallel))
+
+    for result in results:
+        if result['exit_code'] != 0:
+            failed += 1
+        click.echo(json.dumps(result, default=str, separators=(',', ':')))
+
+    if failed:
+        click.echo(click.style(f'{failed} of {len(commands)} commands failed', fg='red'), err=True)
+        ctx.exit(1)
@@ -0,0 +1,91 @@
+"""
+Site24x7 CLI - Daemon Commands
+
+This module provides commands to start, stop and inspect the background
+daemon that keeps imports, sessions and credentials warm between
+invocations.
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+import click
+from typing import Dict, Any, Optional
+
+from site24x7_cli.config import Config
+from site24x7_cli.daemon import send, serve
+
+
+def _ping(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        return send({'command': 'ping'}, path, timeout=2)
+    except (OSError, ValueError):
+        return None
+
+
+@click.group(name='daemon')
+@click.pass_context
+def daemon_group(ctx):
+    """Run the CLI as a warm background daemon"""
+    pass
+
+
+@daemon_group.command(name='start')
+@click.option('--socket', 'path', type=click.Path(dir_okay=False), help='Unix socket path')
+@click.option('--foreground', is_flag=True, help='Serve in this process instead of detaching')
+@click.pass_context
+def start(ctx, path, foreground):
+    """Start the daemon; later commands are forwarded to it automatically"""
+    path = path or Config.get_daemon_socket(ctx.obj.get('profile'))
+    if _ping(path):
+        click.echo(f'Daemon already running on {path}')
+        return
+    
+    if foreground:
+        click.echo(f'Serving on {path} (Ctrl+C to stop)')
+        try:
+            serve(path)
+        except KeyboardInterrupt:
+            pass
+        return
+    
+    with open(os.devnull, 'r+') as devnull:
+        subprocess.Popen([sys.executable, '-m', 'site24x7_cli.daemon', path],
+                         stdin=devnull, stdout=devnull, stderr=devnull, start_new_session=True)
+    
+    for _ in range(100):
+        info = _ping(path)
+        if info:
+            click.echo(click.style(f"✓ Daemon started (pid {info['pid']}, {path})", fg='green'))
+            return
+        time.sleep(0.1)
+    raise click.ClickException('Daemon did not start within 10 seconds')
+
+
+@daemon_group.command(name='stop')
+@click.option('--socket', 'path', type=click.Path(dir_okay=False), help='Unix socket path')
+@click.pass_context
+def stop(ctx, path):
+    """Stop the daemon"""
+    path = path or Config.get_daemon_socket(ctx.obj.get('profile'))
+    if not _ping(path):
+        click.echo('Daemon is not running')
+        return
+    send({'command': 'shutdown'}, path, timeout=5)
+    click.echo(click.style('✓ Daemon stopped', fg='green'))
+
+
+@daemon_group.command(name='status')
+@click.option('--socket', 'path', type=click.Path(dir_okay=False), help='Unix socket path')
+@click.pass_context
+def status(ctx, path):
+    """Show whether the daemon is running"""
+    path = path or Config.get_daemon_socket(ctx.obj.get('profile'))
+    info = _ping(path)
+    if not info:
+        click.echo('Daemon: not running')
+        return
+    click.echo(f"Daemon: running (pid {info['pid']}, up {info['uptime_s']}s, "
+               f"{info['served']} commands served, {info['socket']})")
@@ -0,0 +1,949 @@
+"""
+Site24x7 CLI - Monitor-Management Commands
+Generated automatically from Site24x7 API documentation
+
+This module provides CLI commands for Manage Monitor Management.
+"""
+
+import click
+import json
+from typing import Dict, Any, Optional, List, Tuple
+from rich.console import Console
+from rich.table import Table
+
+from site24x7_cli.base import BaseCommand, Site24x7Client
+from site24x7_cli.bulk import BulkStats, new_monitor, read_records
+from site24x7_cli.exceptions import Site24x7CLIError, APIError
+from site24x7_cli.mirror import InventoryMirror
+from site24x7_cli.query import Query
+from site24x7_cli.utils import validate_monitor_id, format_timestamp, parse_key_value_pairs
+
+console = Console()
+
+
+class MonitorManagementCommand(BaseCommand):
+    """Base command class for monitor-management operations"""
+    
+    def __init__(self):
+        super().__init__()
+        self.category = "monitor-management"
+    
+    def list_website_monitors(self, limit: int = 50, offset: int = 0, 
+                                  status: Optional[str] = None, 
+                                  group_id: Optional[str] = None, 
+                                  where: Optional[str] = None, 
+                                  fetch_all: bool = False, prefetch: int = 2, 
+                                  local: bool = False, db: Optional[str] = None,
+                                  **kwargs) -> List[Dict[str, Any]]:
+        """List website-monitors"""
+        query = Query(where) if where else None
+        pushed = query.pushdown() if query else {}
+        if local or db:
+            mirror = InventoryMirror(db, account=self.profile)
+            records = mirror.query('website-monitors', status or pushed.get('status'),
+                                   group_id or pushed.get('group_id'),
+                                   limit=None if fetch_all else limit, offset=offset)
+            return query.filter(records) if query else records
+        
+        params = {'limit': limit, 'offset': offset}
+        
+        if status:
+            params['status'] = status
+        if group_id:
+            params['group_id'] = group_id
+        params = dict(pushed, **params)
+        
+        endpoint = "/api/website-monitors"
+        if fetch_all:
+            records = self.client.iter_pages(endpoint, params, page_size=limit, offset=offset,
+                                             prefetch=prefetch, key='website-monitors',
+                                             fields=self.fetch_fields(query))
+            return query.filter(records) if query else records
+        
+        records = self.client.get_records(endpoint, params, key='website-monitors',
+                                          fields=self.fetch_fields(query))
+        return [record for record in records if query(record)] if query else records
+    
+    def get_website_monitors(self, ids: Tuple[str, ...] = (), ids_file: Optional[Any] = None, 
+                                 concurrency: int = 8, unordered: bool = False, **kwargs) -> Any:
+        """Get website-monitors by ID, fetching several IDs concurrently"""
+        ids = self.collect_ids(ids, ids_file)
+        if len(ids) == 1 and ids_file is None:
+            return self.fetch_website_monitors(ids[0])
+        return self.get_many(self.fetch_website_monitors, ids, concurrency, unordered)
+    
+    def fetch_website_monitors(self, id: str) -> Dict[str, Any]:
+        """Get specific website-monitors by ID"""
+        if not validate_monitor_id(id):
+            raise ValueError(f"Invalid ID format: {id}")
+        
+        endpoint = f"/api/website-monitors/{id}"
+        response = self.client.get(endpoint)
+        
+        if 'data' in response:
+            return response['data']
+        return response
+    
+    def create_website_monitors(self, name: str, config: Optional[Any] = None, 
+                                    param: List[str] = None, **kwargs) -> Dict[str, Any]:
+        """Create new website-monitors"""
+        data = {'display_name': name}
+        
+        # Load configuration from file if provided
+        if config:
+            config_data = json.load(config)
+            data.update(config_data)
+        
+        # Parse additional parameters
+        if param:
+            additional_params = parse_key_value_pairs(param)
+            data.update(additional_params)
+        
+        # Add default required fields based on monitor type
+        if 'monitor' in "website-monitors":
+            data.setdefault('monitor_type', 'WEBSITE-MONITORS')
+            data.setdefault('check_frequency', '5')
+            data.setdefault('timeout', '30')
+        
+        endpoint = "/api/website-monitors"
+        response = self.client.post(endpoint, data=data)
+        
+        if 'data' in response:
+            return response['data']
+        return response
+    
+    def update_website_monitors(self, id: str, name: Optional[str] = None, 
+                                    config: Optional[Any] = None, 
+                                    param: List[str] = None, **kwargs) -> Dict[str, Any]:
+        """Update website-monitors"""
+        if not validate_monitor_id(id):
+            raise ValueError(f"Invalid ID format: {id}")
+        
+        data = {}
+        
+        if name:
+            data['display_name'] = name
+        
+        # Load configuration from file if provided
+        if config:
+            config_data = json.load(config)
+            data.update(config_data)
+        
+        # Parse additional parameters
+        if param:
+            additional_params = parse_key_value_pairs(param)
+            data.update(additional_params)
+        
+        if not data:
+            raise ValueError("No update parameters provided")
+        
+        endpoint = f"/api/website-monitors/{id}"
+        response = self.client.put(endpoint, data=data)
+        
+        if 'data' in response:
+            return response['data']
+        return response
+    
+    def delete_website_monitors(self, id: str, force: bool = False, **kwargs) -> Dict[str, Any]:
+        """Delete website-monitors"""
+        if not validate_monitor_id(id):
+            raise ValueError(f"Invalid ID format: {id}")
+        
+        if not force:
+            click.confirm(f'Are you sure you want to delete website-monitors {id}?', abort=True)
+        
+        endpoint = f"/api/website-monitors/{id}"
+        response = self.client.delete(endpoint)
+        
+        return response
+    
+    def bulk_create_website_monitors(self, file: Any, input_format: str = 'auto', 
+                                concurrency: int = 8, output_format: str = 'table', 
+                                resume: Optional[str] = None, use_async: bool = False, 
+                                **kwargs) -> BulkStats:
+        """Create website-monitors from a stream of definitions"""
+        endpoint = "/api/website-monitors"
+        
+        def create(record: Dict[str, Any]) -> Dict[str, Any]:
+            response = self.client.post(endpoint, data=new_monitor(record, 'website-monitors'))
+            
+            if 'data' in response:
+                return response['data']
+            return response
+        
+        async def create_async(client: 'AsyncSite24x7Client', record: Dict[str, Any]) -> Dict[str, Any]:
+            response = await client.post(endpoint, data=new_monitor(record, 'website-monitors'))
+            return response.get('data', response)
+        
+        return self.run_bulk(create, read_records(file, input_format), concurrency, output_format, 
+                             resume=resume, async_func=create_async if use_async else None)
+    
+    def bulk_update_website_monitors(self, status: Optional[str] = None, group_id: Optional[str] = None, 
+                                name_pattern: Optional[str] = None, ids_file: Optional[Any] = None, 
+                                config: Optional[Any] = None, param: List[str] = None, 
+                                concurrency: int = 8, force: bool = False, 
+                                output_format: str = 'table', resume: Optional[str] = None, 
+                                use_async: bool = False, **kwargs) -> BulkStats:
+        """Update every website-monitors matching a filter"""
+        data = {}
+        
+        # Load configuration from file if provided
+        if config:
+            config_data = json.load(config)
+            data.update(config_data)
+        
+        # Parse additional parameters
+        if param:
+            additional_params = parse_key_value_pairs(param)
+            data.update(additional_params)
+        
+        if not data:
+            raise ValueError("No update parameters provided")
+        
+        ids = self.select_ids("/api/website-monitors", 'website-monitors', status, group_id, name_pattern,
+                              ids_file, force)
+        if not ids:
+            console.print("[yellow]No matching website-monitors[/yellow]")
+            return BulkStats()
+        
+        def update(id: str) -> Dict[str, Any]:
+            response = self.client.put(f"/api/website-monitors/{id}", data=data)
+            
+            if 'data' in response:
+                return response['data']
+            return response
+        
+        async def update_async(client: 'AsyncSite24x7Client', id: str) -> Dict[str, Any]:
+            response = await client.put(f"/api/website-monitors/{id}", data=data)
+            return response.get('data', response)
+        
+        return self.run_bulk(update, ids, concurrency, output_format, label='website-monitors', 
+                             resume=resume, async_func=update_async if use_async else None, 
+                             payload=data, confirm=None if force else 'Update {count} website-monitors?')
+    
+    def bulk_delete_website_monitors(self, status: Optional[str] = None, group_id: Optional[str] = None, 
+                                name_pattern: Optional[str] = None, ids_file: Optional[Any] = None, 
+                                concurrency: int = 8, force: bool = False, 
+                                output_format: str = 'table', resume: Optional[str] = None, 
+                                use_async: bool = False, **kwargs) -> BulkStats:
+        """Delete every website-monitors matching a filter"""
+        ids = self.select_ids("/api/website-monitors", 'website-monitors', status, group_id, name_pattern,
+                              ids_file, force)
+        if not ids:
+            console.print("[yellow]No matching website-monitors[/yellow]")
+            return BulkStats()
+        
+        def delete(id: str) -> Dict[str, Any]:
+            return self.client.delete(f"/api/website-monitors/{id}")
+        
+        async def delete_async(client: 'AsyncSite24x7Client', id: str) -> Dict[str, Any]:
+            return await client.delete(f"/api/website-monitors/{id}")
+        
+        return self.run_bulk(delete, ids, concurrency, output_format, label='website-monitors', 
+                             resume=resume, async_func=delete_async if use_async else None, 
+                             confirm=None if force else 'Are you sure you want to delete {count} website-monitors?')
+    
+    def list_api_monitors(self, limit: int = 50, offset: int = 0, 
+                                  status: Optional[str] = None, 
+                                  group_id: Optional[str] = None, 
+                                  where: Optional[str] = None, 
+                                  fetch_all: bool = False, prefetch: int = 2, 
+                                  local: bool = False, db: Optional[str] = None,
+                                  **kwargs) -> List[Dict[str, Any]]:
+        """List api-monitors"""
+        query = Query(where) if where else None
+        pushed = query.pushdown() if query else {}
+        if local or db:
+            mirror = InventoryMirror(db, account=self.profile)
+            records = mirror.query('api-monitors', status or pushed.get('status'),
+                                   group_id or pushed.get('group_id'),
+                                   limit=None if fetch_all else limit, offset=offset)
+            return query.filter(records) if query else records
+        
+        params = {'limit': limit, 'offset': offset}
+        
+        if status:
+            params['status'] = status
+        if group_id:
+            params['group_id'] = group_id
+        params = dict(pushed, **params)
+        
+        endpoint = "/api/api-monitors"
+        if fetch_all:
+            records = self.client.iter_pages(endpoint, params, page_size=limit, offset=offset,
+                                             prefetch=prefetch, key='api-monitors',
+                                             fields=self.fetch_fields(query))
+            return query.filter(records) if query else records
+        
+        records = self.client.get_records(endpoint, params, key='api-monitors',
+                                          fields=self.fetch_fields(query))
+        return [record for record in records if query(record)] if query else records
+    
+    def get_api_monitors(self, ids: Tuple[str, ...] = (), ids_file: Optional[Any] = None, 
+                                 concurrency: int = 8, unordered: bool = False, **kwargs) -> Any:
+        """Get api-monitors by ID, fetching several IDs concurrently"""
+        ids = self.collect_ids(ids, ids_file)
+        if len(ids) == 1 and ids_file is None:
+            return self.fetch_api_monitors(ids[0])
+        return self.get_many(self.fetch_api_monitors, ids, concurrency, unordered)
+    
+    def fetch_api_monitors(self, id: str) -> Dict[str, Any]:
+        """Get specific api-monitors by ID"""
+        if not validate_monitor_id(id):
+            raise ValueError(f"Invalid ID format: {id}")
+        
+        endpoint = f"/api/api-monitors/{id}"
+        response = self.client.get(endpoint)
+        
+        if 'data' in response:
+            return response['data']
+        return response
+    
+    def create_api_monitors(self, name: str, config: Optional[Any] = None, 
+                                    param: List[str] = None, **kwargs) -> Dict[str, Any]:
+        """Create new api-monitors"""
+        data = {'display_name': name}
+        
+        # Load configuration from file if provided
+        if config:
+            config_data = json.load(config)
+            data.update(config_data)
+        
+        # Parse additional parameters
+        if param:
+            additional_params = parse_key_value_pairs(param)
+            data.update(additional_params)
+        
+        # Add default required fields based on monitor type
+        if 'monitor' in "api-monitors":
+            data.setdefault('monitor_type', 'API-MONITORS')
+            data.setdefault('check_frequency', '5')
+            data.setdefault('timeout', '30')
+        
+        endpoint = "/api/api-monitors"
+        response = self.client.post(endpoint, data=data)
+        
+        if 'data' in response:
+            return response['data']
+        return response
+    
+    def update_api_monitors(self, id: str, name: Optional[str] = None, 
+                                    config: Optional[Any] = None, 
+                                    param: List[str] = None, **kwargs) -> Dict[str, Any]:
+        """Update api-monitors"""
+        if not validate_monitor_id(id):
+            raise ValueError(f"Invalid ID format: {id}")
+        
+        data = {}
+        
+        if name:
+            data['display_name'] = name
+        
+        # Load configuration from file if provided
+        if config:
+            config_data = json.load(config)
+            data.update(config_data)
+        
+        # Parse additional parameters
+        if param:
+            additional_params = parse_key_value_pairs(param)
+            data.update(additional_params)
+        
+        if not data:
+            raise ValueError("No update parameters provided")
+        
+        endpoint = f"/api/api-monitors/{id}"
+        response = self.client.put(endpoint, data=data)
+        
+        if 'data' in response:
+            return response['data']
+        return response
+    
+    def delete_api_monitors(self, id: str, force: bool = False, **kwargs) -> Dict[str, Any]:
+        """Delete api-monitors"""
+        if not validate_monitor_id(id):
+            raise ValueError(f"Invalid ID format: {id}")
+        
+        if not force:
+            click.confirm(f'Are you sure you want to delete api-monitors {id}?', abort=True)
+        
+        endpoint = f"/api/api-monitors/{id}"
+        response = self.client.delete(endpoint)
+        
+        return response
+    
+    def bulk_create_api_monitors(self, file: Any, input_format: str = 'auto', 
+                                concurrency: int = 8, output_format: str = 'table', 
+                                resume: Optional[str] = None, use_async: bool = False, 
+                                **kwargs) -> BulkStats:
+        """Create api-monitors from a stream of definitions"""
+        endpoint = "/api/api-monitors"
+        
+        def create(record: Dict[str, Any]) -> Dict[str, Any]:
+            response = self.client.post(endpoint, data=new_monitor(record, 'api-monitors'))
+            
+            if 'data' in response:
+                return response['data']
+            return response
+        
+        async def create_async(client: 'AsyncSite24x7Client', record: Dict[str, Any]) -> Dict[str, Any]:
+            response = await client.post(endpoint, data=new_monitor(record, 'api-monitors'))
+            return response.get('data', response)
+        
+        return self.run_bulk(create, read_records(file, input_format), concurrency, output_format, 
+                             resume=resume, async_func=create_async if use_async else None)
+    
+    def bulk_update_api_monitors(self, status: Optional[str] = None, group_id: Optional[str] = None, 
+                                name_pattern: Optional[str] = None, ids_file: Optional[Any] = None, 
+                                config: Optional[Any] = None, param: List[str] = None, 
+                                concurrency: int = 8, force: bool = False, 
+                                output_format: str = 'table', resume: Optional[str] = None, 
+                                use_async: bool = False, **kwargs) -> BulkStats:
+        """Update every api-monitors matching a filter"""
+        data = {}
+        
+        # Load configuration from file if provided
+        if config:
+            config_data = json.load(config)
+            data.update(config_data)
+        
+        # Parse additional parameters
+        if param:
+            additional_params = parse_key_value_pairs(param)
+            data.update(additional_params)
+        
+        if not data:
+            raise ValueError("No update parameters provided")
+        
+        ids = self.select_ids("/api/api-monitors", 'api-monitors', status, group_id, name_pattern,
+                              ids_file, force)
+        if not ids:
+            console.print("[yellow]No matching api-monitors[/yellow]")
+            return BulkStats()
+        
+        def update(id: str) -> Dict[str, Any]:
+            response = self.client.put(f"/api/api-monitors/{id}", data=data)
+            
+            if 'data' in response:
+                return response['data']
+            return response
+        
+        async def update_async(client: 'AsyncSite24x7Client', id: str) -> Dict[str, Any]:
+            response = await client.put(f"/api/api-monitors/{id}", data=data)
+            return response.get('data', response)
+        
+        return self.run_bulk(update, ids, concurrency, output_format, label='api-monitors', 
+                             resume=resume, async_func=update_async if use_async else None, 
+                             payload=data, confirm=None if force else 'Update {count} api-monitors?')
+    
+    def bulk_delete_api_monitors(self, status: Optional[str] = None, group_id: Optional[str] = None, 
+                                name_pattern: Optional[str] = None, ids_file: Optional[Any] = None, 
+                                concurrency: int = 8, force: bool = False, 
+                                output_format: str = 'table', resume: Optional[str] = None, 
+                                use_async: bool = False, **kwargs) -> BulkStats:
+        """Delete every api-monitors matching a filter"""
+        ids = self.select_ids("/api/api-monitors", 'api-monitors', status, group_id, name_pattern,
+                              ids_file, force)
+        if not ids:
+            console.print("[yellow]No matching api-monitors[/yellow]")
+            return BulkStats()
+        
+        def delete(id: str) -> Dict[str, Any]:
+            return self.client.delete(f"/api/api-monitors/{id}")
+        
+        async def delete_async(client: 'AsyncSite24x7Client', id: str) -> Dict[str, Any]:
+            return await client.delete(f"/api/api-monitors/{id}")
+        
+        return self.run_bulk(delete, ids, concurrency, output_format, label='api-monitors', 
+                             resume=resume, async_func=delete_async if use_async else None, 
+                             confirm=None if force else 'Are you sure you want to delete {count} api-monitors?')
+
+
+@click.group(name='monitor-management')
+@click.pass_context
+def monitor_management_group(ctx):
+    """Manage Monitor Management management commands"""
+    pass
+
+
+
+@monitor_management_group.group(name='website-monitors')
+@click.pass_context
+def website_monitors_group(ctx):
+    """Manage Website Monitors operations"""
+    pass
+
+
+
+@website_monitors_group.command(name='list')
+
+@click.option('--limit', '-l', type=click.IntRange(1), default=50, help='Number of items to retrieve')
+@click.option('--offset', type=click.IntRange(0), default=0, help='Offset for pagination')
+@click.option('--status', type=click.Choice(['up', 'down', 'trouble', 'critical', 'suspended']), 
+              help='Filter by status')
+@click.option('--group-id', type=str, help='Filter by monitor group ID')
+@click.option('--where', '-w', help='Filter expression, e.g. "status == down and display_name ~ ^web"')
+@click.option('--all', 'fetch_all', is_flag=True, help='Stream every page, starting at --offset')
+@click.option('--prefetch', type=click.IntRange(0), default=2, help='Pages to fetch ahead when using --all')
+@click.option('--local', is_flag=True, help='Answer from the local mirror (see "site24x7 sync")')
+@click.option('--db', type=click.Path(dir_okay=False), help='Mirror database path (implies --local)')
+
+@click.pass_context
+def list_website_monitors(ctx, **kwargs):
+    """List all Website Monitors"""
+    try:
+        command = MonitorManagementCommand()
+        result = command.list_website_monitors(**kwargs)
+        
+        output_format = ctx.obj.get('output_format', 'table')
+        command.format_output(result, output_format)
+        
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        if ctx.obj.get('verbose'):
+            import traceback
+            console.print(f"[red]{traceback.format_exc()}[/red]")
+        raise click.ClickException(str(e))
+
+
+
+@website_monitors_group.command(name='get')
+
+@click.argument('ids', nargs=-1)
+@click.option('--ids-file', type=click.File('r'), help='File with one ID per line (- for stdin)')
+@click.option('--concurrency', '-j', type=click.IntRange(1), default=8, help='Maximum concurrent requests')
+@click.option('--unordered', is_flag=True, help='Output results as they arrive instead of in input order')
+
+@click.pass_context
+def get_website_monitors(ctx, **kwargs):
+    """Get specific Website Monitors by ID (several IDs are fetched concurrently)"""
+    try:
+        command = MonitorManagementCommand()
+        result = command.get_website_monitors(**kwargs)
+        
+        output_format = ctx.obj.get('output_format', 'table')
+        command.format_output(result, output_format)
+        
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        if ctx.obj.get('verbose'):
+            import traceback
+            console.print(f"[red]{traceback.format_exc()}[/red]")
+        raise click.ClickException(str(e))
+    
+    stats = command.fetch_stats
+    if stats and stats.failed:
+        raise click.ClickException(f"{stats.failed} of {stats.succeeded + stats.failed} IDs failed")
+
+
+
+@website_monitors_group.command(name='create')
+
+@click.option('--name', '-n', required=True, help='Website-Monitors name')
+@click.option('--config', '-c', type=click.File('r'), help='Configuration file (JSON)')
+@click.option('--param', '-p', multiple=True, help='Parameters in key=value format')
+
+@click.pass_context
+def create_website_monitors(ctx, **kwargs):
+    """Create new Website Monitors"""
+    try:
+        command = MonitorManagementCommand()
+        result = command.create_website_monitors(**kwargs)
+        
+        output_format = ctx.obj.get('output_format', 'table')
+        command.format_output(result, output_format)
+        
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        if ctx.obj.get('verbose'):
+            import traceback
+            console.print(f"[red]{traceback.format_exc()}[/red]")
+        raise click.ClickException(str(e))
+
+
+
+@website_monitors_group.command(name='update')
+
+@click.argument('id', required=True)
+@click.option('--name', '-n', help='New name')
+@click.option('--config', '-c', type=click.File('r'), help='Configuration file (JSON)')
+@click.option('--param', '-p', multiple=True, help='Parameters in key=value format')
+
+@click.pass_context
+def update_website_monitors(ctx, **kwargs):
+    """Update Website Monitors"""
+    try:
+        command = MonitorManagementCommand()
+        result = command.update_website_monitors(**kwargs)
+        
+        output_format = ctx.obj.get('output_format', 'table')
+        command.format_output(result, output_format)
+        
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        if ctx.obj.get('verbose'):
+            import traceback
+            console.print(f"[red]{traceback.format_exc()}[/red]")
+        raise click.ClickException(str(e))
+
+
+
+@website_monitors_group.command(name='delete')
+
+@click.argument('id', required=True)
+@click.option('--force', '-f', is_flag=True, help='Force deletion without confirmation')
+
+@click.pass_context
+def delete_website_monitors(ctx, **kwargs):
+    """Delete Website Monitors"""
+    try:
+        command = MonitorManagementCommand()
+        result = command.delete_website_monitors(**kwargs)
+        
+        output_format = ctx.obj.get('output_format', 'table')
+        command.format_output(result, output_format)
+        
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        if ctx.obj.get('verbose'):
+            import traceback
+            console.print(f"[red]{traceback.format_exc()}[/red]")
+        raise click.ClickException(str(e))
+
+
+
+@website_monitors_group.command(name='bulk-create')
+
+@click.argument('file', type=click.File('r'), default='-')
+@click.option('--format', 'input_format', type=click.Choice(['auto', 'ndjson', 'csv']), 
+              default='auto', help='Input format (detected from the file extension by default)')
+@click.option('--concurrency', '-j', type=click.IntRange(1), default=8, help='Maximum concurrent requests')
+@click.option('--resume', metavar='JOB_ID', help='Continue an interrupted job, skipping the items it completed')
+@click.option('--async', 'use_async', is_flag=True, help='Run on the asyncio engine (needs aiohttp)')
+
+@click.pass_context
+def bulk_create_website_monitors(ctx, **kwargs):
+    """Create Website Monitors in bulk from an NDJSON or CSV file (or stdin)"""
+    try:
+        command = MonitorManagementCommand()
+        output_format = ctx.obj.get('output_format', 'table')
+        stats = command.bulk_create_website_monitors(output_format=output_format, **kwargs)
+        
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        if ctx.obj.get('verbose'):
+            import traceback
+            console.print(f"[red]{traceback.format_exc()}[/red]")
+        raise click.ClickException(str(e))
+    
+    if stats.failed:
+        raise click.ClickException(f"{stats.failed} of {stats.succeeded + stats.failed} records failed")
+
+
+
+@website_monitors_group.command(name='bulk-update')
+
+@click.option('--status', type=click.Choice(['up', 'down', 'trouble', 'critical', 'suspended']), 
+              help='Select by status')
+@click.option('--group-id', type=str, help='Select by monitor group ID')
+@click.option('--name-pattern', type=str, help='Select by display name (shell-style pattern)')
+@click.option('--ids-file', type=click.File('r'), help='File with one ID per line (- for stdin)')
+@click.option('--config', '-c', type=click.File('r'), help='Configuration file (JSON)')
+@click.option('--param', '-p', multiple=True, help='Parameters in key=value format')
+@click.option('--concurrency', '-j', type=click.IntRange(1), default=8, help='Maximum concurrent requests')
+@click.option('--resume', metavar='JOB_ID', help='Continue an interrupted job, skipping the items it completed')
+@click.option('--async', 'use_async', is_flag=True, help='Run on the asyncio engine (needs aiohttp)')
+@click.option('--force', '-f', is_flag=True, help='Update without confirmation')
+
+@click.pass_context
+def bulk_update_website_monitors(ctx, **kwargs):
+    """Update every Website Monitors matching a filter"""
+    try:
+        command = MonitorManagementCommand()
+        output_format = ctx.obj.get('output_format', 'table')
+        stats = command.bulk_update_website_monitors(output_format=output_format, **kwargs)
+        
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        if ctx.obj.get('verbose'):
+            import traceback
+            console.print(f"[red]{traceback.format_exc()}[/red]")
+        raise click.ClickException(str(e))
+    
+    if stats.failed:
+        raise click.ClickException(f"{stats.failed} of {stats.succeeded + stats.failed} operations failed")
+
+
+
+
+@website_monitors_group.command(name='bulk-delete')
+
+@click.option('--status', type=click.Choice(['up', 'down', 'trouble', 'critical', 'suspended']), 
+              help='Select by status')
+@click.option('--group-id', type=str, help='Select by monitor group ID')
+@click.option('--name-pattern', type=str, help='Select by display name (shell-style pattern)')
+@click.option('--ids-file', type=click.File('r'), help='File with one ID per line (- for stdin)')
+@click.option('--concurrency', '-j', type=click.IntRange(1), default=8, help='Maximum concurrent requests')
+@click.option('--resume', metavar='JOB_ID', help='Continue an interrupted job, skipping the items it completed')
+@click.option('--async', 'use_async', is_flag=True, help='Run on the asyncio engine (needs aiohttp)')
+@click.option('--force', '-f', is_flag=True, help='Force deletion without confirmation')
+
+@click.pass_context
+def bulk_delete_website_monitors(ctx, **kwargs):
+    """Delete every Website Monitors matching a filter"""
+    try:
+        command = MonitorManagementCommand()
+        output_format = ctx.obj.get('output_format', 'table')
+        stats = command.bulk_delete_website_monitors(output_format=output_format, **kwargs)
+        
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        if ctx.obj.get('verbose'):
+            import traceback
+            console.print(f"[red]{traceback.format_exc()}[/red]")
+        raise click.ClickException(str(e))
+    
+    if stats.failed:
+        raise click.ClickException(f"{stats.failed} of {stats.succeeded + stats.failed} operations failed")
+
+
+
+
+@monitor_management_group.group(name='api-monitors')
+@click.pass_context
+def api_monitors_group(ctx):
+    """Manage API Monitors operations"""
+    pass
+
+
+
+@api_monitors_group.command(name='list')
+
+@click.option('--limit', '-l', type=click.IntRange(1), default=50, help='Number of items to retrieve')
+@click.option('--offset', type=click.IntRange(0), default=0, help='Offset for pagination')
+@click.option('--status', type=click.Choice(['up', 'down', 'trouble', 'critical', 'suspended']), 
+              help='Filter by status')
+@click.option('--group-id', type=str, help='Filter by monitor group ID')
+@click.option('--where', '-w', help='Filter expression, e.g. "status == down and display_name ~ ^web"')
+@click.option('--all', 'fetch_all', is_flag=True, help='Stream every page, starting at --offset')
+@click.option('--prefetch', type=click.IntRange(0), default=2, help='Pages to fetch ahead when using --all')
+@click.option('--local', is_flag=True, help='Answer from the local mirror (see "site24x7 sync")')
+@click.option('--db', type=click.Path(dir_okay=False), help='Mirror database path (implies --local)')
+
+@click.pass_context
+def list_api_monitors(ctx, **kwargs):
+    """List all API Monitors"""
+    try:
+        command = MonitorManagementCommand()
+        result = command.list_api_monitors(**kwargs)
+        
+        output_format = ctx.obj.get('output_format', 'table')
+        command.format_output(result, output_format)
+        
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        if ctx.obj.get('verbose'):
+            import traceback
+            console.print(f"[red]{traceback.format_exc()}[/red]")
+        raise click.ClickException(str(e))
+
+
+
+@api_monitors_group.command(name='get')
+
+@click.argument('ids', nargs=-1)
+@click.option('--ids-file', type=click.File('r'), help='File with one ID per line (- for stdin)')
+@click.option('--concurrency', '-j', type=click.IntRange(1), default=8, help='Maximum concurrent requests')
+@click.option('--unordered', is_flag=True, help='Output results as they arrive instead of in input order')
+
+@click.pass_context
+def get_api_monitors(ctx, **kwargs):
+    """Get specific API Monitors by ID (several IDs are fetched concurrently)"""
+    try:
+        command = MonitorManagementCommand()
+        result = command.get_api_monitors(**kwargs)
+        
+        output_format = ctx.obj.get('output_format', 'table')
+        command.format_output(result, output_format)
+        
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        if ctx.obj.get('verbose'):
+            import traceback
+            console.print(f"[red]{traceback.format_exc()}[/red]")
+        raise click.ClickException(str(e))
+    
+    stats = command.fetch_stats
+    if stats and stats.failed:
+        raise click.ClickException(f"{stats.failed} of {stats.succeeded + stats.failed} IDs failed")
+
+
+
+@api_monitors_group.command(name='create')
+
+@click.option('--name', '-n', required=True, help='Api-Monitors name')
+@click.option('--config', '-c', type=click.File('r'), help='Configuration file (JSON)')
+@click.option('--param', '-p', multiple=True, help='Parameters in key=value format')
+
+@click.pass_context
+def create_api_monitors(ctx, **kwargs):
+    """Create new API Monitors"""
+    try:
+        command = MonitorManagementCommand()
+        result = command.create_api_monitors(**kwargs)
+        
+        output_format = ctx.obj.get('output_format', 'table')
+        command.format_output(result, output_format)
+        
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        if ctx.obj.get('verbose'):
+            import traceback
+            console.print(f"[red]{traceback.format_exc()}[/red]")
+        raise click.ClickException(str(e))
+
+
+
+@api_monitors_group.command(name='update')
+
+@click.argument('id', required=True)
+@click.option('--name', '-n', help='New name')
+@click.option('--config', '-c', type=click.File('r'), help='Configuration file (JSON)')
+@click.option('--param', '-p', multiple=True, help='Parameters in key=value format')
+
+@click.pass_context
+def update_api_monitors(ctx, **kwargs):
+    """Update API Monitors"""
+    try:
+        command = MonitorManagementCommand()
+        result = command.update_api_monitors(**kwargs)
+        
+        output_format = ctx.obj.get('output_format', 'table')
+        command.format_output(result, output_format)
+        
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        if ctx.obj.get('verbose'):
+            import traceback
+            console.print(f"[red]{traceback.format_exc()}[/red]")
+        raise click.ClickException(str(e))
+
+
+
+@api_monitors_group.command(name='delete')
+
+@click.argument('id', required=True)
+@click.option('--force', '-f', is_flag=True, help='Force deletion without confirmation')
+
+@click.pass_context
+def delete_api_monitors(ctx, **kwargs):
+    """Delete API Monitors"""
+    try:
+        command = MonitorManagementCommand()
+        result = command.delete_api_monitors(**kwargs)
+        
+        output_format = ctx.obj.get('output_format', 'table')
+        command.format_output(result, output_format)
+        
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        if ctx.obj.get('verbose'):
+            import traceback
+            console.print(f"[red]{traceback.format_exc()}[/red]")
+        raise click.ClickException(str(e))
+
+
+
+@api_monitors_group.command(name='bulk-create')
+
+@click.argument('file', type=click.File('r'), default='-')
+@click.option('--format', 'input_format', type=click.Choice(['auto', 'ndjson', 'csv']), 
+              default='auto', help='Input format (detected from the file extension by default)')
+@click.option('--concurrency', '-j', type=click.IntRange(1), default=8, help='Maximum concurrent requests')
+@click.option('--resume', metavar='JOB_ID', help='Continue an interrupted job, skipping the items it completed')
+@click.option('--async', 'use_async', is_flag=True, help='Run on the asyncio engine (needs aiohttp)')
+
+@click.pass_context
+def bulk_create_api_monitors(ctx, **kwargs):
+    """Create API Monitors in bulk from an NDJSON or CSV file (or stdin)"""
+    try:
+        command = MonitorManagementCommand()
+        output_format = ctx.obj.get('output_format', 'table')
+        stats = command.bulk_create_api_monitors(output_format=output_format, **kwargs)
+        
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        if ctx.obj.get('verbose'):
+            import traceback
+            console.print(f"[red]{traceback.format_exc()}[/red]")
+        raise click.ClickException(str(e))
+    
+    if stats.failed:
+        raise click.ClickException(f"{stats.failed} of {stats.succeeded + stats.failed} records failed")
+
+
+
+@api_monitors_group.command(name='bulk-update')
+
+@click.option('--status', type=click.Choice(['up', 'down', 'trouble', 'critical', 'suspended']), 
+              help='Select by status')
+@click.option('--group-id', type=str, help='Select by monitor group ID')
+@click.option('--name-pattern', type=str, help='Select by display name (shell-style pattern)')
+@click.option('--ids-file', type=click.File('r'), help='File with one ID per line (- for stdin)')
+@click.option('--config', '-c', type=click.File('r'), help='Configuration file (JSON)')
+@click.option('--param', '-p', multiple=True, help='Parameters in key=value format')
+@click.option('--concurrency', '-j', type=click.IntRange(1), default=8, help='Maximum concurrent requests')
+@click.option('--resume', metavar='JOB_ID', help='Continue an interrupted job, skipping the items it completed')
+@click.option('--async', 'use_async', is_flag=True, help='Run on the asyncio engine (needs aiohttp)')
+@click.option('--force', '-f', is_flag=True, help='Update without confirmation')
+
+@click.pass_context
+def bulk_update_api_monitors(ctx, **kwargs):
+    """Update every API Monitors matching a filter"""
+    try:
+        command = MonitorManagementCommand()
+        output_format = ctx.obj.get('output_format', 'table')
+        stats = command.bulk_update_api_monitors(output_format=output_format, **kwargs)
+        
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        if ctx.obj.get('verbose'):
+            import traceback
+            console.print(f"[red]{traceback.format_exc()}[/red]")
+        raise click.ClickException(str(e))
+    
+    if stats.failed:
+        raise click.ClickException(f"{stats.failed} of {stats.succeeded + stats.failed} operations failed")
+
+
+
+
+@api_monitors_group.command(name='bulk-delete')
+
+@click.option('--status', type=click.Choice(['up', 'down', 'trouble', 'critical', 'suspended']), 
+              help='Select by status')
+@click.option('--group-id', type=str, help='Select by monitor group ID')
+@click.option('--name-pattern', type=str, help='Select by display name (shell-style pattern)')
+@click.option('--ids-file', type=click.File('r'), help='File with one ID per line (- for stdin)')
+@click.option('--concurrency', '-j', type=click.IntRange(1), default=8, help='Maximum concurrent requests')
+@click.option('--resume', metavar='JOB_ID', help='Continue an interrupted job, skipping the items it completed')
+@click.option('--async', 'use_async', is_flag=True, help='Run on the asyncio engine (needs aiohttp)')
+@click.option('--force', '-f', is_flag=True, help='Force deletion without confirmation')
+
+@click.pass_context
+def bulk_delete_api_monitors(ctx, **kwargs):
+    """Delete every API Monitors matching a filter"""
+    try:
+        command = MonitorManagementCommand()
+        output_format = ctx.obj.get('output_format', 'table')
+        stats = command.bulk_delete_api_monitors(output_format=output_format, **kwargs)
+        
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        if ctx.obj.get('verbose'):
+            import traceback
+            console.print(f"[red]{traceback.format_exc()}[/red]")
+        raise click.ClickException(str(e))
+    
+    if stats.failed:
+        raise click.ClickException(f"{stats.failed} of {stats.succeeded + stats.failed} operations failed")
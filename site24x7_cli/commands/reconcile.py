@@ -0,0 +1,122 @@
+"""
+Site24x7 CLI - Plan/Apply Commands
+
+This module reconciles monitors with a desired-state file kept under
+version control: 'plan' shows the creates, updates and deletes needed and
+'apply' makes them.
+"""
+
+import click
+from typing import Dict, Any, List, Optional
+from rich.console import Console
+
+from site24x7_cli.base import BaseCommand
+from site24x7_cli.bulk import BulkStats
+from site24x7_cli.reconcile import MONITOR_TYPES, Change, apply_change, load_desired, plan
+
+console = Console()
+
+
+class ReconcileCommand(BaseCommand):
+    """Command class for desired-state reconciliation"""
+    
+    def __init__(self):
+        super().__init__()
+        self.category = "reconcile"
+    
+    def plan(self, file: Any, key: Optional[str] = None, prune: bool = False,
+             page_size: int = 200, **kwargs) -> List[Change]:
+        """Fetch the live inventory once and compute the changes needed"""
+        desired = load_desired(file)
+        if key:
+            desired['key'] = key
+        live = {monitor_type: self.client.iter_pages(MONITOR_TYPES[monitor_type],
+                                                     page_size=page_size, key=monitor_type)
+                for monitor_type in desired['monitors']}
+        return plan(desired, live, prune)
+    
+    def apply(self, changes: List[Change], concurrency: int = 8,
+              output_format: str = 'table') -> BulkStats:
+        """Make the planned changes in parallel"""
+        return self.run_bulk(lambda change: apply_change(self.client, change), changes,
+                             concurrency, output_format, label='change', journal=False)
+
+
+def _summary(changes: List[Change]) -> str:
+    counts = {action: sum(1 for c in changes if c.action == action)
+              for action in ('create', 'update', 'delete')}
+    return f"{counts['create']} to create, {counts['update']} to update, {counts['delete']} to delete"
+
+
+def _options(func):
+    func = click.option('--page-size', type=click.IntRange(1), default=200,
+                        help='Records fetched per API page')(func)
+    func = click.option('--prune', is_flag=True,
+                        help='Delete live monitors that the file does not define')(func)
+    func = click.option('--key', help='Field matching definitions to live monitors '
+                                      '(default: the file\'s "key", or display_name)')(func)
+    func = click.option('--file', '-f', 'file', type=click.File('r'), required=True,
+                        help='Desired-state file (YAML or JSON)')(func)
+    return func
+
+
+@click.command(name='plan')
+@_options
+@click.pass_context
+def plan_command(ctx, **kwargs):
+    """Show the changes 'apply' would make, without making them"""
+    try:
+        command = ReconcileCommand()
+        changes = command.plan(**kwargs)
+
+        output_format = ctx.obj.get('output_format', 'table')
+        if changes or output_format != 'table':
+            command.format_output([change.as_row() for change in changes], output_format)
+        click.echo(_summary(changes), err=True)
+
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        if ctx.obj.get('verbose'):
+            import traceback
+            console.print(f"[red]{traceback.format_exc()}[/red]")
+        raise click.ClickException(str(e))
+
+
+@click.command(name='apply')
+@_options
+@click.option('--concurrency', '-j', type=click.IntRange(1), default=8, help='Changes made in parallel')
+@click.option('--yes', '-y', '--force', 'yes', is_flag=True, help='Delete (with --prune) without confirmation')
+@click.pass_context
+def apply_command(ctx, concurrency, yes, **kwargs):
+    """Create, update and (with --prune) delete monitors to match a desired-state file
+
+    The live inventory is fetched once; monitors whose normalised config
+    already matches the file are left alone. The planned changes are shown
+    first, and deletes are confirmed unless --yes is given.
+    """
+    try:
+        command = ReconcileCommand()
+        changes = command.plan(**kwargs)
+
+        output_format = ctx.obj.get('output_format', 'table')
+        deletes = sum(1 for change in changes if change.action == 'delete')
+        confirm = deletes and not yes
+        if changes and (output_format == 'table' or confirm):
+            command.format_output([change.as_row() for change in changes], output_format)
+        click.echo(_summary(changes), err=True)
+        if confirm:
+            click.confirm(f'Delete {deletes} monitors?', abort=True, err=True)
+
+        stats = command.apply(changes, concurrency, output_format) if changes else None
+
+    except click.Abort:
+        raise
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        if ctx.obj.get('verbose'):
+            import traceback
+            console.print(f"[red]{traceback.format_exc()}[/red]")
+        raise click.ClickException(str(e))
+
+    if stats and stats.failed:
+        raise click.ClickException(f"{stats.failed} of {stats.succeeded + stats.failed} changes failed")
@@ -6,14 +6,23 @@ This module provides CLI commands for Manage Reports.
 """
 
 import click
+import itertools
 import json
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from rich.console import Console
 from rich.table import Table
 
+from site24x7_cli.aggregate import ReportAggregator
 from site24x7_cli.base import BaseCommand, Site24x7Client
+from site24x7_cli.bulk import read_ids, record_id, run_bulk
+from site24x7_cli.commands.sync import MIRRORED_TYPES
 from site24x7_cli.exceptions import Site24x7CLIError, APIError
+from site24x7_cli.mirror import InventoryMirror
+from site24x7_cli.query import Query
+from site24x7_cli.report_store import ReportStore
 from site24x7_cli.utils import validate_monitor_id, format_timestamp, parse_key_value_pairs
+from site24x7_cli.windows import (WINDOW_SIZES, fetch_windows, format_time, parse_time,
+                                  report_samples, split_windows)
 
 console = Console()
 
@@ -24,6 +33,234 @@ class ReportsCommand(BaseCommand):
     def __init__(self):
         super().__init__()
         self.category = "reports"
+    
+    def list_performance_reports(self, limit: int = 50, offset: int = 0, 
+                                  status: Optional[str] = None, 
+                                  group_id: Optional[str] = None, 
+                                  where: Optional[str] = None, 
+                                  fetch_all: bool = False, prefetch: int = 2, **kwargs) -> List[Dict[str, Any]]:
+        """List performance-reports"""
+        query = Query(where) if where else None
+        params = {'limit': limit, 'offset': offset}
+        
+        if status:
+            params['status'] = status
+        if group_id:
+            params['group_id'] = group_id
+        if query:
+            params = dict(query.pushdown(), **params)
+        
+        endpoint = "/api/performance-reports"
+        if fetch_all:
+            records = self.client.iter_pages(endpoint, params, page_size=limit, offset=offset,
+                                             prefetch=prefetch, key='performance-reports',
+                                             fields=self.fetch_fields(query))
+            return query.filter(records) if query else records
+        
+        records = self.client.get_records(endpoint, params, key='performance-reports',
+                                          fields=self.fetch_fields(query))
+        return [record for record in records if query(record)] if query else records
+    
+    def get_performance_reports(self, ids: Tuple[str, ...] = (), ids_file: Optional[Any] = None, 
+                                    concurrency: int = 8, unordered: bool = False, 
+                                    start: Optional[str] = None, end: Optional[str] = None, 
+                                    window: str = 'day', window_concurrency: int = 4, 
+                                    store: bool = True, **kwargs) -> Any:
+        """Get performance-reports by ID, fetching several monitors concurrently"""
+        ids = self.collect_ids(ids, ids_file)
+        if len(ids) == 1 and ids_file is None:
+            return self.fetch_performance_reports(ids[0], start, end, window, window_concurrency, store)
+        
+        def fetch(id: str) -> Dict[str, Any]:
+            report = self.fetch_performance_reports(id, start, end, window, window_concurrency, store)
+            if isinstance(report, dict):
+                return dict({'monitor_id': id}, **report)
+            return {'monitor_id': id, 'samples': list(report)}
+        
+        if start or end:
+            # Each monitor fetches its windows in parallel too
+            self.client.size_pool(concurrency * window_concurrency)
+        return self.get_many(fetch, ids, concurrency, unordered)
+    
+    def fetch_performance_reports(self, id: str, start: Optional[str] = None, end: Optional[str] = None, 
+                                      window: str = 'day', concurrency: int = 4, 
+                                      store: bool = True) -> Any:
+        """Get specific performance-reports by ID"""
+        if not validate_monitor_id(id):
+            raise ValueError(f"Invalid ID format: {id}")
+        
+        endpoint = f"/api/performance-reports/{id}"
+        
+        # Long periods are fetched as parallel windows and streamed in time order
+        if start or end:
+            if not (start and end):
+                raise ValueError("--from and --to must be used together")
+            start, end = parse_time(start), parse_time(end)
+            if end <= start:
+                raise ValueError("--to must be later than --from")
+            self.client.size_pool(concurrency)
+            
+            def fetch(window_start, window_end) -> List[Any]:
+                params = {'start_date': format_time(window_start), 'end_date': format_time(window_end)}
+                return report_samples(self.client.get(endpoint, params=params))
+            
+            if not store:
+                return fetch_windows(fetch, split_windows(start, end, WINDOW_SIZES[window]), concurrency)
+            
+            # Only request the parts of the period the local store does not cover yet;
+            # recent samples that may still change are fetched every time, never stored
+            report_store = ReportStore(profile=self.profile)
+            settled = max(start, min(end, report_store.settled_until()))
+            for gap_start, gap_end in report_store.missing(id, start, settled):
+                windows = split_windows(gap_start, gap_end, WINDOW_SIZES[window])
+                report_store.append(id, gap_start, gap_end, fetch_windows(fetch, windows, concurrency))
+            samples = report_store.read(id, start, settled)
+            if settled < end:
+                recent = split_windows(settled, end, WINDOW_SIZES[window])
+                samples = itertools.chain(samples, fetch_windows(fetch, recent, concurrency))
+            return samples
+        
+        response = self.client.get(endpoint)
+        
+        if 'data' in response:
+            return response['data']
+        return response
+    
+    def create_performance_reports(self, name: str, config: Optional[Any] = None, 
+                                    param: List[str] = None, **kwargs) -> Dict[str, Any]:
+        """Create new performance-reports"""
+        data = {'display_name': name}
+        
+        # Load configuration from file if provided
+        if config:
+            config_data = json.load(config)
+            data.update(config_data)
+        
+        # Parse additional parameters
+        if param:
+            additional_params = parse_key_value_pairs(param)
+            data.update(additional_params)
+        
+        # Add default required fields based on monitor type
+        if 'monitor' in "performance-reports":
+            data.setdefault('monitor_type', 'PERFORMANCE-REPORTS')
+            data.setdefault('check_frequency', '5')
+            data.setdefault('timeout', '30')
+        
+        endpoint = "/api/performance-reports"
+        response = self.client.post(endpoint, data=data)
+        
+        if 'data' in response:
+            return response['data']
+        return response
+    
+    def update_performance_reports(self, id: str, name: Optional[str] = None, 
+                                    config: Optional[Any] = None, 
+                                    param: List[str] = None, **kwargs) -> Dict[str, Any]:
+        """Update performance-reports"""
+        if not validate_monitor_id(id):
+            raise ValueError(f"Invalid ID format: {id}")
+        
+        data = {}
+        
+        if name:
+            data['display_name'] = name
+        
+        # Load configuration from file if provided
+        if config:
+            config_data = json.load(config)
+            data.update(config_data)
+        
+        # Parse additional parameters
+        if param:
+            additional_params = parse_key_value_pairs(param)
+            data.update(additional_params)
+        
+        if not data:
+            raise ValueError("No update parameters provided")
+        
+        endpoint = f"/api/performance-reports/{id}"
+        response = self.client.put(endpoint, data=data)
+        
+        if 'data' in response:
+            return response['data']
+        return response
+    
+    def delete_performance_reports(self, id: str, force: bool = False, **kwargs) -> Dict[str, Any]:
+        """Delete performance-reports"""
+        if not validate_monitor_id(id):
+            raise ValueError(f"Invalid ID format: {id}")
+        
+        if not force:
+            click.confirm(f'Are you sure you want to delete performance-reports {id}?', abort=True)
+        
+        endpoint = f"/api/performance-reports/{id}"
+        response = self.client.delete(endpoint)
+        
+        return response
+    
+    def aggregate_performance_reports(self, monitor_id: List[str] = (), ids_file: Optional[Any] = None, 
+                                          group_id: Optional[str] = None, period: Optional[str] = None, 
+                                          concurrency: int = 16, use_async: bool = False, 
+                                          **kwargs) -> List[Dict[str, Any]]:
+        """Fetch performance-reports concurrently and summarise them"""
+        targets = {id: (None, None) for id in monitor_id}
+        if ids_file:
+            targets.update({id: (None, None) for id in read_ids(ids_file)})
+        if group_id:
+            members = self._group_members(group_id)
+            if not members:
+                raise ValueError(f"No monitors in group {group_id}")
+            targets.update(members)
+        
+        if not targets:
+            raise ValueError("Specify --monitor-id, --ids-file or --group-id")
+        
+        params = {'period': period} if period else {}
+        
+        def fetch(id: str) -> Dict[str, Any]:
+            return self.client.get(f"/api/performance-reports/{id}", params=params)
+        
+        async def fetch_async(client: 'AsyncSite24x7Client', id: str) -> Dict[str, Any]:
+            return await client.get(f"/api/performance-reports/{id}", params=params)
+        
+        if use_async:
+            # Loaded only when asked for: importing the async engine loads aiohttp
+            from site24x7_cli.async_client import run_bulk_async
+            
+            results = run_bulk_async(fetch_async, targets, concurrency, **self.async_client_options())
+        else:
+            self.client.size_pool(concurrency)
+            results = run_bulk(fetch, targets, concurrency)
+        
+        aggregator = ReportAggregator()
+        for result in results:
+            if not result.ok:
+                console.print(f"[yellow]Skipping {result.item}: {result.error}[/yellow]")
+                continue
+            name, group = targets[result.item]
+            aggregator.add(result.item, result.result, name, group)
+        
+        return aggregator.rows()
+    
+    def _group_members(self, group_id: str) -> Dict[str, Tuple[Optional[str], str]]:
+        """Monitors of a group from the local mirror, or from the API when the mirror has none"""
+        mirror = InventoryMirror(account=self.profile)
+        try:
+            records = list(mirror.query(group_id=group_id))
+        finally:
+            mirror.close()
+        
+        if not records:
+            for monitor_type, endpoint in MIRRORED_TYPES.items():
+                for record in self.client.iter_pages(endpoint, {'group_id': group_id},
+                                                     page_size=200, key=monitor_type):
+                    groups = [record.get('group_id')] + list(record.get('monitor_groups') or [])
+                    if group_id in (str(group) for group in groups if group is not None):
+                        records.append(record)
+        
+        return {record_id(record): (record.get('display_name'), group_id)
+                for record in records if record_id(record)}
 
 
 @click.group(name='reports')
@@ -36,26 +273,29 @@ def reports_group(ctx):
 
 @reports_group.group(name='performance-reports')
 @click.pass_context
-def performance-reports_group(ctx):
+def performance_reports_group(ctx):
     """Manage Performance Reports operations"""
     pass
 
 
 
-@performance-reports_group.command(name='list')
+@performance_reports_group.command(name='list')
 
-@click.option('--limit', '-l', type=int, default=50, help='Number of items to retrieve')
-@click.option('--offset', type=int, default=0, help='Offset for pagination')
+@click.option('--limit', '-l', type=click.IntRange(1), default=50, help='Number of items to retrieve')
+@click.option('--offset', type=click.IntRange(0), default=0, help='Offset for pagination')
 @click.option('--status', type=click.Choice(['up', 'down', 'trouble', 'critical', 'suspended']), 
               help='Filter by status')
 @click.option('--group-id', type=str, help='Filter by monitor group ID')
+@click.option('--where', '-w', help='Filter expression, e.g. "status == down and display_name ~ ^web"')
+@click.option('--all', 'fetch_all', is_flag=True, help='Stream every page, starting at --offset')
+@click.option('--prefetch', type=click.IntRange(0), default=2, help='Pages to fetch ahead when using --all')
 
 @click.pass_context
-def list(ctx, **kwargs):
+def list_performance_reports(ctx, **kwargs):
     """List all Performance Reports"""
     try:
         command = ReportsCommand()
-        result = command.list_performance-reports(**kwargs)
+        result = command.list_performance_reports(**kwargs)
         
         output_format = ctx.obj.get('output_format', 'table')
         command.format_output(result, output_format)
@@ -69,16 +309,28 @@ def list(ctx, **kwargs):
 
 
 
-@performance-reports_group.command(name='get')
+@performance_reports_group.command(name='get')
 
-@click.argument('id', required=True)
+@click.argument('ids', nargs=-1)
+@click.option('--ids-file', type=click.File('r'), help='File with one monitor ID per line (- for stdin)')
+@click.option('--concurrency', '-j', '--parallel', 'concurrency', type=click.IntRange(1), default=8, 
+              help='Monitors fetched concurrently')
+@click.option('--unordered', is_flag=True, help='Output results as they arrive instead of in input order')
+@click.option('--from', 'start', type=str, help='Start of the period (ISO 8601 or epoch seconds)')
+@click.option('--to', 'end', type=str, help='End of the period (ISO 8601 or epoch seconds)')
+@click.option('--window', type=click.Choice(['hour', 'day']), default='day', 
+              help='Size of the chunks a --from/--to period is fetched in')
+@click.option('--window-concurrency', type=click.IntRange(1), default=4, 
+              help='Chunks of a --from/--to period fetched in parallel per monitor')
+@click.option('--store/--no-store', default=True, 
+              help='Serve --from/--to periods from the local report store, fetching only new data')
 
 @click.pass_context
-def get(ctx, **kwargs):
-    """Get specific Performance Reports by ID"""
+def get_performance_reports(ctx, **kwargs):
+    """Get specific Performance Reports by ID (several IDs are fetched concurrently)"""
     try:
         command = ReportsCommand()
-        result = command.get_performance-reports(**kwargs)
+        result = command.get_performance_reports(**kwargs)
         
         output_format = ctx.obj.get('output_format', 'table')
         command.format_output(result, output_format)
@@ -89,21 +341,25 @@ def get(ctx, **kwargs):
             import traceback
             console.print(f"[red]{traceback.format_exc()}[/red]")
         raise click.ClickException(str(e))
+    
+    stats = command.fetch_stats
+    if stats and stats.failed:
+        raise click.ClickException(f"{stats.failed} of {stats.succeeded + stats.failed} IDs failed")
 
 
 
-@performance-reports_group.command(name='create')
+@performance_reports_group.command(name='create')
 
 @click.option('--name', '-n', required=True, help='Performance-Reports name')
 @click.option('--config', '-c', type=click.File('r'), help='Configuration file (JSON)')
 @click.option('--param', '-p', multiple=True, help='Parameters in key=value format')
 
 @click.pass_context
-def create(ctx, **kwargs):
+def create_performance_reports(ctx, **kwargs):
     """Create new Performance Reports"""
     try:
         command = ReportsCommand()
-        result = command.create_performance-reports(**kwargs)
+        result = command.create_performance_reports(**kwargs)
         
         output_format = ctx.obj.get('output_format', 'table')
         command.format_output(result, output_format)
@@ -117,7 +373,7 @@ def create(ctx, **kwargs):
 
 
 
-@performance-reports_group.command(name='update')
+@performance_reports_group.command(name='update')
 
 @click.argument('id', required=True)
 @click.option('--name', '-n', help='New name')
@@ -125,11 +381,11 @@ def create(ctx, **kwargs):
 @click.option('--param', '-p', multiple=True, help='Parameters in key=value format')
 
 @click.pass_context
-def update(ctx, **kwargs):
+def update_performance_reports(ctx, **kwargs):
     """Update Performance Reports"""
     try:
         command = ReportsCommand()
-        result = command.update_performance-reports(**kwargs)
+        result = command.update_performance_reports(**kwargs)
         
         output_format = ctx.obj.get('output_format', 'table')
         command.format_output(result, output_format)
@@ -143,17 +399,17 @@ def update(ctx, **kwargs):
 
 
 
-@performance-reports_group.command(name='delete')
+@performance_reports_group.command(name='delete')
 
 @click.argument('id', required=True)
 @click.option('--force', '-f', is_flag=True, help='Force deletion without confirmation')
 
 @click.pass_context
-def delete(ctx, **kwargs):
+def delete_performance_reports(ctx, **kwargs):
     """Delete Performance Reports"""
     try:
         command = ReportsCommand()
-        result = command.delete_performance-reports(**kwargs)
+        result = command.delete_performance_reports(**kwargs)
         
         output_format = ctx.obj.get('output_format', 'table')
         command.format_output(result, output_format)
@@ -167,126 +423,28 @@ def delete(ctx, **kwargs):
 
 
 
+@performance_reports_group.command(name='aggregate')
 
+@click.option('--monitor-id', '-m', multiple=True, help='Monitor ID to include (repeatable)')
+@click.option('--ids-file', type=click.File('r'), help='File with one monitor ID per line (- for stdin)')
+@click.option('--group-id', type=str, help='Include every monitor of a group (from the local mirror, else the API)')
+@click.option('--period', type=str, help='Report period passed to the API')
+@click.option('--concurrency', '-j', type=click.IntRange(1), default=16, help='Maximum concurrent requests')
+@click.option('--async', 'use_async', is_flag=True, help='Fetch on the asyncio engine (needs aiohttp)')
 
-# Implementation methods for ReportsCommand class
-
-
-    def list_performance-reports(self, limit: int = 50, offset: int = 0, 
-                                  status: Optional[str] = None, 
-                                  group_id: Optional[str] = None, **kwargs) -> List[Dict[str, Any]]:
-        """List performance-reports"""
-        params = {'limit': limit, 'offset': offset}
-        
-        if status:
-            params['status'] = status
-        if group_id:
-            params['group_id'] = group_id
-        
-        endpoint = "/api/performance-reports"
-        response = self.client.get(endpoint, params=params)
-        
-        if 'data' in response:
-            return response['data']
-        return response.get('performance-reports', [])
-
-    def get_performance-reports(self, id: str, **kwargs) -> Dict[str, Any]:
-        """Get specific performance-reports by ID"""
-        if not validate_monitor_id(id):
-            raise ValueError(f"Invalid ID format: {id}")
-        
-        endpoint = f"/api/performance-reports/{id}"
-        response = self.client.get(endpoint)
-        
-        if 'data' in response:
-            return response['data']
-        return response
-
-    def create_performance-reports(self, name: str, config: Optional[Any] = None, 
-                                    param: List[str] = None, **kwargs) -> Dict[str, Any]:
-        """Create new performance-reports"""
-        data = {'display_name': name}
-        
-        # Load configuration from file if provided
-        if config:
-            config_data = json.load(config)
-            data.update(config_data)
-        
-        # Parse additional parameters
-        if param:
-            additional_params = parse_key_value_pairs(param)
-            data.update(additional_params)
-        
-        # Add default required fields based on monitor type
-        if 'monitor' in "performance-reports":
-            data.setdefault('monitor_type', 'PERFORMANCE-REPORTS')
-            data.setdefault('check_frequency', '5')
-            data.setdefault('timeout', '30')
-        
-        endpoint = "/api/performance-reports"
-        response = self.client.post(endpoint, data=data)
-        
-        if 'data' in response:
-            return response['data']
-        return response
-
-    def update_performance-reports(self, id: str, name: Optional[str] = None, 
-                                    config: Optional[Any] = None, 
-                                    param: List[str] = None, **kwargs) -> Dict[str, Any]:
-        """Update performance-reports"""
-        if not validate_monitor_id(id):
-            raise ValueError(f"Invalid ID format: {id}")
-        
-        data = {}
-        
-        if name:
-            data['display_name'] = name
-        
-        # Load configuration from file if provided
-        if config:
-            config_data = json.load(config)
-            data.update(config_data)
-        
-        # Parse additional parameters
-        if param:
-            additional_params = parse_key_value_pairs(param)
-            data.update(additional_params)
-        
-        if not data:
-            raise ValueError("No update parameters provided")
-        
-        endpoint = f"/api/performance-reports/{id}"
-        response = self.client.put(endpoint, data=data)
-        
-        if 'data' in response:
-            return response['data']
-        return response
-
-    def delete_performance-reports(self, id: str, force: bool = False, **kwargs) -> Dict[str, Any]:
-        """Delete performance-reports"""
-        if not validate_monitor_id(id):
-            raise ValueError(f"Invalid ID format: {id}")
-        
-        if not force:
-            click.confirm(f'Are you sure you want to delete performance-reports {id}?', abort=True)
+@click.pass_context
+def aggregate_performance_reports(ctx, **kwargs):
+    """Summarise Performance Reports per monitor and per group"""
+    try:
+        command = ReportsCommand()
+        result = command.aggregate_performance_reports(**kwargs)
         
-        endpoint = f"/api/performance-reports/{id}"
-        response = self.client.delete(endpoint)
+        output_format = ctx.obj.get('output_format', 'table')
+        command.format_output(result, output_format)
         
-        return response
-
-
-
-# Add methods to the command class
-
-setattr(ReportsCommand, 'list_performance-reports', 
-        ReportsCommand.__dict__['list_performance-reports'])
-setattr(ReportsCommand, 'get_performance-reports', 
-        ReportsCommand.__dict__['get_performance-reports'])
-setattr(ReportsCommand, 'create_performance-reports', 
-        ReportsCommand.__dict__['create_performance-reports'])
-setattr(ReportsCommand, 'update_performance-reports', 
-        ReportsCommand.__dict__['update_performance-reports'])
-setattr(ReportsCommand, 'delete_performance-reports', 
-        ReportsCommand.__dict__['delete_performance-reports'])
-
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        if ctx.obj.get('verbose'):
+            import traceback
+            console.print(f"[red]{traceback.format_exc()}[/red]")
+        raise click.ClickException(str(e))
@@ -0,0 +1,122 @@
+"""
+Site24x7 CLI - Status Commands
+
+This module provides commands that follow /current_status over time.
+"""
+
+import time
+from datetime import datetime, timezone
+
+import click
+from typing import Dict, Any, Optional
+from rich.console import Console
+
+from site24x7_cli.base import BaseCommand
+from site24x7_cli.output import get_sink
+from site24x7_cli.watch import AdaptiveInterval, FlapDetector, diff_snapshots, snapshot
+
+console = Console()
+
+
+class StatusCommand(BaseCommand):
+    """Command class for current status operations"""
+    
+    def __init__(self):
+        super().__init__()
+        self.category = "status"
+    
+    def current_status(self) -> Dict[str, Dict[str, str]]:
+        """Fetch /current_status, bypassing the response cache"""
+        return snapshot(self.client.request('GET', '/current_status'))
+    
+    def watch(self, min_interval: float = 5.0, max_interval: float = 120.0,
+              flap_threshold: int = 3, flap_window: float = 600.0,
+              count: Optional[int] = None, output_format: str = 'table', **kwargs) -> None:
+        """Poll /current_status and print only state transitions
+        
+        A failed poll is reported on stderr and retried after a backed-off
+        delay, so a transient API error does not end the watch.
+        """
+        interval = AdaptiveInterval(min_interval, max_interval)
+        flaps = FlapDetector(flap_threshold, flap_window)
+        sink = None if output_format == 'table' else get_sink(output_format)
+        previous = None
+        polls = 0
+        
+        try:
+            while True:
+                polls += 1
+                try:
+                    current = self.current_status()
+                except Exception as e:
+                    delay = interval.next(False)
+                    click.echo(click.style(f'Poll failed: {e} (retrying in {delay:.1f}s)',
+                                           fg='yellow'), err=True)
+                    if count is not None and polls >= count:
+                        break
+                    time.sleep(delay)
+                    continue
+                
+                transitions = [] if previous is None else diff_snapshots(previous, current)
+                previous = current
+                flapping = set(flaps.record(transitions))
+                
+                timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+                for transition in transitions:
+                    transition['time'] = timestamp
+                    transition['flapping'] = transition['monitor_id'] in flapping
+                    if sink is None:
+                        self._print_transition(transition)
+                    else:
+                        sink.write(transition)
+                        sink.stream.flush()
+                
+                if count is not None and polls >= count:
+                    break
+                time.sleep(interval.next(bool(transitions), bool(flapping)))
+        finally:
+            if sink is not None:
+                sink.close()
+    
+    @staticmethod
+    def _print_transition(transition: Dict[str, Any]) -> None:
+        colors = {'up': 'green', 'down': 'red', 'critical': 'red', 'trouble': 'yellow'}
+        old_status = transition['from'] or 'new'
+        new_status = transition['to'] or 'removed'
+        line = (f"{transition['time']}  {transition['name']} ({transition['monitor_id']}): "
+                f"{old_status} → {new_status}")
+        if transition['flapping']:
+            line += '  [flapping]'
+        click.echo(click.style(line, fg=colors.get(transition['to'])))
+
+
+@click.group(name='status')
+@click.pass_context
+def status_group(ctx):
+    """Follow monitor status over time"""
+    pass
+
+
+@status_group.command(name='watch')
+@click.option('--min-interval', type=float, default=5.0, help='Shortest delay between polls (s)')
+@click.option('--max-interval', type=float, default=120.0, help='Longest delay between polls (s)')
+@click.option('--flap-threshold', type=int, default=3,
+              help='Transitions within --flap-window that mark a monitor as flapping')
+@click.option('--flap-window', type=float, default=600.0, help='Flap detection window (s)')
+@click.option('--count', type=int, help='Stop after this many polls')
+@click.pass_context
+def watch(ctx, **kwargs):
+    """Print monitor state transitions as they happen"""
+    try:
+        command = StatusCommand()
+        output_format = ctx.obj.get('output_format', 'table')
+        command.watch(output_format=output_format, **kwargs)
+        
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        if ctx.obj.get('verbose'):
+            import traceback
+            console.print(f"[red]{traceback.format_exc()}[/red]")
+        raise click.ClickException(str(e))
@@ -0,0 +1,66 @@
+"""
+Site24x7 CLI - Sync Commands
+
+This module mirrors the monitor inventory into a local SQLite database so
+list commands can answer from it with --local.
+"""
+
+import click
+from typing import Dict, Any, Optional, List
+from rich.console import Console
+
+from site24x7_cli.base import BaseCommand
+from site24x7_cli.mirror import InventoryMirror
+
+console = Console()
+
+# Monitor types mirrored by default, with their list endpoints
+MIRRORED_TYPES = {
+    'website-monitors': '/api/website-monitors',
+    'api-monitors': '/api/api-monitors',
+}
+
+
+class SyncCommand(BaseCommand):
+    """Command class for inventory mirror operations"""
+    
+    def __init__(self):
+        super().__init__()
+        self.category = "sync"
+    
+    def sync(self, monitor_types: List[str], db: Optional[str] = None,
+             page_size: int = 200, **kwargs) -> List[Dict[str, Any]]:
+        """Mirror each monitor type into the local database"""
+        mirror = InventoryMirror(db, account=self.profile)
+        try:
+            results = []
+            for monitor_type in monitor_types:
+                records = self.client.iter_pages(MIRRORED_TYPES[monitor_type], page_size=page_size,
+                                                 key=monitor_type)
+                results.append(mirror.sync(monitor_type, records))
+            return results
+        finally:
+            mirror.close()
+
+
+@click.command(name='sync')
+@click.option('--type', 'monitor_types', multiple=True, type=click.Choice(list(MIRRORED_TYPES)),
+              help='Monitor type to mirror (repeatable, default: all)')
+@click.option('--db', type=click.Path(dir_okay=False), help='Mirror database path')
+@click.option('--page-size', type=click.IntRange(1), default=200, help='Records fetched per API page')
+@click.pass_context
+def sync(ctx, monitor_types, **kwargs):
+    """Mirror the monitor inventory into a local SQLite database"""
+    try:
+        command = SyncCommand()
+        result = command.sync(list(monitor_types or MIRRORED_TYPES), **kwargs)
+        
+        output_format = ctx.obj.get('output_format', 'table')
+        command.format_output(result, output_format)
+        
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        if ctx.obj.get('verbose'):
+            import traceback
+            console.print(f"[red]{traceback.format_exc()}[/red]")
+        raise click.ClickException(str(e))
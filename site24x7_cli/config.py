@@ -3,19 +3,51 @@ Configuration management for Site24x7 CLI
 """
 
 import os
-from typing import Optional
+import re
+from typing import Dict, Optional
+
+from site24x7_cli.exceptions import ValidationError
+
+# Profile names become directory names, so they may not hold path separators
+_PROFILE_NAME = re.compile(r'[A-Za-z0-9_.-]+')
 
 class Config:
     """CLI configuration"""
     
     DEFAULT_BASE_URL = 'https://www.site24x7.com/api'
     DEFAULT_OUTPUT_FORMAT = 'table'
+    DEFAULT_MAX_RETRIES = 3
+    DEFAULT_RATE_LIMIT = 0.0
+    DEFAULT_CACHE_DIR = os.path.expanduser('~/.site24x7/cache')
+    DEFAULT_CACHE_MAX_MB = 50
+    DEFAULT_DATA_DIR = os.path.expanduser('~/.site24x7')
+    DEFAULT_PROFILE = 'default'
+    # Per-profile state, relative to the profile's data directory
+    MIRROR_FILE = 'inventory.db'
+    REPORT_STORE_DIR = 'reports'
+    JOBS_DIR = 'jobs'
+    DAEMON_SOCKET = 'daemon.sock'
+    DEFAULT_POOL_CONNECTIONS = 10
+    DEFAULT_POOL_MAXSIZE = 10
+    DEFAULT_CONNECT_TIMEOUT = 10.0
+    DEFAULT_READ_TIMEOUT = 60.0
+    DEFAULT_PROFILE_CONCURRENCY = 8
     
     @classmethod
     def get_oauth_token(cls) -> Optional[str]:
         """Get OAuth token from environment or config"""
         return os.getenv('SITE24X7_OAUTH_TOKEN')
     
+    @classmethod
+    def get_profile(cls) -> Optional[str]:
+        """Get the credentials profile to use when --profile is not given"""
+        return os.getenv('SITE24X7_PROFILE') or None
+    
+    @classmethod
+    def get_profile_concurrency(cls) -> int:
+        """Get how many profiles a --profiles fan-out runs at once"""
+        return int(os.getenv('SITE24X7_PROFILE_CONCURRENCY', cls.DEFAULT_PROFILE_CONCURRENCY))
+    
     @classmethod
     def get_base_url(cls) -> str:
         """Get API base URL"""
@@ -25,3 +57,117 @@ class Config:
     def get_output_format(cls) -> str:
         """Get default output format"""
         return os.getenv('SITE24X7_OUTPUT_FORMAT', cls.DEFAULT_OUTPUT_FORMAT)
+    
+    @classmethod
+    def get_max_retries(cls) -> int:
+        """Get the number of retries for transient API errors"""
+        return int(os.getenv('SITE24X7_MAX_RETRIES', cls.DEFAULT_MAX_RETRIES))
+    
+    @classmethod
+    def get_rate_limit(cls) -> float:
+        """Get the client-side request rate limit (requests/second, 0 disables)"""
+        return float(os.getenv('SITE24X7_RATE_LIMIT', cls.DEFAULT_RATE_LIMIT))
+    
+    @classmethod
+    def get_cache_enabled(cls) -> bool:
+        """Check whether the GET response cache is enabled"""
+        return os.getenv('SITE24X7_CACHE', '').lower() in ('1', 'true', 'yes', 'on')
+    
+    @classmethod
+    def get_cache_dir(cls) -> str:
+        """Get the response cache directory"""
+        return os.getenv('SITE24X7_CACHE_DIR', cls.DEFAULT_CACHE_DIR)
+    
+    @classmethod
+    def get_cache_max_bytes(cls) -> int:
+        """Get the response cache size limit in bytes"""
+        return int(float(os.getenv('SITE24X7_CACHE_MAX_MB', cls.DEFAULT_CACHE_MAX_MB)) * 1024 * 1024)
+    
+    @classmethod
+    def get_cache_ttls(cls) -> Dict[str, float]:
+        """Get per-endpoint cache TTLs from SITE24X7_CACHE_TTLS (endpoint=seconds,...)"""
+        ttls = {}
+        for pair in os.getenv('SITE24X7_CACHE_TTLS', '').split(','):
+            if '=' in pair:
+                endpoint, seconds = pair.split('=', 1)
+                ttls[endpoint.strip()] = float(seconds)
+        return ttls
+    
+    @classmethod
+    def get_coalesce_enabled(cls) -> bool:
+        """Check whether identical concurrent GETs share one request"""
+        return os.getenv('SITE24X7_COALESCE', 'on').lower() not in ('0', 'false', 'no', 'off')
+    
+    @classmethod
+    def get_profile_dir(cls, profile: Optional[str] = None) -> str:
+        """Get the directory holding a profile's local state
+        
+        The default profile uses ~/.site24x7 itself; named profiles use
+        ~/.site24x7/profiles/<name>, so accounts never share a mirror, report
+        store, job journals or daemon.
+        """
+        if profile in (None, cls.DEFAULT_PROFILE):
+            return cls.DEFAULT_DATA_DIR
+        return os.path.join(cls.DEFAULT_DATA_DIR, 'profiles', cls.validate_profile(profile))
+    
+    @classmethod
+    def validate_profile(cls, profile: str) -> str:
+        """Return ``profile`` if it is a valid profile name, else raise ValidationError"""
+        if not _PROFILE_NAME.fullmatch(profile) or profile in ('.', '..'):
+            raise ValidationError(f"Invalid profile name '{profile}': use only letters, digits, "
+                                  f"'_', '.' and '-'")
+        return profile
+    
+    @classmethod
+    def get_mirror_path(cls, profile: Optional[str] = None) -> str:
+        """Get the path of a profile's local inventory mirror database"""
+        return os.getenv('SITE24X7_MIRROR_PATH') or os.path.join(cls.get_profile_dir(profile),
+                                                                 cls.MIRROR_FILE)
+    
+    @classmethod
+    def get_report_store_dir(cls, profile: Optional[str] = None) -> str:
+        """Get the directory of a profile's local performance report store"""
+        return os.getenv('SITE24X7_REPORT_STORE_DIR') or os.path.join(cls.get_profile_dir(profile),
+                                                                      cls.REPORT_STORE_DIR)
+    
+    @classmethod
+    def get_jobs_dir(cls, profile: Optional[str] = None) -> str:
+        """Get the directory of a profile's bulk job journals"""
+        return os.getenv('SITE24X7_JOBS_DIR') or os.path.join(cls.get_profile_dir(profile),
+                                                              cls.JOBS_DIR)
+    
+    @classmethod
+    def get_daemon_socket(cls, profile: Optional[str] = None) -> str:
+        """Get the Unix socket path of a profile's background daemon"""
+        return os.getenv('SITE24X7_DAEMON_SOCKET') or os.path.join(cls.get_profile_dir(profile),
+                                                                   cls.DAEMON_SOCKET)
+    
+    @classmethod
+    def get_pool_connections(cls) -> int:
+        """Get the number of per-host connection pools kept by the HTTP session"""
+        return int(os.getenv('SITE24X7_POOL_CONNECTIONS', cls.DEFAULT_POOL_CONNECTIONS))
+    
+    @classmethod
+    def get_pool_maxsize(cls) -> int:
+        """Get the maximum number of connections kept open per host"""
+        return int(os.getenv('SITE24X7_POOL_MAXSIZE', cls.DEFAULT_POOL_MAXSIZE))
+    
+    @classmethod
+    def get_connect_timeout(cls) -> float:
+        """Get the connect timeout in seconds (0 disables)"""
+        return float(os.getenv('SITE24X7_CONNECT_TIMEOUT', cls.DEFAULT_CONNECT_TIMEOUT))
+    
+    @classmethod
+    def get_read_timeout(cls) -> float:
+        """Get the read timeout in seconds (0 disables)"""
+        return float(os.getenv('SITE24X7_READ_TIMEOUT', cls.DEFAULT_READ_TIMEOUT))
+    
+    @classmethod
+    def get_compression_enabled(cls) -> bool:
+        """Check whether gzip/deflate response compression is requested"""
+        return os.getenv('SITE24X7_COMPRESSION', 'on').lower() not in ('0', 'false', 'no', 'off')
+    
+    @classmethod
+    def get_tcp_keepalive_enabled(cls) -> bool:
+        """Check whether TCP keep-alive probes are enabled on API connections"""
+        return os.getenv('SITE24X7_TCP_KEEPALIVE', 'on').lower() not in ('0', 'false', 'no', 'off')
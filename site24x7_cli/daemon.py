@@ -0,0 +1,264 @@
+"""
+Background daemon for Site24x7 CLI
+
+The daemon keeps an interpreter with click, rich and requests imported, one
+warmed ``requests.Session`` per token and parsed credentials, and serves CLI
+invocations over a Unix domain socket. ``main`` is the CLI entry point: it
+forwards a command to the daemon when one is running and falls back to
+running it in-process otherwise.
+
+This module is imported on every invocation, so it only uses the stdlib at
+import time.
+"""
+
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from site24x7_cli.config import Config
+from site24x7_cli.exceptions import ValidationError
+
+# Commands that always run in the invoking process
+LOCAL_COMMANDS = {'daemon'}
+
+# Forwarded so that the daemon sees the caller's configuration
+ENV_PREFIX = 'SITE24X7_'
+
+
+class InteractiveInputRequired(BaseException):
+    """Raised when a forwarded command tries to read from stdin
+
+    Derives from BaseException so that command error handlers do not turn it
+    into an ordinary failure; the client re-runs the command locally instead.
+    """
+
+
+class _NoInput(io.TextIOBase):
+    """Daemon stdin: any read means the command must run in the caller's terminal"""
+
+    def read(self, size: int = -1) -> str:
+        raise InteractiveInputRequired()
+
+    def readline(self, size: int = -1) -> str:
+        raise InteractiveInputRequired()
+
+    def isatty(self) -> bool:
+        return False
+
+
+def caller_env() -> Dict[str, str]:
+    """Site24x7 settings from the current environment"""
+    return {key: value for key, value in os.environ.items() if key.startswith(ENV_PREFIX)}
+
+
+def send(message: Dict[str, Any], path: Optional[str] = None, timeout: Optional[float] = None) -> Dict[str, Any]:
+    """Send one request to the daemon and return its reply"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(path or Config.get_daemon_socket())
+        sock.sendall(json.dumps(message).encode('utf-8') + b'\n')
+        sock.shutdown(socket.SHUT_WR)
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    return json.loads(b''.join(chunks).decode('utf-8'))
+
+
+def _profile(args: List[str]) -> Optional[str]:
+    """The profile selected by --account in ``args``, or SITE24X7_PROFILE"""
+    for index, arg in enumerate(args):
+        if arg == '--account' and index + 1 < len(args):
+            return args[index + 1]
+        if arg.startswith('--account='):
+            return arg.split('=', 1)[1]
+    return Config.get_profile()
+
+
+def _reads_stdin(args: List[str]) -> bool:
+    """Whether a command takes its input from stdin ('-' as a file or ID, or bulk-create's default)"""
+    return any(arg == '-' or arg.endswith('=-') for arg in args) or 'bulk-create' in args
+
+
+def forward(args: List[str]) -> Optional[int]:
+    """Run a command through the daemon, or return None to run it locally"""
+    if os.getenv('SITE24X7_NO_DAEMON') or (args and args[0] in LOCAL_COMMANDS):
+        return None
+    # Piped input is not forwarded: commands reading it run here, and any other
+    # read (a prompt, say) makes the daemon hand the command back via 'fallback'
+    if _reads_stdin(args) and not sys.stdin.isatty():
+        return None
+    try:
+        path = Config.get_daemon_socket(_profile(args))
+    except ValidationError:
+        # An invalid --account is reported by the command itself
+        return None
+    if not os.path.exists(path):
+        return None
+
+    try:
+        reply = send({'args': args, 'cwd': os.getcwd(), 'env': caller_env()}, path)
+    except (OSError, ValueError):
+        return None
+
+    if reply.get('fallback'):
+        return None
+    sys.stdout.write(reply.get('stdout', ''))
+    sys.stderr.write(reply.get('stderr', ''))
+    sys.stdout.flush()
+    return reply.get('exit_code', 1)
+
+
+def main() -> None:
+    """CLI entry point"""
+    exit_code = forward(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+    from site24x7_cli.main import cli
+    cli()
+
+
+class _Gate:
+    """Run requests matching the daemon's cwd/environment together, others alone"""
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.active = 0
+        self.exclusive = False
+
+    @contextmanager
+    def shared(self) -> Iterator[None]:
+        with self.condition:
+            while self.exclusive:
+                self.condition.wait()
+            self.active += 1
+        try:
+            yield
+        finally:
+            with self.condition:
+                self.active -= 1
+                self.condition.notify_all()
+
+    @contextmanager
+    def alone(self, cwd: str, env: Dict[str, str]) -> Iterator[None]:
+        with self.condition:
+            while self.exclusive or self.active:
+                self.condition.wait()
+            self.exclusive = True
+        saved_cwd, saved_env = os.getcwd(), caller_env()
+        try:
+            os.chdir(cwd)
+            _replace_env(env)
+            yield
+        finally:
+            os.chdir(saved_cwd)
+            _replace_env(saved_env)
+            with self.condition:
+                self.exclusive = False
+                self.condition.notify_all()
+
+
+def _replace_env(env: Dict[str, str]) -> None:
+    for key in list(os.environ):
+        if key.startswith(ENV_PREFIX) and key not in env:
+            del os.environ[key]
+    os.environ.update(env)
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded Unix socket server executing forwarded CLI commands"""
+
+    daemon_threads = True
+
+    def __init__(self, path: str):
+        self.path = path
+        self.started = time.time()
+        self.served = 0
+        self.gate = _Gate()
+        self.env = caller_env()
+        self.cwd = os.getcwd()
+        if os.path.exists(path):
+            os.remove(path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        old_umask = os.umask(0o077)
+        try:
+            super().__init__(path, _Handler)
+        finally:
+            os.umask(old_umask)
+
+    def execute(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        from site24x7_cli.invoke import run_captured
+
+        command = message.get('command')
+        if command == 'ping':
+            return {'pid': os.getpid(), 'uptime_s': round(time.time() - self.started, 1),
+                    'served': self.served, 'socket': self.path}
+        if command == 'shutdown':
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {'stopping': True}
+
+        self.served += 1
+        cwd = message.get('cwd', self.cwd)
+        env = message.get('env', {})
+        try:
+            if cwd == self.cwd and env == self.env:
+                with self.gate.shared():
+                    return run_captured(message.get('args', []))
+            with self.gate.alone(cwd, env):
+                return run_captured(message.get('args', []))
+        except InteractiveInputRequired:
+            # Prompts come before any change is made, so the caller can simply re-run it
+            return {'fallback': True}
+
+    def server_close(self) -> None:
+        super().server_close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+
+    def handle(self) -> None:
+        try:
+            message = json.loads(self.rfile.readline().decode('utf-8'))
+            reply = self.server.execute(message)
+        except Exception as e:
+            reply = {'exit_code': 1, 'stdout': '', 'stderr': f'Daemon error: {e}\n'}
+        self.wfile.write(json.dumps(reply).encode('utf-8'))
+
+
+def serve(path: Optional[str] = None) -> None:
+    """Run the daemon in the foreground until it is stopped"""
+    from site24x7_cli.base import share_sessions
+    from site24x7_cli.invoke import install_capture
+    from site24x7_cli.main import cli
+
+    # Import every command module now rather than on the first request
+    for name in cli.list_commands(None):
+        try:
+            cli.get_command(None, name)
+        except Exception:
+            pass
+
+    share_sessions()
+    install_capture()
+    sys.stdin = _NoInput()
+    server = DaemonServer(path or Config.get_daemon_socket())
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    serve(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -0,0 +1,147 @@
+"""
+In-process command execution for Site24x7 CLI
+
+Used by the daemon and batch mode to run many CLI commands inside one
+process, each with its own captured stdout/stderr.
+"""
+
+import io
+import json
+import shlex
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import click
+
+
+class ThreadLocalStream(io.TextIOBase):
+    """Text stream that writes to a per-thread buffer when one is active"""
+
+    def __init__(self, fallback):
+        self.fallback = fallback
+        self.local = threading.local()
+
+    @property
+    def target(self):
+        return getattr(self.local, 'buffer', None) or self.fallback
+
+    @property
+    def encoding(self):
+        return getattr(self.fallback, 'encoding', 'utf-8')
+
+    def write(self, text: str) -> int:
+        return self.target.write(text)
+
+    def flush(self) -> None:
+        self.target.flush()
+
+    def isatty(self) -> bool:
+        return self.target is self.fallback and self.fallback.isatty()
+
+    def writable(self) -> bool:
+        return True
+
+
+_install_lock = threading.Lock()
+
+
+def install_capture() -> None:
+    """Route sys.stdout and sys.stderr through thread-local buffers"""
+    with _install_lock:
+        if not isinstance(sys.stdout, ThreadLocalStream):
+            sys.stdout = ThreadLocalStream(sys.stdout)
+        if not isinstance(sys.stderr, ThreadLocalStream):
+            sys.stderr = ThreadLocalStream(sys.stderr)
+
+
+@contextmanager
+def captured_output() -> Iterator[Tuple[io.StringIO, io.StringIO]]:
+    """Capture everything the current thread prints"""
+    install_capture()
+    stdout, stderr = io.StringIO(), io.StringIO()
+    # Captures nest, e.g. a batch script running inside the daemon
+    saved = getattr(sys.stdout.local, 'buffer', None), getattr(sys.stderr.local, 'buffer', None)
+    sys.stdout.local.buffer = stdout
+    sys.stderr.local.buffer = stderr
+    try:
+        yield stdout, stderr
+    finally:
+        sys.stdout.local.buffer, sys.stderr.local.buffer = saved
+
+
+def run_command(args: List[str], obj: Optional[Dict[str, Any]] = None,
+                defaults: Optional[Dict[str, Any]] = None) -> int:
+    """Run one CLI command in this process and return its exit code
+
+    ``defaults`` is used as the root ``default_map``, so global options such
+    as ``--output`` default to the given values unless ``args`` sets them.
+    """
+    from site24x7_cli.main import cli
+
+    try:
+        result = cli.main(args=list(args), prog_name='site24x7', standalone_mode=False, obj=obj,
+                          default_map=defaults)
+        return result if isinstance(result, int) else 0
+    except click.exceptions.Exit as e:
+        return e.exit_code
+    except click.ClickException as e:
+        e.show()
+        return e.exit_code
+    except click.Abort:
+        click.echo('Aborted!', err=True)
+        return 1
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        return e.code if isinstance(e.code, int) else 1
+    except Exception as e:
+        click.echo(click.style(f'Unexpected error: {e}', fg='red'), err=True)
+        return 1
+
+
+def run_captured(args: List[str], obj: Optional[Dict[str, Any]] = None,
+                 defaults: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Run one CLI command and return its exit code and captured output"""
+    with captured_output() as (stdout, stderr):
+        exit_code = run_command(args, obj, defaults)
+    return {'exit_code': exit_code, 'stdout': stdout.getvalue(), 'stderr': stderr.getvalue()}
+
+
+def parse_script(text: str) -> List[Tuple[int, List[str]]]:
+    """Parse a batch script into ``(line, args)`` pairs
+
+    A script is either one command per line (blank lines and ``#`` comments
+    are skipped) or a JSON array whose items are command strings, argument
+    lists or ``{"args": [...]}`` objects. A leading ``site24x7`` is dropped.
+    """
+    if text.lstrip().startswith('['):
+        try:
+            specs = json.loads(text)
+        except ValueError as e:
+            raise click.BadParameter(f'Invalid JSON command list: {e}')
+        commands = []
+        for index, spec in enumerate(specs, 1):
+            if isinstance(spec, dict):
+                spec = spec.get('args', spec.get('command'))
+            if isinstance(spec, str):
+                spec = shlex.split(spec)
+            if not isinstance(spec, list):
+                raise click.BadParameter(f'Item {index}: expected a command string or argument list')
+            commands.append((index, _strip_prog([str(arg) for arg in spec])))
+        return commands
+
+    commands = []
+    for number, line in enumerate(text.splitlines(), 1):
+        try:
+            args = shlex.split(line, comments=True)
+        except ValueError as e:
+            raise click.BadParameter(f'Line {number}: {e}')
+        if args:
+            commands.append((number, _strip_prog(args)))
+    return commands
+
+
+def _strip_prog(args: List[str]) -> List[str]:
+    return args[1:] if args and args[0] == 'site24x7' else args
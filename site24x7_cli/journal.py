@@ -0,0 +1,160 @@
+"""
+Append-only checkpoint journals for resumable bulk operations
+"""
+
+import json
+import os
+import re
+import secrets
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from site24x7_cli.bulk import BulkResult, record_id
+from site24x7_cli.config import Config
+from site24x7_cli.exceptions import ValidationError
+from site24x7_cli.mirror import content_hash
+
+_JOB_ID = re.compile(r'^[A-Za-z0-9_-]+$')
+
+
+def item_key(index: int, item: Any) -> str:
+    """Journal key of a bulk item: the ID itself, or the input line of a record"""
+    return item if isinstance(item, str) else str(index)
+
+
+def _fingerprint(item: Any) -> Optional[str]:
+    return content_hash(item)[:16] if isinstance(item, dict) else None
+
+
+def _http_status(error: Optional[Exception]) -> Optional[int]:
+    response = getattr(error, 'response', None)
+    return getattr(response, 'status_code', None)
+
+
+class JobJournal:
+    """One NDJSON file per bulk job in the profile's jobs directory
+
+    The first line describes the job, including a hash of the payload shared
+    by every item (an update's fields, say); each later line records one
+    finished item (its ID or input line, outcome, HTTP status on failure and
+    the ID of a created record). Lines are flushed as they are written, so a
+    job killed midway can be resumed with only the unfinished items.
+    """
+
+    def __init__(self, job_id: str, operation: str, directory: Optional[str] = None,
+                 payload: Any = None):
+        self.job_id = job_id
+        self.operation = operation
+        self.directory = directory or Config.get_jobs_dir()
+        self.path = os.path.join(self.directory, f'{job_id}.jsonl')
+        self.payload = _fingerprint(payload)
+        self.lock = threading.Lock()
+        self.done: Dict[str, Optional[str]] = {}
+        self.skipped = 0
+        self.new = False
+        self.file = None
+
+    @classmethod
+    def start(cls, operation: str, directory: Optional[str] = None,
+              payload: Any = None) -> 'JobJournal':
+        """Create the journal of a new job"""
+        job_id = time.strftime('%Y%m%d-%H%M%S') + '-' + secrets.token_hex(3)
+        journal = cls(job_id, operation, directory, payload)
+        journal.new = True
+        os.makedirs(journal.directory, exist_ok=True)
+        journal._open({'job': job_id, 'operation': operation, 'event': 'started',
+                       'payload': journal.payload})
+        return journal
+
+    @classmethod
+    def resume(cls, job_id: str, operation: str, directory: Optional[str] = None,
+               payload: Any = None) -> 'JobJournal':
+        """Reopen a job's journal, loading the items it already completed
+
+        A job is only resumed with the payload it was started with, since the
+        items it completed were done with that payload.
+        """
+        if not _JOB_ID.match(job_id):
+            raise ValidationError(f"Invalid job ID '{job_id}'")
+        journal = cls(job_id, operation, directory, payload)
+        if not os.path.exists(journal.path):
+            raise ValidationError(f"No journal for job '{job_id}' in {journal.directory}")
+
+        with open(journal.path) as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A line torn by the process dying mid-write
+                    continue
+                if 'job' in entry:
+                    if entry.get('operation') != operation:
+                        raise ValidationError(f"Job '{job_id}' was started by "
+                                              f"'{entry.get('operation')}', not '{operation}'")
+                    if entry.get('event') == 'started' and entry.get('payload') != journal.payload:
+                        raise ValidationError(f"Job '{job_id}' was started with other parameters; "
+                                              f"rerun it with the same ones or start a new job")
+                elif entry.get('ok'):
+                    journal.done[entry['key']] = entry.get('hash')
+        journal._open({'job': job_id, 'operation': operation, 'event': 'resumed',
+                       'completed': len(journal.done)})
+        return journal
+
+    def _open(self, header: Dict[str, Any]) -> None:
+        torn = False
+        if os.path.exists(self.path) and os.path.getsize(self.path):
+            with open(self.path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                torn = f.read(1) != b'\n'
+        self.file = open(self.path, 'a')
+        if torn:
+            # Start after a line torn by the process dying mid-write
+            self.file.write('\n')
+        header['at'] = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        self._write(header)
+
+    def _write(self, entry: Dict[str, Any]) -> None:
+        with self.lock:
+            self.file.write(json.dumps(entry, separators=(',', ':'), default=str) + '\n')
+            self.file.flush()
+
+    def is_done(self, index: int, item: Any) -> bool:
+        """Whether an earlier run completed this item (unchanged, for records)"""
+        key = item_key(index, item)
+        return key in self.done and self.done[key] == _fingerprint(item)
+
+    def pending(self, items: Iterable[Any]) -> Iterator[Tuple[int, Any]]:
+        """``(index, item)`` pairs for the items still to do"""
+        for index, item in enumerate(items, 1):
+            if self.is_done(index, item):
+                self.skipped += 1
+            else:
+                yield index, item
+
+    def record(self, index: int, item: Any, result: BulkResult) -> None:
+        """Append the outcome of one item"""
+        entry: Dict[str, Any] = {'key': item_key(index, item), 'ok': result.ok}
+        fingerprint = _fingerprint(item)
+        if fingerprint:
+            entry['hash'] = fingerprint
+        if result.ok:
+            created = record_id(result.result) if isinstance(result.result, dict) else None
+            if created and created != entry['key']:
+                entry['id'] = created
+        else:
+            entry['status'] = _http_status(result.error)
+            entry['error'] = str(result.error)
+        self._write(entry)
+
+    def close(self) -> None:
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def discard(self) -> None:
+        """Close the journal of a job that was called off, removing it if the job is new"""
+        self.close()
+        if self.new and os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,154 @@
+"""
+Streaming JSON decoding and field projection for Site24x7 API responses
+
+``iter_records`` walks a list response as it arrives, decoding one record
+of the ``data`` array at a time and keeping only the requested fields, so
+memory stays bounded by a single record rather than the whole payload.
+"""
+
+import codecs
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from site24x7_cli.exceptions import ValidationError
+
+CHUNK_SIZE = 64 * 1024
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+
+
+def parse_fields(spec: Optional[str]) -> Optional[List[str]]:
+    """Split a ``--fields`` value into field names (dotted for nested fields)"""
+    if spec is None:
+        return None
+    fields = [field.strip() for field in spec.split(',') if field.strip()]
+    if not fields:
+        raise ValidationError('--fields needs at least one field name')
+    return list(dict.fromkeys(fields))
+
+
+def project(record: Any, fields: Sequence[str]) -> Any:
+    """Keep only ``fields`` of a record, in the order given
+
+    Dotted names reach into nested objects and are returned under the dotted
+    name; fields the record lacks are omitted.
+    """
+    if not isinstance(record, dict):
+        return record
+    result = {}
+    for field in fields:
+        if field in record:
+            result[field] = record[field]
+        elif '.' in field:
+            value: Any = record
+            for part in field.split('.'):
+                if not isinstance(value, dict) or part not in value:
+                    break
+                value = value[part]
+            else:
+                result[field] = value
+    return result
+
+
+class _Reader:
+    """A text buffer over a byte stream that grows on demand"""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self.chunks = iter(chunks)
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+        self.buffer = ''
+        self.position = 0
+        self.exhausted = False
+
+    def fill(self) -> bool:
+        """Append the next chunk, returning False at end of stream"""
+        if self.exhausted:
+            return False
+        if self.position > CHUNK_SIZE:
+            # Drop what has been consumed so the buffer does not grow with the payload
+            self.buffer = self.buffer[self.position:]
+            self.position = 0
+        for chunk in self.chunks:
+            if chunk:
+                self.buffer += self.decoder.decode(chunk)
+                return True
+        self.buffer += self.decoder.decode(b'', final=True)
+        self.exhausted = True
+        return False
+
+    def peek(self) -> str:
+        """The next non-whitespace character ('' at end of stream)"""
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in _WHITESPACE:
+                self.position += 1
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self.fill():
+                return ''
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Malformed JSON response: expected {char!r}, found {found or 'end of data'!r}")
+        self.position += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value"""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self.buffer) and self.buffer[end - 1].isdigit() and self.fill():
+                continue
+            self.position = end
+            return value
+
+
+def iter_records(chunks: Iterable[bytes], key: Optional[str] = None,
+                 fields: Optional[Sequence[str]] = None) -> Iterator[Dict[str, Any]]:
+    """Yield the records of a list response body delivered as byte chunks
+
+    Records are taken from the ``data`` member (or ``key``) of the top-level
+    object, or from a top-level array, and projected to ``fields`` when given.
+    """
+    reader = _Reader(chunks)
+    if reader.peek() == '[':
+        yield from _iter_array(reader, fields)
+        return
+
+    reader.expect('{')
+    if reader.peek() == '}':
+        return
+    while True:
+        name = reader.value()
+        reader.expect(':')
+        if name in ('data', key) and reader.peek() == '[':
+            yield from _iter_array(reader, fields)
+            return
+        value = reader.value()
+        if name in ('data', key) and isinstance(value, dict):
+            # A single record rather than a list
+            yield project(value, fields) if fields else value
+            return
+        if reader.peek() != ',':
+            return
+        reader.expect(',')
+
+
+def _iter_array(reader: _Reader, fields: Optional[Sequence[str]]) -> Iterator[Any]:
+    reader.expect('[')
+    if reader.peek() == ']':
+        return
+    while True:
+        record = reader.value()
+        yield project(record, fields) if fields else record
+        if reader.peek() != ',':
+            reader.expect(']')
+            return
+        reader.expect(',')
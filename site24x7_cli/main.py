@@ -10,32 +10,130 @@ This CLI provides comprehensive access to all Site24x7 monitoring and management
 import os
 import sys
 import json
+import time
+import importlib
 import click
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 # Import base classes and utilities
-from site24x7_cli.base import Site24x7Client, BaseCommand
-from site24x7_cli.auth import AuthManager
+# (site24x7_cli.base pulls in requests and rich, so it is imported where it is used)
+from site24x7_cli.auth import DEFAULT_PROFILE, AuthManager
 from site24x7_cli.config import Config
-from site24x7_cli.exceptions import Site24x7CLIError, AuthenticationError
+from site24x7_cli.exceptions import Site24x7CLIError, AuthenticationError, ValidationError
 
-# Import command modules
 
-from site24x7_cli.commands.monitor-management import monitor-management_group
+# Command modules, imported only when their subcommand is invoked
+LAZY_COMMANDS: Dict[str, Tuple[str, str, str]] = {
 
-from site24x7_cli.commands.reports import reports_group
+    'apply': ('site24x7_cli.commands.reconcile', 'apply_command',
+              'Make monitors match a desired-state file'),
 
+    'batch': ('site24x7_cli.commands.batch', 'batch',
+              'Run many CLI commands from a script in one process'),
 
+    'daemon': ('site24x7_cli.commands.daemon', 'daemon_group',
+               'Run the CLI as a warm background daemon'),
 
-@click.group(name='site24x7')
+    'monitor-management': ('site24x7_cli.commands.monitor_management', 'monitor_management_group',
+                           'Manage Monitor Management management commands'),
+
+    'plan': ('site24x7_cli.commands.reconcile', 'plan_command',
+             'Show the changes apply would make for a desired-state file'),
+
+    'reports': ('site24x7_cli.commands.reports', 'reports_group',
+                'Manage Reports management commands'),
+
+    'status': ('site24x7_cli.commands.status', 'status_group',
+               'Follow monitor status over time'),
+
+    'sync': ('site24x7_cli.commands.sync', 'sync',
+             'Mirror the monitor inventory into a local SQLite database'),
+
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that defers importing command modules until they are needed"""
+    
+    def __init__(self, *args, lazy_commands: Optional[Dict[str, Tuple[str, str, str]]] = None,
+                 **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+    
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+    
+    def resolve_command(self, ctx: click.Context, args: List[str]):
+        # Remember the subcommand and its arguments for --profiles fan-out
+        ctx.meta['command_args'] = list(args)
+        return super().resolve_command(ctx, args)
+    
+    def get_command(self, ctx: click.Context, name: str) -> Optional[click.Command]:
+        if name in self.lazy_commands and name not in self.commands:
+            module_name, attribute, _ = self.lazy_commands[name]
+            command = getattr(importlib.import_module(module_name), attribute)
+            self.add_command(command, name)
+        return super().get_command(ctx, name)
+    
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """List commands using the registered help text, without importing them"""
+        rows = []
+        for name in self.list_commands(ctx):
+            if name in self.commands:
+                command = self.commands[name]
+                if command.hidden:
+                    continue
+                help_text = command.get_short_help_str(formatter.width)
+            else:
+                help_text = self.lazy_commands[name][2]
+            rows.append((name, help_text))
+        
+        if rows:
+            with formatter.section('Commands'):
+                formatter.write_dl(rows)
+
+
+@click.group(name='site24x7', cls=LazyGroup, lazy_commands=LAZY_COMMANDS)
 @click.version_option(version='1.20250729.1637')
 @click.option('--config', '-c', help='Configuration file path')
-@click.option('--output', '-o', type=click.Choice(['table', 'json', 'yaml']), 
+@click.option('--output', '-o', type=click.Choice(['table', 'json', 'ndjson', 'csv', 'yaml']), 
               default='table', help='Output format')
 @click.option('--verbose', '-v', is_flag=True, help='Verbose output')
+@click.option('--fields', help='Comma-separated fields to output (e.g. monitor_id,display_name,status)')
 @click.option('--token', help='Site24x7 OAuth token (overrides config)')
+@click.option('--account', 'profile', metavar='PROFILE',
+              help='Credentials profile (account) to use (default: SITE24X7_PROFILE)')
+@click.option('--profiles', 'profiles_spec',
+              help="Run the command for several profiles at once: 'all' or a comma-separated list")
+@click.option('--max-retries', type=int, default=None,
+              help='Retries for throttled (429) and transient errors')
+@click.option('--rate-limit', type=float, default=None,
+              help='Maximum API requests per second (0 for unlimited)')
+@click.option('--cache/--no-cache', default=None,
+              help='Cache GET responses under ~/.site24x7/cache (default: SITE24X7_CACHE)')
+@click.option('--refresh', is_flag=True, help='Ignore cached responses and fetch fresh data')
+@click.option('--coalesce/--no-coalesce', default=None,
+              help='Share one request between identical concurrent GETs (default: on)')
+@click.option('--profile', 'profile_path', type=click.Path(dir_okay=False),
+              help='Write a Chrome trace-event JSON of request and render timings to FILE')
+@click.option('--timings', is_flag=True, help='Print a request/render timing summary to stderr')
+@click.option('--pool-size', 'pool_connections', type=int, default=None,
+              help='Per-host connection pools kept by the HTTP session')
+@click.option('--max-connections', 'pool_maxsize', type=int, default=None,
+              help='Connections kept open per host (raised to match --concurrency)')
+@click.option('--connect-timeout', type=float, default=None,
+              help='Seconds to wait for a connection (0 to wait forever)')
+@click.option('--read-timeout', type=float, default=None,
+              help='Seconds to wait for response data (0 to wait forever)')
+@click.option('--compression/--no-compression', default=None,
+              help='Request gzip-compressed responses (default: on)')
+@click.option('--keepalive/--no-keepalive', default=None,
+              help='Send TCP keep-alive probes on idle connections (default: on)')
 @click.pass_context
-def cli(ctx, config, output, verbose, token):
+def cli(ctx, config, output, verbose, fields, token, profile, profiles_spec, max_retries, rate_limit,
+        cache, refresh, coalesce,
+        profile_path, timings, pool_connections, pool_maxsize, connect_timeout, read_timeout,
+        compression, keepalive):
     """
     Site24x7 CLI - Comprehensive monitoring and management tool
     
@@ -56,14 +154,41 @@ def cli(ctx, config, output, verbose, token):
     # Store global options
     ctx.obj['output_format'] = output
     ctx.obj['verbose'] = verbose
+    ctx.obj['fields'] = fields
     ctx.obj['config_file'] = config
+    ctx.obj['profile'] = profile = profile or Config.get_profile()
+    if profile:
+        try:
+            Config.validate_profile(profile)
+        except ValidationError as e:
+            raise click.BadParameter(str(e), param_hint="'--account'")
+    ctx.obj['max_retries'] = max_retries
+    ctx.obj['rate_limit'] = rate_limit
+    if cache is not None:
+        ctx.obj['cache'] = cache
+    ctx.obj['refresh'] = refresh
+    ctx.obj['coalesce'] = coalesce
+    ctx.obj['pool_connections'] = pool_connections
+    ctx.obj['pool_maxsize'] = pool_maxsize
+    ctx.obj['connect_timeout'] = connect_timeout
+    ctx.obj['read_timeout'] = read_timeout
+    ctx.obj['compression'] = compression
+    ctx.obj['keepalive'] = keepalive
     
     # Setup authentication
-    oauth_token = token or AuthManager.load_credentials() or os.getenv('SITE24X7_OAUTH_TOKEN')
+    if profile and profile != DEFAULT_PROFILE:
+        # Never fall back to another account's token for a named profile
+        oauth_token = token or AuthManager.load_credentials(profile)
+        if not oauth_token and ctx.invoked_subcommand not in ['auth', 'configure']:
+            click.echo(click.style(f"Error: Profile '{profile}' is not configured.", fg='red'), err=True)
+            click.echo(f'Run "site24x7 auth configure --profile {profile}" to set it up.', err=True)
+            sys.exit(1)
+    else:
+        oauth_token = token or AuthManager.load_credentials() or os.getenv('SITE24X7_OAUTH_TOKEN')
     
     if not oauth_token:
         # Only require token for non-auth commands
-        if ctx.invoked_subcommand not in ['auth', 'configure']:
+        if ctx.invoked_subcommand not in ['auth', 'configure', 'daemon'] and not profiles_spec:
             click.echo(click.style('Error: No OAuth token provided.', fg='red'), err=True)
             click.echo('Run "site24x7 auth configure" to set up authentication.', err=True)
             sys.exit(1)
@@ -74,6 +199,24 @@ def cli(ctx, config, output, verbose, token):
     if verbose:
         import logging
         logging.basicConfig(level=logging.DEBUG)
+    
+    # Setup timing instrumentation
+    if profile_path or timings:
+        from site24x7_cli import profiling
+        profiler = profiling.enable()
+        if profiler is not None:
+            started = time.perf_counter()
+            ctx.call_on_close(lambda: profiling.finish(profiler, started, profile_path, timings))
+    
+    # Run the command once per selected profile instead
+    if profiles_spec:
+        if ctx.invoked_subcommand in ['auth', 'daemon', 'batch']:
+            raise click.UsageError(f"--profiles cannot be used with '{ctx.invoked_subcommand}'")
+        from site24x7_cli.profiles import fan_out, select_profiles
+        defaults = {name: value for name, value in ctx.params.items()
+                    if value is not None and name not in ('token', 'profile', 'profiles_spec')}
+        ctx.exit(fan_out(select_profiles(profiles_spec), ctx.meta.get('command_args', []),
+                         defaults, output))
 
 
 # Authentication commands
@@ -86,14 +229,21 @@ def auth():
 @auth.command()
 @click.option('--token', prompt=True, hide_input=True, 
               help='Site24x7 OAuth token')
-def configure(token):
+@click.option('--profile', help='Save the token as this named profile (one per account)')
+@click.pass_context
+def configure(ctx, token, profile):
     """Configure Site24x7 CLI with OAuth token"""
+    profile = profile or ctx.obj.get('profile')
     try:
+        if profile:
+            Config.validate_profile(profile)
+        
         # Validate token format (basic check)
         if not token or len(token) < 20:
             raise click.BadParameter('Invalid token format')
         
         # Test token by making a simple API call
+        from site24x7_cli.base import Site24x7Client
         client = Site24x7Client(token)
         try:
             # Try to get current status to validate token
@@ -104,7 +254,7 @@ def configure(token):
             click.echo('Token saved but may not be valid.')
         
         # Save credentials
-        AuthManager.save_credentials(token)
+        AuthManager.save_credentials(token, profile)
         click.echo(click.style('✓ Configuration saved', fg='green'))
         
     except Exception as e:
@@ -113,21 +263,38 @@ def configure(token):
 
 
 @auth.command()
-def clear():
-    """Clear saved authentication credentials"""
-    AuthManager.clear_credentials()
+@click.option('--profile', help='Clear this named profile (default: the --account profile)')
+@click.pass_context
+def clear(ctx, profile):
+    """Clear the saved credentials of one profile"""
+    AuthManager.clear_credentials(profile or ctx.obj.get('profile'))
+
+
+@auth.command()
+def profiles():
+    """List configured credential profiles"""
+    names = AuthManager.list_profiles()
+    if not names:
+        click.echo("No profiles configured")
+        click.echo("Run 'site24x7 auth configure --profile NAME' to add one.")
+        return
+    for name in names:
+        token = AuthManager.load_credentials(name) or ''
+        click.echo(f"{name}\t***{token[-8:]}" if len(token) > 8 else f"{name}\t***")
 
 
 @auth.command()
-def status():
+@click.pass_context
+def status(ctx):
     """Show authentication status"""
-    token = AuthManager.load_credentials()
+    token = AuthManager.load_credentials(ctx.obj.get('profile'))
     if token:
         masked_token = f"***{token[-8:]}" if len(token) > 8 else "***"
         click.echo(f"Status: Configured (Token: {masked_token})")
         
         # Test connection
         try:
+            from site24x7_cli.base import Site24x7Client
             client = Site24x7Client(token)
             response = client.get('/current_status')
             click.echo(click.style('✓ Connection: Active', fg='green'))
@@ -138,14 +305,6 @@ def status():
         click.echo("Run 'site24x7 auth configure' to set up authentication.")
 
 
-# Add command groups
-
-cli.add_command(monitor-management_group)
-
-cli.add_command(reports_group)
-
-
-
 # Global error handler
 def handle_api_error(e: Exception) -> None:
     """Handle API errors consistently"""
@@ -0,0 +1,174 @@
+"""
+Local SQLite mirror of the monitor inventory
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from site24x7_cli.auth import DEFAULT_PROFILE
+from site24x7_cli.bulk import record_id
+from site24x7_cli.config import Config
+from site24x7_cli.utils import STATUS_NAMES
+
+
+# Bumped when the schema changes; older mirrors are rebuilt by the next sync
+SCHEMA_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS monitors (
+    account TEXT NOT NULL,
+    monitor_type TEXT NOT NULL,
+    monitor_id TEXT NOT NULL,
+    display_name TEXT,
+    status TEXT,
+    group_id TEXT,
+    content_hash TEXT NOT NULL,
+    data TEXT NOT NULL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (account, monitor_type, monitor_id)
+);
+CREATE INDEX IF NOT EXISTS idx_monitors_status ON monitors (status);
+CREATE INDEX IF NOT EXISTS idx_monitors_group_id ON monitors (group_id);
+CREATE INDEX IF NOT EXISTS idx_monitors_type ON monitors (monitor_type);
+CREATE INDEX IF NOT EXISTS idx_monitors_name ON monitors (display_name);
+CREATE TABLE IF NOT EXISTS sync_state (
+    account TEXT NOT NULL,
+    monitor_type TEXT NOT NULL,
+    synced_at REAL NOT NULL,
+    total INTEGER NOT NULL,
+    PRIMARY KEY (account, monitor_type)
+);
+"""
+
+
+def content_hash(record: Dict[str, Any]) -> str:
+    """Stable hash of a record's content"""
+    raw = json.dumps(record, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def status_code(status: Any) -> str:
+    """The stored form of a status filter: names such as 'down' map to their code"""
+    codes = {name: str(code) for code, name in STATUS_NAMES.items()}
+    return codes.get(str(status).lower(), str(status))
+
+
+def record_group(record: Dict[str, Any]) -> Optional[str]:
+    """Return the (first) monitor group of a record"""
+    if record.get('group_id') is not None:
+        return str(record['group_id'])
+    groups = record.get('monitor_groups') or []
+    return str(groups[0]) if groups else None
+
+
+class InventoryMirror:
+    """SQLite copy of monitor records, refreshed by content hash
+
+    Rows belong to the credentials profile (account) they were synced with,
+    so several accounts can share one database without a sync of one
+    pruning the others' monitors.
+    """
+
+    def __init__(self, path: Optional[str] = None, account: Optional[str] = None):
+        self.account = account or DEFAULT_PROFILE
+        self.path = path or Config.get_mirror_path(self.account)
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.db = sqlite3.connect(self.path)
+        if self.db.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            with self.db:
+                self.db.execute("DROP TABLE IF EXISTS monitors")
+                self.db.execute("DROP TABLE IF EXISTS sync_state")
+                self.db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.db.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.db.close()
+
+    def sync(self, monitor_type: str, records: Iterable[Dict[str, Any]],
+             batch_size: int = 500) -> Dict[str, Any]:
+        """Mirror a full listing of one monitor type
+
+        Only rows whose content hash changed are rewritten, and rows that no
+        longer appear in the listing are removed.
+        """
+        known = dict(self.db.execute(
+            "SELECT monitor_id, content_hash FROM monitors WHERE account = ? AND monitor_type = ?",
+            (self.account, monitor_type)))
+        now = time.time()
+        seen = set()
+        counts = {'monitor_type': monitor_type, 'inserted': 0, 'updated': 0, 'unchanged': 0, 'deleted': 0}
+        batch = []
+
+        with self.db:
+            for record in records:
+                monitor_id = record_id(record)
+                if monitor_id is None:
+                    continue
+                seen.add(monitor_id)
+                digest = content_hash(record)
+                previous = known.get(monitor_id)
+                if previous == digest:
+                    counts['unchanged'] += 1
+                    continue
+                counts['updated' if previous else 'inserted'] += 1
+                batch.append((self.account, monitor_type, monitor_id, record.get('display_name'),
+                              None if record.get('status') is None else str(record['status']),
+                              record_group(record), digest,
+                              json.dumps(record, separators=(',', ':'), default=str), now))
+                if len(batch) >= batch_size:
+                    self._upsert(batch)
+                    batch = []
+            self._upsert(batch)
+
+            removed = [(self.account, monitor_type, monitor_id)
+                       for monitor_id in known if monitor_id not in seen]
+            self.db.executemany(
+                "DELETE FROM monitors WHERE account = ? AND monitor_type = ? AND monitor_id = ?",
+                removed)
+            counts['deleted'] = len(removed)
+            self.db.execute(
+                "INSERT OR REPLACE INTO sync_state (account, monitor_type, synced_at, total) "
+                "VALUES (?, ?, ?, ?)", (self.account, monitor_type, now, len(seen)))
+
+        counts['total'] = len(seen)
+        return counts
+
+    def _upsert(self, rows) -> None:
+        self.db.executemany(
+            "INSERT OR REPLACE INTO monitors (account, monitor_type, monitor_id, display_name, "
+            "status, group_id, content_hash, data, synced_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows)
+
+    def query(self, monitor_type: Optional[str] = None, status: Optional[str] = None,
+              group_id: Optional[str] = None, name_pattern: Optional[str] = None,
+              limit: Optional[int] = None, offset: int = 0) -> Iterator[Dict[str, Any]]:
+        """Yield mirrored records matching the given filters"""
+        clauses, args = ["account = ?"], [self.account]
+        if status is not None:
+            status = status_code(status)
+        for column, value in (('monitor_type', monitor_type), ('status', status),
+                              ('group_id', group_id)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                args.append(str(value))
+        if name_pattern:
+            clauses.append("display_name GLOB ?")
+            args.append(name_pattern)
+
+        sql = "SELECT data FROM monitors WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY monitor_type, display_name, monitor_id LIMIT ? OFFSET ?"
+        args.extend([-1 if limit is None else limit, offset])
+
+        for (data,) in self.db.execute(sql, args):
+            yield json.loads(data)
+
+    def last_synced(self, monitor_type: str) -> Optional[float]:
+        """Return when a monitor type was last synced"""
+        row = self.db.execute(
+            "SELECT synced_at FROM sync_state WHERE account = ? AND monitor_type = ?",
+            (self.account, monitor_type)).fetchone()
+        return row[0] if row else None
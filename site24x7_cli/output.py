@@ -0,0 +1,181 @@
+"""
+Streaming output sinks for Site24x7 CLI
+"""
+
+import csv
+import json
+import sys
+from typing import Any, Dict, Iterable, List, Optional, TextIO
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+
+class OutputSink:
+    """Receives records one at a time and renders them as they arrive"""
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream or sys.stdout
+        self.count = 0
+
+    def write(self, record: Any) -> None:
+        """Render a single record"""
+        self.count += 1
+        self._write(record)
+
+    def write_all(self, records: Iterable[Any]) -> None:
+        """Render every record of an iterable"""
+        for record in records:
+            self.write(record)
+
+    def write_document(self, data: Any) -> None:
+        """Render a single non-list result"""
+        self.write(data)
+
+    def close(self) -> None:
+        """Finish the output"""
+        self.stream.flush()
+
+    def _write(self, record: Any) -> None:
+        raise NotImplementedError
+
+    def __enter__(self) -> 'OutputSink':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class NDJSONSink(OutputSink):
+    """One compact JSON document per line"""
+
+    def _write(self, record: Any) -> None:
+        self.stream.write(json.dumps(record, default=str, separators=(',', ':')) + '\n')
+
+
+class JSONSink(OutputSink):
+    """A JSON array written element by element"""
+
+    def _write(self, record: Any) -> None:
+        text = json.dumps(record, indent=2, default=str).replace('\n', '\n  ')
+        self.stream.write(('[\n  ' if self.count == 1 else ',\n  ') + text)
+
+    def write_document(self, data: Any) -> None:
+        self.stream.write(json.dumps(data, indent=2, default=str) + '\n')
+        self.count = -1
+
+    def close(self) -> None:
+        if self.count == 0:
+            self.stream.write('[]\n')
+        elif self.count > 0:
+            self.stream.write('\n]\n')
+        super().close()
+
+
+class CSVSink(OutputSink):
+    """CSV rows, with columns taken from the first record"""
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        super().__init__(stream)
+        self.writer: Optional[csv.DictWriter] = None
+
+    def _write(self, record: Any) -> None:
+        if not isinstance(record, dict):
+            record = {'value': record}
+        if self.writer is None:
+            self.writer = csv.DictWriter(self.stream, fieldnames=list(record.keys()),
+                                         extrasaction='ignore')
+            self.writer.writeheader()
+        self.writer.writerow({key: cell(value) for key, value in record.items()})
+
+
+class YAMLSink(OutputSink):
+    """A YAML sequence written item by item (JSON lines without PyYAML)"""
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        super().__init__(stream)
+        try:
+            import yaml
+            self.yaml = yaml
+        except ImportError:
+            self.yaml = None
+            click.echo('YAML output requires PyYAML. Install with: pip install PyYAML', err=True)
+
+    def _write(self, record: Any) -> None:
+        if self.yaml is None:
+            self.stream.write(json.dumps(record, default=str) + '\n')
+        else:
+            self.stream.write(self.yaml.safe_dump([record], default_flow_style=False, sort_keys=False))
+
+    def write_document(self, data: Any) -> None:
+        if self.yaml is None:
+            self.stream.write(json.dumps(data, indent=2, default=str) + '\n')
+        else:
+            self.stream.write(self.yaml.safe_dump(data, default_flow_style=False, sort_keys=False))
+
+
+class TableSink(OutputSink):
+    """Rich tables printed in fixed-size batches of rows"""
+
+    def __init__(self, stream: Optional[TextIO] = None, chunk_size: int = 100):
+        super().__init__(stream)
+        self.console = Console(file=stream) if stream else Console()
+        self.chunk_size = chunk_size
+        self.columns: Optional[List[str]] = None
+        self.rows: List[List[str]] = []
+
+    def _write(self, record: Any) -> None:
+        if not isinstance(record, dict):
+            record = {'value': record}
+        if self.columns is None:
+            self.columns = list(record.keys())
+        self.rows.append([cell(record.get(key)) for key in self.columns])
+        if len(self.rows) >= self.chunk_size:
+            self.flush()
+
+    def write_document(self, data: Any) -> None:
+        self.console.print(data)
+        self.count = -1
+
+    def flush(self) -> None:
+        """Print the buffered rows as one table"""
+        if not self.rows:
+            return
+        table = Table()
+        for key in self.columns:
+            table.add_column(key.replace('_', ' ').title())
+        for row in self.rows:
+            table.add_row(*row)
+        self.console.print(table)
+        self.rows = []
+
+    def close(self) -> None:
+        self.flush()
+        if self.count == 0:
+            self.console.print("[yellow]No data to display[/yellow]")
+
+
+def cell(value: Any) -> str:
+    """Render a value as a table or CSV cell"""
+    if isinstance(value, str):
+        return value
+    if value is None:
+        return ''
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str, separators=(',', ':'))
+    return str(value)
+
+
+SINKS: Dict[str, type] = {
+    'table': TableSink,
+    'json': JSONSink,
+    'ndjson': NDJSONSink,
+    'csv': CSVSink,
+    'yaml': YAMLSink,
+}
+
+
+def get_sink(output_format: str = 'table', stream: Optional[TextIO] = None) -> OutputSink:
+    """Return the output sink for a format name"""
+    return SINKS.get(output_format, TableSink)(stream)
@@ -0,0 +1,85 @@
+"""
+Multi-account fan-out for Site24x7 CLI
+
+``--profiles all|a,b,c`` runs one command against several credential
+profiles at once. Each profile runs in-process with its own pooled session,
+and their records are merged into one output stream tagged with the
+profile name.
+"""
+
+import json
+from typing import Any, Dict, List, Optional
+
+import click
+
+from site24x7_cli.auth import AuthManager
+from site24x7_cli.base import share_clients
+from site24x7_cli.bulk import run_bulk
+from site24x7_cli.config import Config
+from site24x7_cli.invoke import run_captured
+from site24x7_cli.output import OutputSink, get_sink
+
+
+def select_profiles(spec: str) -> List[str]:
+    """Resolve ``all`` or a comma-separated list to configured profile names"""
+    available = AuthManager.list_profiles()
+    if spec.strip() == 'all':
+        if not available:
+            raise click.UsageError('No profiles configured. Run "site24x7 auth configure --profile NAME".')
+        return available
+
+    names = list(dict.fromkeys(name.strip() for name in spec.split(',') if name.strip()))
+    unknown = [name for name in names if name not in available]
+    if unknown:
+        raise click.BadParameter(f"Unknown profile(s): {', '.join(unknown)}", param_hint="'--profiles'")
+    if not names:
+        raise click.BadParameter('No profile names given', param_hint="'--profiles'")
+    return names
+
+
+def tag_output(profile: str, stdout: str, sink: OutputSink) -> None:
+    """Write a profile's NDJSON output to ``sink`` with a ``profile`` field
+
+    Lines that are not JSON (progress or error messages) go to stderr,
+    prefixed with the profile name.
+    """
+    for line in stdout.splitlines():
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError:
+            click.echo(f'[{profile}] {line}', err=True)
+            continue
+        for record in data if isinstance(data, list) else [data]:
+            if isinstance(record, dict):
+                sink.write(dict({'profile': profile}, **record))
+            else:
+                sink.write({'profile': profile, 'value': record})
+
+
+def fan_out(profiles: List[str], args: List[str], defaults: Dict[str, Any],
+            output_format: str = 'table', concurrency: Optional[int] = None) -> int:
+    """Run ``args`` once per profile and merge the results, returning an exit code"""
+    share_clients()
+    # Profiles render as NDJSON so their records can be tagged and re-rendered together
+    inner_defaults = dict(defaults, output='ndjson')
+
+    def run(profile: str) -> Dict[str, Any]:
+        return run_captured(['--account', profile, *args], defaults=inner_defaults)
+
+    failed = []
+    with get_sink(output_format) as sink:
+        for outcome in run_bulk(run, profiles, concurrency or Config.get_profile_concurrency()):
+            profile, result = outcome.item, outcome.result
+            tag_output(profile, result['stdout'], sink)
+            for line in result['stderr'].splitlines():
+                click.echo(f'[{profile}] {line}', err=True)
+            if result['exit_code'] != 0:
+                failed.append(profile)
+
+    if failed:
+        click.echo(click.style(f"Failed for {len(failed)} of {len(profiles)} profiles: "
+                               f"{', '.join(failed)}", fg='red'), err=True)
+        return 1
+    return 0
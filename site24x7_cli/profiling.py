@@ -0,0 +1,252 @@
+"""
+Request and render timing for Site24x7 CLI
+
+When enabled with ``--profile`` or ``--timings``, every API request records
+its DNS, TCP connect, TLS, server and body-read time, payload sizes and
+retries, and output rendering is timed separately. Events are kept in the
+Chrome trace-event format (load the file in chrome://tracing or Perfetto).
+
+Each invocation gets its own profiler, held in a context variable so that
+commands running side by side (e.g. in the daemon) do not share events.
+Worker threads see the profiler of the code that started them when they are
+run through ``contextvars.copy_context()``.
+"""
+
+import contextvars
+import json
+import os
+import socket
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from site24x7_cli.utils import percentile
+
+# Connection phases, in the order they happen within one attempt
+PHASES = ('dns', 'connect', 'tls', 'server', 'body')
+
+_active: contextvars.ContextVar[Optional['Profiler']] = contextvars.ContextVar(
+    'site24x7_profiler', default=None)
+_active_lock = threading.Lock()
+_local = threading.local()
+# Undoes the connection instrumentation, installed while any profiler runs
+_patches: Optional[ExitStack] = None
+_running = 0
+
+
+class Profiler:
+    """Collects trace events from every thread of one invocation"""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.pid = os.getpid()
+        self.events: List[Dict[str, Any]] = []
+        # Objects whose stats() the timing summary reports, by id
+        self.sources: Dict[int, Tuple[str, Any]] = {}
+        self.lock = threading.Lock()
+
+    def record(self, name: str, category: str, start: float, end: float, **args) -> None:
+        """Add a complete event spanning ``start``..``end`` (perf_counter seconds)"""
+        event = {'name': name, 'cat': category, 'ph': 'X',
+                 'ts': round((start - self.origin) * 1e6, 1),
+                 'dur': round((end - start) * 1e6, 1),
+                 'pid': self.pid, 'tid': threading.get_ident(), 'args': args}
+        with self.lock:
+            self.events.append(event)
+
+    def track(self, name: str, source: Any) -> None:
+        """Report ``source.stats()`` under ``name`` in the timing summary"""
+        with self.lock:
+            self.sources[id(source)] = (name, source)
+
+    def counters(self) -> List[Dict[str, Any]]:
+        """One row per tracked source with its current stats"""
+        with self.lock:
+            sources = list(self.sources.values())
+        return [dict({'source': name}, **source.stats()) for name, source in sources]
+
+    @contextmanager
+    def span(self, name: str, category: str, **args) -> Iterator[Dict[str, Any]]:
+        """Time a block; the yielded dict becomes the event's args"""
+        start = time.perf_counter()
+        try:
+            yield args
+        finally:
+            self.record(name, category, start, time.perf_counter(), **args)
+
+    def write_trace(self, path: str) -> None:
+        """Write the events as a Chrome trace-event JSON file"""
+        with self.lock:
+            events = list(self.events)
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """One row per phase with count and latency statistics in milliseconds"""
+        with self.lock:
+            events = list(self.events)
+
+        durations: Dict[str, List[float]] = {}
+        totals = {'bytes_in': 0, 'bytes_out': 0, 'retries': 0}
+        for event in events:
+            if event['cat'] == 'http':
+                totals['bytes_in'] += event['args'].get('bytes_in', 0)
+                totals['bytes_out'] += event['args'].get('bytes_out', 0)
+                totals['retries'] += 1 if event['args'].get('attempt') else 0
+            name = event['name'] if event['cat'] in ('phase', 'cli') else event['cat']
+            durations.setdefault(name, []).append(event['dur'] / 1000.0)
+
+        order = ['http'] + list(PHASES) + ['coalesced', 'render', 'command']
+        rows = []
+        for name in sorted(durations, key=lambda n: order.index(n) if n in order else len(order)):
+            values = durations[name]
+            row = {'phase': 'request' if name == 'http' else name, 'count': len(values),
+                   'total_ms': round(sum(values), 1), 'mean_ms': round(sum(values) / len(values), 1),
+                   'p95_ms': round(percentile(values, 95), 1), 'max_ms': round(max(values), 1)}
+            if name == 'http':
+                row.update(totals)
+            rows.append(row)
+        return rows
+
+
+def enable() -> Optional[Profiler]:
+    """Start profiling the current invocation
+
+    Returns the new profiler, or None when one is already running in this
+    context (e.g. the command is part of a profiled batch), in which case
+    events go to it.
+    """
+    global _patches, _running
+    if _active.get() is not None:
+        return None
+    profiler = Profiler()
+    _active.set(profiler)
+    with _active_lock:
+        if _running == 0:
+            _patches = ExitStack()
+            _patches.enter_context(instrumented())
+        _running += 1
+    return profiler
+
+
+def disable() -> None:
+    """Stop profiling the current invocation
+
+    The uninstrumented resolver and connections are restored once no other
+    invocation is profiling.
+    """
+    global _patches, _running
+    if _active.get() is None:
+        return
+    _active.set(None)
+    with _active_lock:
+        _running -= 1
+        if _running == 0 and _patches is not None:
+            _patches.close()
+            _patches = None
+
+
+def get_profiler() -> Optional[Profiler]:
+    """The profiler running in this context, if any"""
+    return _active.get()
+
+
+@contextmanager
+def span(name: str, category: str, **args) -> Iterator[Dict[str, Any]]:
+    """Time a block with the running profiler (a no-op when profiling is off)"""
+    profiler = _active.get()
+    if profiler is None:
+        yield args
+        return
+    with profiler.span(name, category, **args) as event_args:
+        yield event_args
+
+
+def finish(profiler: Profiler, started: float, trace_path: Optional[str] = None,
+           show_timings: bool = False) -> None:
+    """Close the command span, write the trace and print the timing summary"""
+    profiler.record('command', 'cli', started, time.perf_counter())
+    disable()
+    if trace_path:
+        profiler.write_trace(trace_path)
+    if show_timings:
+        import sys
+        from site24x7_cli.output import get_sink
+
+        with get_sink('table', sys.stderr) as sink:
+            sink.write_all(profiler.summary())
+        counters = profiler.counters()
+        if counters:
+            with get_sink('table', sys.stderr) as sink:
+                sink.write_all(counters)
+
+
+@contextmanager
+def connection_phases() -> Iterator[Dict[str, float]]:
+    """Collect DNS/connect/TLS seconds spent by this thread within the block"""
+    phases = {'dns': 0.0, 'connect': 0.0, 'tls': 0.0}
+    _local.phases = phases
+    try:
+        yield phases
+    finally:
+        _local.phases = None
+
+
+def _add_phase(name: str, seconds: float) -> None:
+    phases = getattr(_local, 'phases', None)
+    if phases is not None:
+        phases[name] += seconds
+
+
+@contextmanager
+def instrumented() -> Iterator[None]:
+    """Wrap the resolver and urllib3's connection setup to time their phases
+
+    The originals are put back when the block exits.
+    """
+    from urllib3 import connection
+    from urllib3.util import connection as util_connection
+
+    getaddrinfo = socket.getaddrinfo
+    create_connection = util_connection.create_connection
+    https_connect = connection.HTTPSConnection.connect
+
+    def timed_getaddrinfo(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return getaddrinfo(*args, **kwargs)
+        finally:
+            _add_phase('dns', time.perf_counter() - start)
+
+    def timed_create_connection(*args, **kwargs):
+        phases = getattr(_local, 'phases', None)
+        dns_before = phases['dns'] if phases is not None else 0.0
+        start = time.perf_counter()
+        try:
+            return create_connection(*args, **kwargs)
+        finally:
+            if phases is not None:
+                elapsed = time.perf_counter() - start
+                phases['connect'] += elapsed - (phases['dns'] - dns_before)
+
+    def timed_https_connect(self, *args, **kwargs):
+        phases = getattr(_local, 'phases', None)
+        setup_before = phases['dns'] + phases['connect'] if phases is not None else 0.0
+        start = time.perf_counter()
+        try:
+            return https_connect(self, *args, **kwargs)
+        finally:
+            if phases is not None:
+                elapsed = time.perf_counter() - start
+                phases['tls'] += elapsed - (phases['dns'] + phases['connect'] - setup_before)
+
+    socket.getaddrinfo = timed_getaddrinfo
+    util_connection.create_connection = timed_create_connection
+    connection.HTTPSConnection.connect = timed_https_connect
+    try:
+        yield
+    finally:
+        socket.getaddrinfo = getaddrinfo
+        util_connection.create_connection = create_connection
+        connection.HTTPSConnection.connect = https_connect
@@ -0,0 +1,301 @@
+"""
+Record filter expressions for Site24x7 CLI list commands
+
+A ``--where`` expression is parsed once into a tree of closures and then
+evaluated against each record as it streams past:
+
+    status == down and (display_name ~ '^web-' or group_id in (3, 7))
+    not type == URL and timeout >= 30
+
+Comparisons are ``== = != < <= > >= ~ !~ in`` (``~`` is a regex search),
+joined with ``and``/``or``/``not`` and parentheses. Fields may be dotted
+paths into nested objects; when a field holds a list, a comparison matches
+if any element does. Unquoted numbers compare numerically, everything else
+as text, and ``status`` also accepts status names.
+
+Conjuncts the API can evaluate itself (``status`` and ``group_id``
+equality) are reported by ``Query.pushdown`` so they can be sent as
+request parameters.
+"""
+
+import re
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from site24x7_cli.exceptions import ValidationError
+from site24x7_cli.utils import STATUS_NAMES, status_name
+
+# Fields the list endpoints filter on server-side
+PUSHDOWN_FIELDS = ('status', 'group_id')
+
+Predicate = Callable[[Dict[str, Any]], bool]
+
+_TOKEN = re.compile(r"""
+    \s*(?:
+        (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+      | (?P<op>==|!=|<=|>=|!~|=|<|>|~|\(|\)|,)
+      | (?P<number>-?\d+(?:\.\d+)?(?![\w.\-/:*]))
+      | (?P<word>[^\s'"=!<>~(),]+)
+    )""", re.VERBOSE)
+
+_KEYWORDS = {'and', 'or', 'not', 'in'}
+_LITERALS = {'true': True, 'false': False, 'null': None}
+_MISSING = object()
+
+
+def _tokenize(expression: str) -> List[Tuple[str, Any]]:
+    tokens = []
+    position = 0
+    expression = expression.rstrip()
+    while position < len(expression):
+        match = _TOKEN.match(expression, position)
+        if not match:
+            raise ValidationError(f"Invalid --where expression near: {expression[position:]!r}")
+        position = match.end()
+        kind = match.lastgroup
+        text = match.group(kind)
+        if kind == 'string':
+            tokens.append(('value', re.sub(r'\\(.)', r'\1', text[1:-1])))
+        elif kind == 'number':
+            tokens.append(('value', float(text)))
+        elif kind == 'word' and text.lower() in _KEYWORDS:
+            tokens.append(('keyword', text.lower()))
+        else:
+            tokens.append((kind, text))
+    return tokens
+
+
+def _path(field: str) -> Callable[[Dict[str, Any]], Any]:
+    """A getter for a (possibly dotted) field"""
+    if '.' not in field:
+        return lambda record: record.get(field, _MISSING)
+    parts = field.split('.')
+
+    def get(record: Dict[str, Any]) -> Any:
+        if field in record:
+            # Already flattened by a --fields projection
+            return record[field]
+        value: Any = record
+        for part in parts:
+            if not isinstance(value, dict) or part not in value:
+                return _MISSING
+            value = value[part]
+        return value
+    return get
+
+
+def _number(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _text(value: Any) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return str(value)
+
+
+_ORDERING = {
+    '<': lambda a, b: a < b, '<=': lambda a, b: a <= b,
+    '>': lambda a, b: a > b, '>=': lambda a, b: a >= b,
+}
+
+
+def _test(op: str, literal: Any) -> Callable[[Any], bool]:
+    """A test of one field value against a literal (or tuple of literals for ``in``)"""
+    if op in ('~', '!~'):
+        try:
+            pattern = re.compile(_text(literal))
+        except re.error as e:
+            raise ValidationError(f"Invalid regular expression {literal!r}: {e}")
+        if op == '~':
+            return lambda value: value is not None and bool(pattern.search(_text(value)))
+        return lambda value: value is None or not pattern.search(_text(value))
+
+    if op == 'in':
+        tests = [_test('==', item) for item in literal]
+        return lambda value: any(test(value) for test in tests)
+
+    if op in ('==', '='):
+        if literal is None:
+            return lambda value: value is None
+        if isinstance(literal, bool):
+            return lambda value: value is literal or _text(value).lower() == _text(literal)
+        if isinstance(literal, float):
+            return lambda value: _number(value) == literal
+        return lambda value: value is not None and _text(value) == literal
+
+    if op == '!=':
+        equal = _test('==', literal)
+        return lambda value: not equal(value)
+
+    compare = _ORDERING[op]
+    if isinstance(literal, float):
+        return lambda value: _number(value) is not None and compare(_number(value), literal)
+    return lambda value: value is not None and compare(_text(value), _text(literal))
+
+
+def _comparison(field: str, op: str, literal: Any) -> Predicate:
+    get = _path(field)
+    names = literal if op == 'in' else (literal,)
+    if field == 'status' and any(isinstance(name, str) and name.lower() in STATUS_NAMES.values()
+                                 for name in names):
+        # Compare status names rather than codes
+        code = get
+        get = lambda record: status_name(code(record))
+        literal = (tuple(n.lower() if isinstance(n, str) else n for n in literal) if op == 'in'
+                   else literal.lower())
+    test = _test(op, literal)
+    negated = op in ('!=', '!~')
+
+    def predicate(record: Dict[str, Any]) -> bool:
+        value = get(record)
+        if value is _MISSING:
+            value = None
+        if isinstance(value, list):
+            return all(test(item) for item in value) if negated else any(test(item) for item in value)
+        return test(value)
+    return predicate
+
+
+class _Parser:
+    """Recursive-descent parser producing a predicate and its AND-ed comparisons"""
+
+    def __init__(self, tokens: List[Tuple[str, Any]]):
+        self.tokens = tokens
+        self.position = 0
+        self.fields: List[str] = []
+
+    def peek(self) -> Tuple[Optional[str], Any]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else (None, None)
+
+    def take(self, kind: str, text: Any = None) -> Any:
+        token_kind, token_text = self.peek()
+        if token_kind != kind or (text is not None and token_text != text):
+            found = 'end of expression' if token_kind is None else repr(token_text)
+            expected = text or {'op': 'an operator', 'word': 'a field name'}.get(kind, kind)
+            raise ValidationError(f"Invalid --where expression: expected {expected}, found {found}")
+        self.position += 1
+        return token_text
+
+    def accept(self, kind: str, text: Any = None) -> bool:
+        token_kind, token_text = self.peek()
+        if token_kind == kind and (text is None or token_text == text):
+            self.position += 1
+            return True
+        return False
+
+    def parse(self) -> Tuple[Predicate, List[Tuple[str, str, Any]]]:
+        predicate, conjuncts = self.disjunction()
+        if self.position < len(self.tokens):
+            raise ValidationError(f"Invalid --where expression: unexpected {self.peek()[1]!r}")
+        return predicate, conjuncts
+
+    def disjunction(self) -> Tuple[Predicate, List[Tuple[str, str, Any]]]:
+        predicate, conjuncts = self.conjunction()
+        alternatives = [predicate]
+        while self.accept('keyword', 'or'):
+            alternatives.append(self.conjunction()[0])
+        if len(alternatives) == 1:
+            return predicate, conjuncts
+        return (lambda record: any(p(record) for p in alternatives)), []
+
+    def conjunction(self) -> Tuple[Predicate, List[Tuple[str, str, Any]]]:
+        predicate, conjuncts = self.negation()
+        terms = [predicate]
+        while self.accept('keyword', 'and'):
+            predicate, more = self.negation()
+            terms.append(predicate)
+            conjuncts = conjuncts + more
+        if len(terms) == 1:
+            return predicate, conjuncts
+        return (lambda record: all(p(record) for p in terms)), conjuncts
+
+    def negation(self) -> Tuple[Predicate, List[Tuple[str, str, Any]]]:
+        if self.accept('keyword', 'not'):
+            inner = self.negation()[0]
+            return (lambda record: not inner(record)), []
+        if self.accept('op', '('):
+            result = self.disjunction()
+            self.take('op', ')')
+            return result
+        return self.comparison()
+
+    def comparison(self) -> Tuple[Predicate, List[Tuple[str, str, Any]]]:
+        field = self.take('word')
+        if field not in self.fields:
+            self.fields.append(field)
+        if self.accept('keyword', 'not'):
+            self.take('keyword', 'in')
+            literal = self.values()
+            inner = _comparison(field, 'in', literal)
+            return (lambda record: not inner(record)), []
+        if self.accept('keyword', 'in'):
+            literal = self.values()
+            return _comparison(field, 'in', literal), [(field, 'in', literal)]
+        op = self.take('op')
+        if op not in ('==', '=', '!=', '<', '<=', '>', '>=', '~', '!~'):
+            raise ValidationError(f"Invalid --where expression: {op!r} after {field!r} is not an operator")
+        literal = self.value()
+        return _comparison(field, op, literal), [(field, op, literal)]
+
+    def values(self) -> Tuple[Any, ...]:
+        self.take('op', '(')
+        values = [self.value()]
+        while self.accept('op', ','):
+            values.append(self.value())
+        self.take('op', ')')
+        return tuple(values)
+
+    def value(self) -> Any:
+        kind, text = self.peek()
+        if kind == 'value':
+            self.position += 1
+            return text
+        if kind == 'word':
+            self.position += 1
+            return _LITERALS.get(text.lower(), text)
+        found = 'end of expression' if kind is None else repr(text)
+        raise ValidationError(f"Invalid --where expression: expected a value, found {found}")
+
+
+class Query:
+    """A compiled ``--where`` expression"""
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        tokens = _tokenize(expression)
+        if not tokens:
+            raise ValidationError('The --where expression is empty')
+        parser = _Parser(tokens)
+        self.predicate, self._conjuncts = parser.parse()
+        self.fields = parser.fields
+
+    def __call__(self, record: Dict[str, Any]) -> bool:
+        return self.predicate(record)
+
+    def filter(self, records: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Yield the records matching the expression"""
+        predicate = self.predicate
+        return (record for record in records if predicate(record))
+
+    def pushdown(self, fields: Iterable[str] = PUSHDOWN_FIELDS) -> Dict[str, str]:
+        """Request parameters implied by top-level equality tests on ``fields``
+
+        Every record the expression matches also satisfies these, so they can
+        be sent to the API; the full expression is still applied locally.
+        """
+        params = {}
+        for field, op, literal in self._conjuncts:
+            if op == 'in' and len(literal) == 1:
+                op, literal = '==', literal[0]
+            if field in fields and op in ('==', '=') and literal is not None \
+                    and not isinstance(literal, bool) and field not in params:
+                params[field] = _text(literal)
+        return params
+
+    def __repr__(self) -> str:
+        return f'Query({self.expression!r})'
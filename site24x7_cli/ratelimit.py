@@ -0,0 +1,64 @@
+"""
+Client-side rate limiting for Site24x7 API requests
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting requests per second
+
+    A rate of 0 disables limiting, but ``pause`` still applies so that a
+    429 seen by one worker holds back every thread sharing the bucket.
+    """
+    
+    def __init__(self, rate: float = 0.0, burst: int = 0):
+        self.rate = rate
+        self.capacity = float(burst or max(int(rate), 1))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+    
+    def acquire(self) -> float:
+        """Block until a request may be sent, returning the time waited"""
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                wait = self.paused_until - now
+                if wait <= 0 and self.rate > 0:
+                    self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                    self.updated = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return waited
+                    wait = (1 - self.tokens) / self.rate
+                elif wait <= 0:
+                    return waited
+            time.sleep(wait)
+            waited += wait
+    
+    def reserve(self) -> float:
+        """Take a token without blocking and return how long to wait before using it
+
+        For asyncio callers, which must sleep on the event loop instead.
+        """
+        with self.lock:
+            now = time.monotonic()
+            wait = max(self.paused_until - now, 0.0)
+            if self.rate <= 0:
+                return wait
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Tokens may go negative: later callers queue up behind this reservation
+            self.tokens -= 1
+            if self.tokens < 0:
+                wait = max(wait, -self.tokens / self.rate)
+            return wait
+    
+    def pause(self, seconds: float) -> None:
+        """Hold back all requests for ``seconds``"""
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
@@ -0,0 +1,188 @@
+"""
+Desired-state reconciliation of Site24x7 monitors
+
+A desired-state file lists monitor definitions per monitor type:
+
+    key: display_name            # field matching definitions to live monitors
+    website-monitors:
+      - display_name: shop-home
+        website: https://shop.example.com/
+        check_frequency: 5
+    api-monitors:
+      - display_name: orders-api
+        ...
+
+``plan`` matches each definition to the live monitor with the same key and
+compares hashes of the normalised fields the definition sets, so only
+missing or drifted monitors produce a create or update. Live monitors with
+no definition become deletes when pruning.
+"""
+
+import json
+from typing import Any, Dict, Iterable, List, Optional, TextIO
+
+from site24x7_cli.bulk import new_monitor, record_id
+from site24x7_cli.exceptions import ValidationError
+from site24x7_cli.mirror import content_hash
+
+DEFAULT_KEY = 'display_name'
+
+# Monitor types a desired-state file may declare, with their endpoints
+MONITOR_TYPES = {
+    'website-monitors': '/api/website-monitors',
+    'api-monitors': '/api/api-monitors',
+}
+
+
+def load_desired(stream: TextIO) -> Dict[str, Any]:
+    """Read a desired-state file (YAML when named *.yaml/*.yml, JSON otherwise)
+
+    Returns ``{'key': field, 'monitors': {monitor_type: [definition, ...]}}``.
+    """
+    name = str(getattr(stream, 'name', '') or '').lower()
+    text = stream.read()
+    if name.endswith(('.yaml', '.yml')):
+        try:
+            import yaml
+        except ImportError:
+            raise ValidationError('YAML files require PyYAML. Install with: pip install PyYAML')
+        try:
+            document = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise ValidationError(f'Invalid YAML in {name}: {e}')
+    else:
+        try:
+            document = json.loads(text)
+        except ValueError as e:
+            raise ValidationError(f'Invalid JSON in {name or "desired-state file"}: {e}')
+
+    if not isinstance(document, dict):
+        raise ValidationError('The desired-state file must be a mapping of monitor types')
+    key = document.get('key', DEFAULT_KEY)
+    monitors = {}
+    for monitor_type, definitions in document.items():
+        if monitor_type == 'key':
+            continue
+        if monitor_type not in MONITOR_TYPES:
+            raise ValidationError(f"Unknown monitor type '{monitor_type}' "
+                                  f"(expected one of: {', '.join(MONITOR_TYPES)})")
+        if not isinstance(definitions, list) or not all(isinstance(d, dict) for d in definitions):
+            raise ValidationError(f"'{monitor_type}' must be a list of monitor definitions")
+        monitors[monitor_type] = definitions
+    return {'key': key, 'monitors': monitors}
+
+
+def normalise(value: Any) -> Any:
+    """Canonical form of a config value, so 5, 5.0 and '5' compare equal
+
+    Scalars become strings, mappings are keyed in sorted order and lists of
+    scalars are treated as sets.
+    """
+    if isinstance(value, dict):
+        return {str(k): normalise(v) for k, v in sorted(value.items(), key=lambda item: str(item[0]))}
+    if isinstance(value, (list, tuple)):
+        items = [normalise(item) for item in value]
+        if all(isinstance(item, str) for item in items):
+            return sorted(items)
+        return items
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _key_of(record: Dict[str, Any], key: str) -> Optional[str]:
+    value = record.get(key)
+    return None if value is None else str(value)
+
+
+class Change:
+    """One create, update or delete needed to reach the desired state"""
+
+    __slots__ = ('action', 'monitor_type', 'key', 'monitor_id', 'data', 'fields')
+
+    def __init__(self, action: str, monitor_type: str, key: str, monitor_id: Optional[str] = None,
+                 data: Optional[Dict[str, Any]] = None, fields: Optional[List[str]] = None):
+        self.action = action
+        self.monitor_type = monitor_type
+        self.key = key
+        self.monitor_id = monitor_id
+        self.data = data
+        self.fields = fields or []
+
+    @property
+    def label(self) -> str:
+        return f'{self.action} {self.monitor_type}/{self.key}'
+
+    def as_row(self) -> Dict[str, Any]:
+        return {'action': self.action, 'type': self.monitor_type, 'key': self.key,
+                'monitor_id': self.monitor_id or '', 'fields': ', '.join(self.fields)}
+
+    def __repr__(self) -> str:
+        return f'Change({self.label!r})'
+
+
+def plan(desired: Dict[str, Any], live: Dict[str, Iterable[Dict[str, Any]]],
+         prune: bool = False) -> List[Change]:
+    """Changes turning the ``live`` monitors into the ``desired`` ones
+
+    ``live`` maps each desired monitor type to its full current listing.
+    """
+    key = desired['key']
+    changes = []
+    for monitor_type, definitions in desired['monitors'].items():
+        wanted: Dict[str, Dict[str, Any]] = {}
+        for definition in definitions:
+            name = _key_of(definition, key)
+            if name is None:
+                raise ValidationError(f"A {monitor_type} definition has no '{key}': {definition}")
+            if name in wanted:
+                raise ValidationError(f"Duplicate {monitor_type} definition for {key}={name}")
+            wanted[name] = definition
+
+        # Several live monitors may share a key; all of them are pruned
+        current: Dict[str, List[Dict[str, Any]]] = {}
+        for record in live.get(monitor_type, ()):
+            name = _key_of(record, key)
+            if name is not None:
+                current.setdefault(name, []).append(record)
+
+        for name, definition in wanted.items():
+            records = current.get(name)
+            if not records:
+                changes.append(Change('create', monitor_type, name, data=definition))
+                continue
+            if len(records) > 1:
+                raise ValidationError(f"Several live {monitor_type} share {key}={name}; "
+                                      f"rename them or match on another --key")
+            record = records[0]
+            desired_config = normalise(definition)
+            live_config = normalise({field: record.get(field) for field in definition})
+            if content_hash(desired_config) == content_hash(live_config):
+                continue
+            drifted = [field for field in definition
+                       if desired_config.get(field) != live_config.get(field)]
+            changes.append(Change('update', monitor_type, name, record_id(record), definition, drifted))
+
+        if prune:
+            for name, records in current.items():
+                if name not in wanted:
+                    changes.extend(Change('delete', monitor_type, name, record_id(record))
+                                   for record in records)
+    return changes
+
+
+def apply_change(client: Any, change: Change) -> Dict[str, Any]:
+    """Issue the API call for one change"""
+    endpoint = MONITOR_TYPES[change.monitor_type]
+    if change.action == 'create':
+        # The same defaults bulk-create gives a new monitor
+        response = client.post(endpoint, data=new_monitor(change.data, change.monitor_type))
+    elif change.action == 'update':
+        response = client.put(f'{endpoint}/{change.monitor_id}', data=change.data)
+    else:
+        response = client.delete(f'{endpoint}/{change.monitor_id}')
+    return response.get('data', response) if isinstance(response, dict) else response
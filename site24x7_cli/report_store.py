@@ -0,0 +1,137 @@
+"""
+Incremental on-disk store for performance report samples
+"""
+
+import json
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from site24x7_cli.config import Config
+from site24x7_cli.utils import sanitize_filename
+from site24x7_cli.windows import Window, in_window
+
+
+class ReportStore:
+    """Append-only segment files per monitor plus an index of covered ranges
+
+    Each fetch of a missing range is written to its own NDJSON segment, so
+    segments never overlap and can be streamed in start order. Samples from
+    the last ``settle_margin`` seconds may still change, so that part of a
+    range is never recorded as covered.
+    """
+
+    SETTLE_MARGIN = 15 * 60
+
+    def __init__(self, directory: Optional[str] = None, profile: Optional[str] = None,
+                 settle_margin: float = SETTLE_MARGIN):
+        self.directory = directory or Config.get_report_store_dir(profile)
+        self.settle_margin = settle_margin
+
+    def settled_until(self) -> datetime:
+        """The end of the period whose samples are final"""
+        return _datetime(time.time() - self.settle_margin)
+
+    def missing(self, monitor_id: str, start: datetime, end: datetime) -> List[Window]:
+        """Return the parts of ``[start, end)`` not yet stored"""
+        gaps = []
+        cursor = start.timestamp()
+        stop = end.timestamp()
+        for covered_start, covered_end in self._index(monitor_id)['covered']:
+            if covered_end <= cursor:
+                continue
+            if covered_start >= stop:
+                break
+            if covered_start > cursor:
+                gaps.append((cursor, covered_start))
+            cursor = max(cursor, covered_end)
+        if cursor < stop:
+            gaps.append((cursor, stop))
+        return [(_datetime(gap_start), _datetime(gap_end)) for gap_start, gap_end in gaps]
+
+    def append(self, monitor_id: str, start: datetime, end: datetime,
+               samples: Iterable[Any]) -> int:
+        """Write the samples of a newly fetched range as a new segment
+
+        Ranges reaching past ``settled_until`` are only recorded as covered up
+        to it, so the next run fetches the rest again. The segment is written
+        to a temporary file and only kept when its range is indexed.
+        """
+        start_ts = start.timestamp()
+        end_ts = min(end.timestamp(), time.time() - self.settle_margin)
+        directory = self._monitor_dir(monitor_id)
+        os.makedirs(directory, exist_ok=True)
+
+        name = f"seg-{int(start_ts)}-{int(end_ts)}-{int(time.time() * 1000)}.ndjson"
+        path = os.path.join(directory, name)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        count = 0
+        try:
+            with open(tmp_path, 'w') as f:
+                for sample in samples:
+                    f.write(json.dumps(sample, separators=(',', ':'), default=str) + '\n')
+                    count += 1
+            if end_ts <= start_ts:
+                return count
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        index = self._index(monitor_id)
+        index['segments'].append({'file': name, 'start': start_ts, 'end': end_ts})
+        index['covered'] = _merge(index['covered'] + [[start_ts, end_ts]])
+        self._write_index(monitor_id, index)
+        return count
+
+    def read(self, monitor_id: str, start: datetime, end: datetime) -> Iterator[Any]:
+        """Yield stored samples within ``[start, end)`` in timestamp order"""
+        start_ts, end_ts = start.timestamp(), end.timestamp()
+        directory = self._monitor_dir(monitor_id)
+        segments = sorted(self._index(monitor_id)['segments'], key=lambda segment: segment['start'])
+        for segment in segments:
+            if segment['end'] <= start_ts or segment['start'] >= end_ts:
+                continue
+            low, high = max(start_ts, segment['start']), min(end_ts, segment['end'])
+            try:
+                with open(os.path.join(directory, segment['file']), 'r') as f:
+                    for line in f:
+                        sample = json.loads(line)
+                        # The same rule fetch_windows applies to freshly fetched samples
+                        if in_window(sample, low, high):
+                            yield sample
+            except FileNotFoundError:
+                continue
+
+    def _monitor_dir(self, monitor_id: str) -> str:
+        return os.path.join(self.directory, sanitize_filename(str(monitor_id)))
+
+    def _index(self, monitor_id: str) -> Dict[str, Any]:
+        try:
+            with open(os.path.join(self._monitor_dir(monitor_id), 'index.json'), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {'covered': [], 'segments': []}
+
+    def _write_index(self, monitor_id: str, index: Dict[str, Any]) -> None:
+        path = os.path.join(self._monitor_dir(monitor_id), 'index.json')
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(index, f)
+        os.replace(tmp_path, path)
+
+
+def _merge(ranges: List[List[float]]) -> List[List[float]]:
+    """Merge overlapping or adjacent ranges"""
+    merged: List[List[float]] = []
+    for range_start, range_end in sorted(ranges):
+        if merged and range_start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], range_end)
+        else:
+            merged.append([range_start, range_end])
+    return merged
+
+
+def _datetime(timestamp: float) -> datetime:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc)
@@ -0,0 +1,71 @@
+"""
+Retry policy for Site24x7 API requests
+"""
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import requests
+
+
+class RetryPolicy:
+    """Decide whether and when a failed request is retried
+
+    Delays use full-jitter exponential backoff unless the server sends a
+    ``Retry-After`` header, which always takes precedence.
+    """
+    
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+    
+    def __init__(self, max_retries: int = 3, backoff_base: float = 0.5,
+                 backoff_max: float = 30.0):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+    
+    def should_retry(self, method: str, attempt: int,
+                     response: Optional[requests.Response] = None,
+                     error: Optional[Exception] = None) -> bool:
+        """Return True if another attempt should be made"""
+        if attempt >= self.max_retries:
+            return False
+        
+        if response is not None:
+            if response.status_code == 429:
+                # Throttled requests were never processed, so any method is safe
+                return True
+            return (response.status_code in self.RETRY_STATUSES
+                    and method.upper() in self.IDEMPOTENT_METHODS)
+        
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+            return method.upper() in self.IDEMPOTENT_METHODS
+        return False
+    
+    def delay(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """Seconds to wait before the next attempt"""
+        retry_after = self.retry_after(response)
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+    
+    @staticmethod
+    def retry_after(response: Optional[requests.Response]) -> Optional[float]:
+        """Parse a Retry-After header given in seconds or as an HTTP date"""
+        if response is None:
+            return None
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError):
+            return None
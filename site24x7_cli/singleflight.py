@@ -0,0 +1,77 @@
+"""
+In-flight request deduplication for Site24x7 API calls
+"""
+
+import copy
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _Call:
+    """One in-flight call and the callers waiting on it"""
+
+    __slots__ = ('done', 'result', 'error', 'waiters')
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Collapse concurrent calls with the same key into one
+
+    The first caller (the leader) runs the call; callers arriving while it
+    is in flight wait for it and receive a copy of its result, or the same
+    exception. Nothing is kept once the call completes, so this is not a
+    cache.
+    """
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls: Dict[Hashable, _Call] = {}
+        self.hits = 0
+        self.misses = 0
+    
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Run ``func`` unless an identical call is in flight
+
+        Returns the result and whether it was shared from another caller.
+        """
+        with self.lock:
+            call = self.calls.get(key)
+            leader = call is None
+            if leader:
+                call = self.calls[key] = _Call()
+                self.misses += 1
+            else:
+                call.waiters += 1
+                self.hits += 1
+        
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            # Every caller gets its own copy so one cannot mutate another's data
+            return copy.deepcopy(call.result), True
+        
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self.lock:
+                del self.calls[key]
+                waiters = call.waiters
+            call.done.set()
+        # Followers copy call.result after this returns, so it must stay untouched
+        return (copy.deepcopy(call.result) if waiters else call.result), False
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and the share of calls that were coalesced"""
+        with self.lock:
+            total = self.hits + self.misses
+            return {'hits': self.hits, 'misses': self.misses, 'in_flight': len(self.calls),
+                    'hit_rate': round(self.hits / total, 4) if total else 0.0}
@@ -0,0 +1,120 @@
+"""
+HTTP transport settings for Site24x7 API sessions
+"""
+
+import socket
+from typing import Dict, List, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+from site24x7_cli.config import Config
+
+# Seconds before the first keep-alive probe, between probes, and probes before giving up
+KEEPALIVE_IDLE = 60
+KEEPALIVE_INTERVAL = 15
+KEEPALIVE_COUNT = 4
+
+
+def keepalive_options() -> List[Tuple[int, int, int]]:
+    """Socket options enabling TCP keep-alive, with tuned timers where supported"""
+    options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    for name, value in (('TCP_KEEPIDLE', KEEPALIVE_IDLE), ('TCP_KEEPINTVL', KEEPALIVE_INTERVAL),
+                        ('TCP_KEEPCNT', KEEPALIVE_COUNT)):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    if not hasattr(socket, 'TCP_KEEPIDLE') and hasattr(socket, 'TCP_KEEPALIVE'):
+        # macOS names the idle time option TCP_KEEPALIVE
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, KEEPALIVE_IDLE))
+    return options
+
+
+class TransportAdapter(HTTPAdapter):
+    """HTTPAdapter that applies extra socket options to new connections"""
+
+    def __init__(self, socket_options: Optional[List[Tuple[int, int, int]]] = None, **kwargs):
+        self.socket_options = socket_options
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        if self.socket_options:
+            kwargs['socket_options'] = HTTPConnection.default_socket_options + self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
+class TransportConfig:
+    """Connection pool, timeout, compression and keep-alive settings"""
+
+    FIELDS = ('pool_connections', 'pool_maxsize', 'connect_timeout', 'read_timeout',
+              'compression', 'keepalive')
+
+    def __init__(self, pool_connections: int = Config.DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize: int = Config.DEFAULT_POOL_MAXSIZE,
+                 connect_timeout: float = Config.DEFAULT_CONNECT_TIMEOUT,
+                 read_timeout: float = Config.DEFAULT_READ_TIMEOUT,
+                 compression: bool = True, keepalive: bool = True):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.compression = compression
+        self.keepalive = keepalive
+
+    @classmethod
+    def from_config(cls, pool_connections: Optional[int] = None, pool_maxsize: Optional[int] = None,
+                    connect_timeout: Optional[float] = None, read_timeout: Optional[float] = None,
+                    compression: Optional[bool] = None,
+                    keepalive: Optional[bool] = None) -> 'TransportConfig':
+        """Build settings from explicit values, falling back to Config for the rest"""
+        return cls(
+            Config.get_pool_connections() if pool_connections is None else pool_connections,
+            Config.get_pool_maxsize() if pool_maxsize is None else pool_maxsize,
+            Config.get_connect_timeout() if connect_timeout is None else connect_timeout,
+            Config.get_read_timeout() if read_timeout is None else read_timeout,
+            Config.get_compression_enabled() if compression is None else compression,
+            Config.get_tcp_keepalive_enabled() if keepalive is None else keepalive,
+        )
+
+    @property
+    def timeout(self) -> Optional[Union[float, Tuple[Optional[float], Optional[float]]]]:
+        """The ``timeout`` argument for requests (0 disables either limit)"""
+        if not self.connect_timeout and not self.read_timeout:
+            return None
+        return (self.connect_timeout or None, self.read_timeout or None)
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {'Accept-Encoding': 'gzip, deflate' if self.compression else 'identity'}
+
+    def adapter(self) -> HTTPAdapter:
+        """A connection-pooling adapter built from these settings"""
+        return TransportAdapter(keepalive_options() if self.keepalive else None,
+                                pool_connections=self.pool_connections,
+                                pool_maxsize=self.pool_maxsize)
+
+    def mount(self, session: requests.Session) -> None:
+        """Install these settings on a session"""
+        adapter = self.adapter()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update(self.headers)
+
+    def replace(self, **changes) -> 'TransportConfig':
+        """A copy of these settings with some fields changed"""
+        values = {name: getattr(self, name) for name in self.FIELDS}
+        values.update(changes)
+        return TransportConfig(**values)
+
+    def key(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.FIELDS)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, TransportConfig) and self.key() == other.key()
+
+    def __hash__(self) -> int:
+        return hash(self.key())
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.FIELDS)
+        return f'TransportConfig({fields})'
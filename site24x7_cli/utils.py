@@ -3,6 +3,7 @@ Utility functions for Site24x7 CLI
 """
 
 import json
+import math
 import re
 from typing import Any, Dict, List
 from datetime import datetime
@@ -31,3 +32,32 @@ def parse_key_value_pairs(pairs: List[str]) -> Dict[str, str]:
             key, value = pair.split('=', 1)
             result[key.strip()] = value.strip()
     return result
+
+def percentile(values: List[float], pct: float) -> float:
+    """Return the nearest-rank percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100.0 * len(ordered)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+# Status codes returned by /current_status
+STATUS_NAMES = {
+    0: 'down',
+    1: 'up',
+    2: 'trouble',
+    3: 'critical',
+    5: 'suspended',
+    7: 'maintenance',
+    9: 'discovery',
+    10: 'configuration error',
+}
+
+
+def status_name(status: Any) -> str:
+    """Translate a numeric status code to its name"""
+    try:
+        return STATUS_NAMES.get(int(status), str(status))
+    except (TypeError, ValueError):
+        return str(status)
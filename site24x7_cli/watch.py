@@ -0,0 +1,91 @@
+"""
+Status snapshot diffing and adaptive polling for Site24x7 CLI
+"""
+
+import time
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, List, Optional
+
+from site24x7_cli.utils import status_name
+
+
+def snapshot(response: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
+    """Reduce a /current_status response to ``{monitor_id: {name, status}}``"""
+    data = response.get('data', response)
+    monitors = list(data.get('monitors') or [])
+    for group in data.get('monitor_groups') or []:
+        monitors.extend(group.get('monitors') or [])
+
+    result = {}
+    for monitor in monitors:
+        monitor_id = monitor.get('monitor_id')
+        if monitor_id is None:
+            continue
+        result[str(monitor_id)] = {
+            'name': monitor.get('name') or monitor.get('display_name') or '',
+            'status': status_name(monitor.get('status')),
+        }
+    return result
+
+
+def diff_snapshots(previous: Dict[str, Dict[str, str]],
+                   current: Dict[str, Dict[str, str]]) -> List[Dict[str, Any]]:
+    """Return the status transitions between two snapshots"""
+    transitions = []
+    for monitor_id, state in current.items():
+        before = previous.get(monitor_id)
+        old_status = before['status'] if before else None
+        if old_status != state['status']:
+            transitions.append({'monitor_id': monitor_id, 'name': state['name'],
+                                'from': old_status, 'to': state['status']})
+    for monitor_id, state in previous.items():
+        if monitor_id not in current:
+            transitions.append({'monitor_id': monitor_id, 'name': state['name'],
+                                'from': state['status'], 'to': None})
+    return transitions
+
+
+class FlapDetector:
+    """Flag monitors that change state repeatedly within a time window"""
+
+    def __init__(self, threshold: int = 3, window: float = 600.0):
+        self.threshold = threshold
+        self.window = window
+        self.history: Dict[str, Deque[float]] = defaultdict(deque)
+
+    def record(self, transitions: List[Dict[str, Any]], now: Optional[float] = None) -> List[str]:
+        """Record transitions and return the IDs of monitors currently flapping"""
+        now = time.monotonic() if now is None else now
+        for transition in transitions:
+            self.history[transition['monitor_id']].append(now)
+
+        flapping = []
+        for monitor_id in list(self.history):
+            times = self.history[monitor_id]
+            while times and now - times[0] > self.window:
+                times.popleft()
+            if not times:
+                del self.history[monitor_id]
+            elif len(times) >= self.threshold:
+                flapping.append(monitor_id)
+        return flapping
+
+
+class AdaptiveInterval:
+    """Polling interval that backs off when quiet and tightens on activity"""
+
+    def __init__(self, minimum: float = 5.0, maximum: float = 120.0, factor: float = 1.5):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.factor = factor
+        self.current = minimum
+
+    def next(self, changed: bool, flapping: bool = False) -> float:
+        """Return the delay before the next poll"""
+        if flapping:
+            self.current = self.minimum
+        elif changed:
+            self.current = max(self.minimum, self.current / (self.factor * self.factor))
+        else:
+            self.current = min(self.maximum, self.current * self.factor)
+        return self.current
@@ -0,0 +1,39 @@
+"""
+Shared fixtures for the Site24x7 CLI tests
+"""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+from mock_server import MockSite24x7  # noqa: E402
+
+from site24x7_cli.auth import AuthManager  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def isolated_env(tmp_path, monkeypatch):
+    """Keep every test's credentials and local state under its own directory"""
+    monkeypatch.setenv('SITE24X7_OAUTH_TOKEN', 'x' * 30)
+    monkeypatch.setenv('HOME', str(tmp_path))
+    for name, path in (('CACHE_DIR', 'cache'), ('MIRROR_PATH', 'inventory.db'),
+                       ('REPORT_STORE_DIR', 'reports'), ('DAEMON_SOCKET', 'daemon.sock'),
+                       ('JOBS_DIR', 'jobs')):
+        monkeypatch.setenv(f'SITE24X7_{name}', str(tmp_path / path))
+    monkeypatch.delenv('SITE24X7_CACHE', raising=False)
+    monkeypatch.delenv('SITE24X7_PROFILE', raising=False)
+    monkeypatch.setattr(AuthManager, 'CONFIG_FILE', str(tmp_path / 'credentials.json'))
+    monkeypatch.setattr(AuthManager, '_loaded', None)
+
+
+@pytest.fixture
+def mock_api(monkeypatch):
+    """A local Site24x7 stand-in the client is pointed at"""
+    with MockSite24x7(monitors=120) as server:
+        monkeypatch.setenv('SITE24X7_BASE_URL', server.url)
+        yield server
@@ -0,0 +1,128 @@
+"""
+Performance report aggregation and 'performance-reports aggregate'
+"""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from site24x7_cli import aggregate
+from site24x7_cli.aggregate import ReportAggregator, extract_points, summarise
+from site24x7_cli.base import Site24x7Client
+from site24x7_cli.mirror import InventoryMirror
+
+
+def test_extract_points_from_each_report_shape():
+    samples = [{'response_time': 100, 'availability': 100}, {'value': '200', 'status': 0},
+               {'average_response_time': 300}, {'response_time': None}, {'value': 'n/a'}]
+    assert list(extract_points({'data': {'chart_data': samples}})) == [
+        (100.0, 100.0), (200.0, 0.0), (300.0, None)]
+    assert list(extract_points([[1700000000, 120], [1700000300, 'x'], 'junk'])) == [(120.0, None)]
+    assert list(extract_points({'response_time': 5, 'status': 'up'})) == [(5.0, 100.0)]
+
+
+@pytest.mark.parametrize('numpy', [False, True])
+def test_summarise(monkeypatch, numpy):
+    if numpy:
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(aggregate, 'np', None)
+    from array import array
+
+    summary = summarise(array('d', range(1, 101)), array('d', [100, 100, 0, 100]))
+    assert summary == {'samples': 100, 'mean': 50.5, 'min': 1, 'max': 100,
+                       'p50': 50, 'p95': 95, 'p99': 99, 'availability': 75.0}
+    empty = summarise(array('d'), array('d'))
+    assert empty['samples'] == 0 and empty['mean'] is None and empty['availability'] is None
+
+
+def test_aggregator_rows():
+    aggregator = ReportAggregator()
+    aggregator.add('1', [{'response_time': 10}, {'response_time': 30}], 'shop', 'g1')
+    aggregator.add('2', [{'response_time': 50, 'availability': 0}], 'blog', 'g1')
+    aggregator.add('3', [{'response_time': 70}])
+    rows = {(row['scope'], row['id']): row for row in aggregator.rows()}
+
+    assert rows[('monitor', '1')]['mean'] == 20 and rows[('monitor', '1')]['name'] == 'shop'
+    assert rows[('monitor', '3')]['group_id'] == ''
+    group = rows[('group', 'g1')]
+    assert (group['samples'], group['max'], group['availability']) == (3, 50, 0.0)
+    assert len(rows) == 4
+
+
+@pytest.fixture
+def reports(monkeypatch):
+    """Stubbed report endpoint; monitor 999 fails"""
+    requested = []
+
+    def get(self, endpoint, params=None, **kwargs):
+        monitor_id = endpoint.rsplit('/', 1)[1]
+        requested.append((monitor_id, params))
+        if monitor_id == '999':
+            raise RuntimeError('not found')
+        return {'data': {'chart_data': [{'response_time': int(monitor_id) % 100 + i} for i in range(3)]}}
+
+    monkeypatch.setattr(Site24x7Client, 'get', get)
+    return requested
+
+
+def test_aggregate_command(reports, tmp_path):
+    from site24x7_cli.main import cli
+
+    mirror = InventoryMirror()
+    mirror.sync('website-monitors', [{'monitor_id': '110', 'display_name': 'a', 'group_id': '7'},
+                                     {'monitor_id': '120', 'display_name': 'b', 'group_id': '7'},
+                                     {'monitor_id': '130', 'display_name': 'c', 'group_id': '8'}])
+    mirror.close()
+
+    result = CliRunner().invoke(cli, ['-o', 'json', 'reports', 'performance-reports', 'aggregate',
+                                      '--group-id', '7', '-m', '999', '--period', '3'])
+    assert result.exit_code == 0, result.output
+    rows = json.loads(result.output[result.output.index('['):])
+    assert sorted((row['scope'], row['id']) for row in rows) == [
+        ('group', '7'), ('monitor', '110'), ('monitor', '120')]
+    assert {row['id']: row['mean'] for row in rows}['110'] == 11
+    assert sorted(monitor_id for monitor_id, _ in reports) == ['110', '120', '999']
+    assert all(params == {'period': '3'} for _, params in reports)
+    assert 'Skipping 999' in result.output
+
+
+def test_aggregate_needs_targets(reports):
+    from site24x7_cli.main import cli
+
+    result = CliRunner().invoke(cli, ['reports', 'performance-reports', 'aggregate'])
+    assert result.exit_code != 0 and not reports
+
+
+def test_aggregate_against_the_mock_api(mock_api):
+    from site24x7_cli.main import cli
+
+    runner = CliRunner()
+    assert runner.invoke(cli, ['sync', '--type', 'website-monitors']).exit_code == 0
+    result = runner.invoke(cli, ['-o', 'json', 'reports', 'performance-reports', 'aggregate',
+                                 '--group-id', '3', '-j', '4'])
+    assert result.exit_code == 0, result.output
+    rows = json.loads(result.output[result.output.index('['):])
+
+    members = [m['monitor_id'] for m in mock_api.data['website-monitors'] if m['group_id'] == '3']
+    assert sorted(row['id'] for row in rows if row['scope'] == 'monitor') == sorted(members)
+    group = next(row for row in rows if row['scope'] == 'group')
+    assert group['samples'] == len(members) * mock_api.samples
+    assert group['min'] <= group['p50'] <= group['p95'] <= group['max']
+
+
+def test_group_members_come_from_the_api_without_a_mirror(mock_api):
+    from site24x7_cli.main import cli
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ['-o', 'json', 'reports', 'performance-reports', 'aggregate',
+                                 '--group-id', '7'])
+    assert result.exit_code == 0, result.output
+    rows = json.loads(result.output[result.output.index('['):])
+
+    members = {m['monitor_id'] for m in mock_api.data['website-monitors'] if m['group_id'] == '7'}
+    assert {row['id'] for row in rows if row['scope'] == 'monitor'} == members
+
+    result = runner.invoke(cli, ['reports', 'performance-reports', 'aggregate', '--group-id', '99'])
+    assert result.exit_code == 1 and 'No monitors in group 99' in result.output
@@ -0,0 +1,124 @@
+"""
+The asyncio client engine and 'aggregate --async'
+"""
+
+import asyncio
+import json
+import threading
+
+import pytest
+from click.testing import CliRunner
+
+from site24x7_cli import async_client
+from site24x7_cli.ratelimit import TokenBucket
+
+pytest.importorskip('aiohttp')
+
+
+async def fetch(client, monitor_id):
+    return await client.get(f'/api/website-monitors/{monitor_id}')
+
+
+def test_token_bucket_reserve():
+    bucket = TokenBucket(10)
+    waits = [bucket.reserve() for _ in range(int(bucket.capacity) + 3)]
+    assert waits[0] == 0
+    # Reservations past the burst queue up a tenth of a second apart
+    assert waits[-1] == pytest.approx(0.3, abs=0.05)
+    assert TokenBucket(0).reserve() == 0
+
+
+def test_run_bulk_async(mock_api):
+    ids = [str(100000 + i) for i in range(50)] + ['999']
+    results = list(async_client.run_bulk_async(fetch, ids, concurrency=10))
+
+    assert sorted(result.index for result in results) == list(range(1, 52))
+    failed = [result for result in results if not result.ok]
+    assert [result.item for result in failed] == ['999']
+    assert {result.result['data']['monitor_id'] for result in results if result.ok} == set(ids[:-1])
+
+
+def test_async_client_retries_throttling(mock_api):
+    mock_api.throttle_rate = 0.3
+
+    async def main():
+        async with async_client.AsyncSite24x7Client(max_retries=20, concurrency=5) as client:
+            client.retry_policy.backoff_base = 0.001
+            return await asyncio.gather(*(fetch(client, 100000 + i) for i in range(20)))
+
+    responses = asyncio.run(main())
+    assert [response['data']['monitor_id'] for response in responses] == [str(100000 + i) for i in range(20)]
+    assert mock_api.stats['throttled'] > 0
+    assert mock_api.stats['requests'] == 20 + mock_api.stats['throttled']
+
+
+def test_async_client_needs_opening():
+    client = async_client.AsyncSite24x7Client()
+    with pytest.raises(RuntimeError):
+        asyncio.run(client.get('/api/website-monitors'))
+
+
+def test_missing_aiohttp_gives_an_install_hint(monkeypatch):
+    monkeypatch.setattr(async_client, 'aiohttp', None)
+    with pytest.raises(ImportError, match='site24x7-cli\\[async\\]'):
+        async_client.AsyncSite24x7Client()
+
+
+def test_aggregate_async_matches_threads(mock_api):
+    from site24x7_cli.main import cli
+
+    ids = [arg for i in range(12) for arg in ('-m', str(100000 + i))]
+    runner = CliRunner()
+    outputs = []
+    for engine in ([], ['--async']):
+        result = runner.invoke(cli, ['-o', 'json', 'reports', 'performance-reports', 'aggregate',
+                                     '-j', '4', *engine, *ids])
+        assert result.exit_code == 0, result.output
+        rows = json.loads(result.output[result.output.index('['):])
+        outputs.append(sorted((row['id'], row['samples'], row['mean']) for row in rows))
+    assert outputs[0] == outputs[1] and len(outputs[0]) == 12
+
+
+def test_run_bulk_async_stops_when_closed(mock_api):
+    mock_api.latency = 0.02
+    results = async_client.run_bulk_async(fetch, (str(100000 + i) for i in range(100)), concurrency=4)
+    next(results)
+    results.close()
+
+    assert not any(thread.name == 'site24x7-async' for thread in threading.enumerate())
+    assert mock_api.stats['requests'] < 100
+
+
+def test_run_bulk_async_reports_in_flight_items_when_the_input_fails(mock_api):
+    def ids():
+        yield from ('100001', '100002')
+        raise ValueError('bad input')
+
+    seen = []
+    with pytest.raises(ValueError):
+        for result in async_client.run_bulk_async(fetch, ids(), concurrency=4):
+            seen.append(result.index)
+    assert sorted(seen) == [1, 2]
+
+
+def test_bulk_commands_on_the_async_engine(mock_api, tmp_path):
+    from site24x7_cli.main import cli
+
+    runner = CliRunner()
+    definitions = tmp_path / 'monitors.ndjson'
+    definitions.write_text(''.join(f'{{"name": "new-{i}", "website": "https://n{i}"}}\n' for i in range(8)))
+    result = runner.invoke(cli, ['monitor-management', 'api-monitors', 'bulk-create',
+                                 str(definitions), '-j', '4', '--async'])
+    assert result.exit_code == 0, result.output
+    created = [m for m in mock_api.data['api-monitors'] if m['display_name'].startswith('new-')]
+    assert len(created) == 8 and all(m['monitor_type'] == 'API-MONITORS' for m in created)
+
+    result = runner.invoke(cli, ['monitor-management', 'api-monitors', 'bulk-update',
+                                 '--name-pattern', 'new-*', '-p', 'timeout=15', '--force', '--async'])
+    assert result.exit_code == 0, result.output
+    assert all(m['timeout'] == '15' for m in created)
+
+    result = runner.invoke(cli, ['monitor-management', 'api-monitors', 'bulk-delete',
+                                 '--name-pattern', 'new-*', '--force', '--async'])
+    assert result.exit_code == 0, result.output
+    assert len(mock_api.data['api-monitors']) == 120
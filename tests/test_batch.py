@@ -0,0 +1,105 @@
+"""
+'site24x7 batch' and batch script parsing
+"""
+
+import json
+import sys
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from site24x7_cli import base
+from site24x7_cli.base import Site24x7Client
+from site24x7_cli.invoke import parse_script
+
+
+@pytest.fixture(autouse=True)
+def restore_state(monkeypatch):
+    """batch shares clients process-wide and swaps sys.stdout/sys.stderr"""
+    monkeypatch.setattr(base, '_shared_sessions', None)
+    monkeypatch.setattr(base, '_shared_clients', None)
+    monkeypatch.setattr(sys, 'stdout', sys.stdout)
+    monkeypatch.setattr(sys, 'stderr', sys.stderr)
+
+
+@pytest.fixture
+def clients(monkeypatch):
+    """Stubbed GET by ID; returns the ids of the clients that made requests"""
+    seen = []
+
+    def get(self, endpoint, params=None, **kwargs):
+        seen.append(id(self))
+        return {'code': 0, 'data': {'monitor_id': endpoint.rsplit('/', 1)[1], 'display_name': 'shop'}}
+
+    monkeypatch.setattr(Site24x7Client, 'get', get)
+    return seen
+
+
+def test_parse_script_lines_and_json():
+    text = "# nightly\nsite24x7 auth status\n\nmonitor-management website-monitors get 1  # one\n"
+    assert parse_script(text) == [(2, ['auth', 'status']),
+                                  (4, ['monitor-management', 'website-monitors', 'get', '1'])]
+    assert parse_script('["auth status", ["sync", "--type", "x"], {"args": ["site24x7", "auth"]}]') == [
+        (1, ['auth', 'status']), (2, ['sync', '--type', 'x']), (3, ['auth'])]
+    with pytest.raises(click.BadParameter):
+        parse_script('[1]')
+    with pytest.raises(click.BadParameter):
+        parse_script('auth "status')
+
+
+def _results(output):
+    return [json.loads(line) for line in output.splitlines() if line.startswith('{')]
+
+
+def test_batch_runs_every_line_with_global_defaults(clients, tmp_path):
+    from site24x7_cli.main import cli
+
+    script = tmp_path / 'script.txt'
+    script.write_text("monitor-management website-monitors get 123456789\n"
+                      "# comment\n"
+                      "site24x7 -o table monitor-management website-monitors get 987654321\n"
+                      "daemon status\n")
+    result = CliRunner().invoke(cli, ['-o', 'json', 'batch', str(script)])
+    assert result.exit_code == 1
+
+    results = _results(result.output)
+    assert [(r['line'], r['exit_code']) for r in results] == [(1, 0), (3, 0), (4, 2)]
+    assert json.loads(results[0]['stdout'])['monitor_id'] == '123456789'
+    assert '"display_name"' not in results[1]['stdout']
+    assert "cannot be used in a batch script" in results[2]['stderr']
+    # Both commands used one shared client
+    assert len(clients) == 2 and len(set(clients)) == 1
+
+
+def test_batch_stop_on_error_and_parallel(clients, tmp_path):
+    from site24x7_cli.main import cli
+
+    script = tmp_path / 'script.json'
+    script.write_text(json.dumps(['no-such-command'] +
+                                 [f'monitor-management website-monitors get {100000000 + i}' for i in range(6)]))
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ['batch', '--stop-on-error', str(script)])
+    assert [r['line'] for r in _results(result.output)] == [1] and not clients
+
+    result = runner.invoke(cli, ['-o', 'json', 'batch', '-j', '3', str(script)])
+    results = _results(result.output)
+    assert sorted(r['line'] for r in results) == list(range(1, 8))
+    assert sum(r['exit_code'] != 0 for r in results) == 1 and len(clients) == 6
+
+
+def test_batch_against_the_mock_api(mock_api, tmp_path):
+    from site24x7_cli.main import cli
+
+    script = tmp_path / 'script.txt'
+    script.write_text("monitor-management website-monitors get 100001\n"
+                      "monitor-management website-monitors get 999\n"
+                      "monitor-management api-monitors list --limit 3\n")
+    result = CliRunner().invoke(cli, ['-o', 'json', 'batch', '-j', '2', str(script)])
+    assert result.exit_code == 1
+    results = {r['line']: r for r in _results(result.output)}
+    assert json.loads(results[1]['stdout'])['display_name'] == 'website-000001'
+    assert results[2]['exit_code'] == 1
+    assert len(json.loads(results[3]['stdout'])) == 3
+    assert mock_api.stats['requests'] == 3
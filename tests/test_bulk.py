@@ -0,0 +1,270 @@
+"""
+Bulk operations: input parsing, the bounded worker pool and the bulk commands
+"""
+
+import io
+import json
+import os
+import threading
+import time
+
+import pytest
+from click.testing import CliRunner
+
+from site24x7_cli.base import Site24x7Client
+from site24x7_cli.bulk import (BulkResult, BulkStats, match_name, read_ids, read_records, record_id,
+                               run_bulk)
+from site24x7_cli.exceptions import ValidationError
+
+
+def test_read_ndjson_records():
+    stream = io.StringIO('{"name": "a"}\n\n{"name": "b", "timeout": 10}\n')
+    assert list(read_records(stream)) == [{'name': 'a'}, {'name': 'b', 'timeout': 10}]
+
+
+def test_read_csv_records_drops_empty_cells():
+    stream = io.StringIO('name,website,timeout\na,https://a,\nb,https://b,10\n')
+    stream.name = 'monitors.csv'
+    assert list(read_records(stream)) == [{'name': 'a', 'website': 'https://a'},
+                                          {'name': 'b', 'website': 'https://b', 'timeout': '10'}]
+
+
+@pytest.mark.parametrize('text', ['{"name": "a"}\nnot json\n', '["a"]\n'])
+def test_invalid_records_name_their_line(text):
+    records = read_records(io.StringIO(text))
+    with pytest.raises(ValidationError, match='Line'):
+        list(records)
+
+
+def test_read_ids_skips_blanks_and_comments():
+    assert read_ids(io.StringIO('101\n\n# header\n102  # old\n 103 \n')) == ['101', '102', '103']
+
+
+def test_match_name():
+    assert match_name({'display_name': 'web-shop'}, 'web-*')
+    assert match_name({'name': 'web-shop'}, '*shop')
+    assert not match_name({'display_name': 'api-shop'}, 'web-*')
+    assert match_name({}, None)
+
+
+def test_record_id():
+    assert record_id({'monitor_id': 5}) == '5'
+    assert record_id({'id': 'x'}) == 'x'
+    assert record_id({'name': 'a'}) is None
+
+
+def test_run_bulk_reports_every_item():
+    results = list(run_bulk(lambda n: 10 // n, [5, 0, 2], concurrency=2))
+
+    by_index = {result.index: result for result in results}
+    assert sorted(by_index) == [1, 2, 3]
+    assert by_index[1].result == 2 and by_index[3].result == 5
+    assert isinstance(by_index[2].error, ZeroDivisionError) and not by_index[2].ok
+
+
+def test_run_bulk_bounds_items_in_flight():
+    pulled = []
+    lock = threading.Lock()
+    active = [0, 0]
+
+    def items():
+        for i in range(40):
+            pulled.append(i)
+            yield i
+
+    def work(item):
+        with lock:
+            active[0] += 1
+            active[1] = max(active)
+        time.sleep(0.005)
+        with lock:
+            active[0] -= 1
+
+    results = run_bulk(work, items(), concurrency=4)
+    next(results)
+    assert len(pulled) <= 4 * 2 + 1
+    assert len(list(results)) == 39
+    assert active[1] <= 4
+
+
+def test_stats_summary():
+    stats = BulkStats()
+    for latency, error in ((0.01, None), (0.02, None), (0.03, RuntimeError())):
+        stats.add(BulkResult(1, None, error=error, latency=latency))
+    summary = stats.summary()
+    assert (summary['total'], summary['succeeded'], summary['failed']) == (3, 2, 1)
+    assert summary['p50_ms'] == pytest.approx(20.0)
+
+
+@pytest.fixture
+def posted(monkeypatch):
+    """Record POSTs instead of sending them; names containing 'bad' fail"""
+    posted = []
+
+    def post(self, endpoint, data=None, **kwargs):
+        if 'bad' in data['display_name']:
+            raise RuntimeError('rejected')
+        posted.append((endpoint, data))
+        return {'code': 0, 'data': dict(data, monitor_id=str(900000 + len(posted)))}
+
+    monkeypatch.setattr(Site24x7Client, 'post', post)
+    return posted
+
+
+def test_bulk_create_command(posted):
+    from site24x7_cli.main import cli
+
+    definitions = '{"name": "a", "website": "https://a"}\n{"display_name": "bad"}\n{"name": "c"}\n'
+    result = CliRunner().invoke(cli, ['-o', 'json', 'monitor-management', 'website-monitors',
+                                      'bulk-create', '-'], input=definitions)
+
+    assert result.exit_code != 0
+    assert sorted(data['display_name'] for _, data in posted) == ['a', 'c']
+    endpoint, data = posted[0]
+    assert endpoint == '/api/website-monitors'
+    assert data['monitor_type'] == 'WEBSITE-MONITORS' and data['check_frequency'] == '5'
+    lines = [json.loads(line) for line in result.output.splitlines() if line.startswith('{')]
+    assert sorted(line['ok'] for line in lines if 'index' in line) == [False, True, True]
+    assert lines[-1]['summary']['failed'] == 1
+
+
+@pytest.fixture
+def inventory(monkeypatch):
+    """Serve a stubbed monitor listing and record the PUTs and DELETEs made against it"""
+    monitors = [{'monitor_id': str(100 + i), 'display_name': f'web-{i}', 'status': ('down', 'up')[i % 2]}
+                for i in range(6)]
+    calls = []
+
+    def get(self, endpoint, params=None, **kwargs):
+        records = [m for m in monitors if params.get('status') in (None, m['status'])]
+        return {'data': records[params['offset']:params['offset'] + params['limit']]}
+
+    def put(self, endpoint, data=None, **kwargs):
+        calls.append(('PUT', endpoint, data))
+        return {'data': data}
+
+    def delete(self, endpoint, **kwargs):
+        calls.append(('DELETE', endpoint, None))
+        return {'code': 0}
+
+    for name, func in (('get', get), ('put', put), ('delete', delete)):
+        monkeypatch.setattr(Site24x7Client, name, func)
+    return calls
+
+
+def test_bulk_delete_by_status(inventory):
+    from site24x7_cli.main import cli
+
+    result = CliRunner().invoke(cli, ['monitor-management', 'website-monitors', 'bulk-delete',
+                                      '--status', 'up', '--force'])
+    assert result.exit_code == 0, result.output
+    assert sorted(endpoint for _, endpoint, _ in inventory) == [
+        '/api/website-monitors/101', '/api/website-monitors/103', '/api/website-monitors/105']
+
+
+def test_bulk_update_by_name_needs_confirmation(inventory):
+    from site24x7_cli.main import cli
+
+    args = ['monitor-management', 'website-monitors', 'bulk-update', '--name-pattern', 'web-[12]',
+            '-p', 'timeout=10']
+    result = CliRunner().invoke(cli, args, input='n\n')
+    assert result.exit_code != 0 and not inventory
+
+    result = CliRunner().invoke(cli, args, input='y\n')
+    assert result.exit_code == 0, result.output
+    assert sorted(endpoint for _, endpoint, _ in inventory) == [
+        '/api/website-monitors/101', '/api/website-monitors/102']
+    assert all(data == {'timeout': '10'} for _, _, data in inventory)
+
+
+def test_bulk_delete_from_an_ids_file(inventory, tmp_path):
+    from site24x7_cli.main import cli
+
+    ids_file = tmp_path / 'ids.txt'
+    ids_file.write_text('200\n201\n')
+    result = CliRunner().invoke(cli, ['monitor-management', 'api-monitors', 'bulk-delete',
+                                      '--ids-file', str(ids_file), '--force'])
+    assert result.exit_code == 0, result.output
+    assert sorted(endpoint for _, endpoint, _ in inventory) == ['/api/api-monitors/200',
+                                                                '/api/api-monitors/201']
+
+
+def test_bulk_commands_against_the_mock_api(mock_api, tmp_path):
+    from site24x7_cli.main import cli
+
+    runner = CliRunner()
+    definitions = tmp_path / 'monitors.csv'
+    definitions.write_text('name,website\n' + ''.join(f'new-{i},https://n{i}\n' for i in range(12)))
+    result = runner.invoke(cli, ['monitor-management', 'website-monitors', 'bulk-create',
+                                 str(definitions), '-j', '4'])
+    assert result.exit_code == 0, result.output
+    created = [m for m in mock_api.data['website-monitors'] if m['display_name'].startswith('new-')]
+    assert len(created) == 12 and all(m['monitor_type'] == 'WEBSITE-MONITORS' for m in created)
+
+    result = runner.invoke(cli, ['monitor-management', 'website-monitors', 'bulk-update',
+                                 '--name-pattern', 'new-*', '-p', 'timeout=15', '--force'])
+    assert result.exit_code == 0, result.output
+    assert all(m['timeout'] == '15' for m in created)
+
+    result = runner.invoke(cli, ['monitor-management', 'website-monitors', 'bulk-delete',
+                                 '--name-pattern', 'new-1*', '--force'])
+    assert result.exit_code == 0, result.output
+    assert sorted(m['display_name'] for m in mock_api.data['website-monitors']
+                  if m['display_name'].startswith('new-')) == ['new-0'] + [f'new-{i}' for i in range(2, 10)]
+    assert len(mock_api.data['website-monitors']) == 129
+
+
+def test_run_bulk_drains_in_flight_items_when_the_input_fails():
+    def items():
+        yield from range(3)
+        raise ValueError('bad input')
+
+    seen = []
+    with pytest.raises(ValueError):
+        for result in run_bulk(lambda n: n, items(), concurrency=8):
+            seen.append(result.index)
+    assert sorted(seen) == [1, 2, 3]
+
+
+def test_bulk_create_with_a_bad_line_keeps_earlier_creates(mock_api):
+    from site24x7_cli.main import cli
+
+    good = ''.join(json.dumps({'name': f'new-{i}'}) + '\n' for i in range(3))
+    runner = CliRunner()
+    args = ['-o', 'ndjson', 'monitor-management', 'website-monitors', 'bulk-create']
+    result = runner.invoke(cli, args, input=good + 'not json\n')
+    assert result.exit_code != 0
+    assert sum(1 for line in result.output.splitlines() if '"ok": true' in line) == 3
+
+    # The journal holds the three creates, so a resume only sends the fixed line
+    job_id = os.listdir(os.environ['SITE24X7_JOBS_DIR'])[0][:-len('.jsonl')]
+    result = runner.invoke(cli, args + ['--resume', job_id], input=good + '{"name": "new-3"}\n')
+    assert result.exit_code == 0, result.output
+    names = [m['display_name'] for m in mock_api.data['website-monitors'] if m['display_name'].startswith('new-')]
+    assert sorted(names) == ['new-0', 'new-1', 'new-2', 'new-3']
+
+
+@pytest.mark.parametrize('args, stdin, message', [
+    (['--ids-file', 'IDS'], None, 'Invalid ID format in --ids-file: abc'),
+    (['--ids-file', '-'], '100001\n', '--force is required'),
+    (['--ids-file', 'IDS', '--force', '--status', 'up'], None, 'cannot be combined'),
+])
+def test_ids_file_validation(mock_api, tmp_path, args, stdin, message):
+    from site24x7_cli.main import cli
+
+    ids_file = tmp_path / 'ids.txt'
+    ids_file.write_text('100001\nabc\n')
+    args = [str(ids_file) if arg == 'IDS' else arg for arg in args]
+    result = CliRunner().invoke(cli, ['monitor-management', 'website-monitors', 'bulk-delete', *args],
+                                input=stdin)
+    assert result.exit_code != 0 and message in result.output
+    assert mock_api.stats['requests'] == 0
+
+
+def test_ids_from_stdin_with_force(mock_api):
+    from site24x7_cli.main import cli
+
+    result = CliRunner().invoke(cli, ['monitor-management', 'website-monitors', 'bulk-delete',
+                                      '--ids-file', '-', '--force'], input='100001\n100002\n')
+    assert result.exit_code == 0, result.output
+    assert len(mock_api.data['website-monitors']) == 118
@@ -0,0 +1,147 @@
+"""
+Response cache freshness and conditional revalidation
+"""
+
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from click.testing import CliRunner
+
+from site24x7_cli.base import Site24x7Client
+from site24x7_cli.cache import ResponseCache, cache_scope
+
+
+class _ETagServer:
+    """Serves one versioned document, answering 304 to a matching If-None-Match"""
+
+    def __init__(self):
+        self.version = 1
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                etag = f'"v{server.version}"'
+                server.requests.append(dict(self.headers))
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                body = json.dumps({'data': {'version': server.version}}).encode('utf-8')
+                self.send_response(200)
+                self.send_header('ETag', etag)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True).start()
+        self.url = 'http://127.0.0.1:%d' % self.server.server_address[1]
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def etag_api():
+    server = _ETagServer()
+    yield server
+    server.stop()
+
+
+def _client(server, cache, **kwargs):
+    client = Site24x7Client(cache=cache, **kwargs)
+    client.base_url = server.url
+    return client
+
+
+def test_fresh_entries_are_served_without_a_request(etag_api, tmp_path):
+    client = _client(etag_api, ResponseCache(str(tmp_path), default_ttl=60))
+    assert client.get('/api/thing') == {'data': {'version': 1}}
+    assert client.get('/api/thing') == {'data': {'version': 1}}
+    assert len(etag_api.requests) == 1
+
+
+def test_stale_entries_are_revalidated(etag_api, tmp_path):
+    cache = ResponseCache(str(tmp_path), default_ttl=0)
+    client = _client(etag_api, cache)
+    client.get('/api/thing')
+    stored_at = cache.lookup('/api/thing')['stored_at']
+    time.sleep(0.01)
+
+    assert client.get('/api/thing') == {'data': {'version': 1}}
+    assert etag_api.requests[-1].get('If-None-Match') == '"v1"'
+    # A 304 restarts the entry's TTL
+    assert cache.lookup('/api/thing')['stored_at'] > stored_at
+
+    etag_api.version = 2
+    assert client.get('/api/thing') == {'data': {'version': 2}}
+    assert cache.lookup('/api/thing')['etag'] == '"v2"'
+
+
+def test_refresh_bypasses_the_cache(etag_api, tmp_path):
+    cache = ResponseCache(str(tmp_path), default_ttl=60)
+    _client(etag_api, cache).get('/api/thing')
+    etag_api.version = 2
+
+    client = _client(etag_api, cache, refresh=True)
+    assert client.get('/api/thing') == {'data': {'version': 2}}
+    assert 'If-None-Match' not in etag_api.requests[-1]
+
+
+def test_ttl_uses_the_longest_matching_prefix(tmp_path):
+    cache = ResponseCache(str(tmp_path), default_ttl=60,
+                          ttls={'/api': 10, '/api/performance-reports/1': 1})
+    assert cache.ttl('/current_status') == 30
+    assert cache.ttl('/api/website-monitors') == 10
+    assert cache.ttl('/api/performance-reports/2') == 300
+    assert cache.ttl('/api/performance-reports/1') == 1
+    assert cache.ttl('/other') == 60
+
+
+def test_scopes_do_not_share_entries(tmp_path):
+    first = ResponseCache(str(tmp_path), scope=cache_scope('https://x', 'token-a'))
+    second = ResponseCache(str(tmp_path), scope=cache_scope('https://x', 'token-b'))
+    first.store('/api/thing', None, {'owner': 'a'})
+
+    assert first.lookup('/api/thing')['data'] == {'owner': 'a'}
+    assert second.lookup('/api/thing') is None
+
+
+def test_accounts_get_their_own_cached_responses(mock_api):
+    from site24x7_cli.main import cli
+
+    runner = CliRunner()
+    for token, requests in (('a' * 30, 1), ('a' * 30, 1), ('b' * 30, 2)):
+        result = runner.invoke(cli, ['--token', token, '--cache', 'monitor-management',
+                                     'website-monitors', 'get', '100001'])
+        assert result.exit_code == 0, result.output
+        assert mock_api.stats['requests'] == requests
+    # The token itself never reaches the disk
+    for root, _, names in os.walk(os.environ['SITE24X7_CACHE_DIR']):
+        for name in names:
+            with open(os.path.join(root, name), 'rb') as f:
+                assert b'a' * 30 not in f.read()
+
+
+def test_eviction_keeps_the_cache_under_its_limit(tmp_path):
+    cache = ResponseCache(str(tmp_path), max_bytes=2000)
+    for i in range(20):
+        cache.store(f'/api/thing/{i}', None, {'payload': 'x' * 200})
+
+    assert cache._disk_usage() <= 2000
+    assert cache.lookup('/api/thing/19') is not None
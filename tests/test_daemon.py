@@ -0,0 +1,146 @@
+"""
+Background daemon, its socket protocol and in-process command capture
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+import pytest
+
+from site24x7_cli import daemon
+from site24x7_cli.base import Site24x7Client
+from site24x7_cli.daemon import DaemonServer, _Gate, forward, send
+from site24x7_cli.invoke import captured_output, run_captured
+
+
+@pytest.fixture(autouse=True)
+def restore_streams(monkeypatch):
+    """install_capture swaps sys.stdout/sys.stderr; put them back afterwards"""
+    monkeypatch.setattr(sys, 'stdout', sys.stdout)
+    monkeypatch.setattr(sys, 'stderr', sys.stderr)
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """A daemon serving on a short socket path in a background thread"""
+    directory = tempfile.mkdtemp(prefix='s24x7-')
+    path = os.path.join(directory, 'd.sock')
+    monkeypatch.setenv('SITE24X7_DAEMON_SOCKET', path)
+    server = DaemonServer(path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_captured_output_is_per_thread():
+    results = {}
+
+    def work(name):
+        with captured_output() as (stdout, _):
+            for _ in range(20):
+                print(name)
+                time.sleep(0.001)
+        results[name] = stdout.getvalue()
+
+    threads = [threading.Thread(target=work, args=(name,)) for name in ('a', 'b')]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == {'a': 'a\n' * 20, 'b': 'b\n' * 20}
+
+
+def test_run_captured_reports_exit_codes():
+    result = run_captured(['--help'])
+    assert result['exit_code'] == 0 and 'Commands:' in result['stdout']
+    assert run_captured(['no-such-command'])['exit_code'] == 2
+
+
+def test_gate_runs_foreign_environments_alone(tmp_path, monkeypatch):
+    monkeypatch.setenv('SITE24X7_TIMEOUT', '5')
+    gate = _Gate()
+    seen = []
+    with gate.alone(str(tmp_path), {'SITE24X7_TIMEOUT': '9'}):
+        seen.append((os.getcwd(), os.environ.get('SITE24X7_TIMEOUT'), os.environ.get('SITE24X7_OAUTH_TOKEN')))
+    assert seen == [(str(tmp_path), '9', None)]
+    assert os.environ['SITE24X7_TIMEOUT'] == '5' and os.getcwd() != str(tmp_path)
+
+    entered = threading.Event()
+    with gate.shared():
+        def exclusive():
+            with gate.alone(os.getcwd(), daemon.caller_env()):
+                entered.set()
+
+        thread = threading.Thread(target=exclusive)
+        thread.start()
+        # Waits for the shared run to finish
+        assert not entered.wait(0.1)
+    assert entered.wait(2)
+    thread.join()
+
+
+def test_forward_runs_locally_without_a_daemon(monkeypatch):
+    monkeypatch.setattr(sys.stdin, 'isatty', lambda: True, raising=False)
+    assert forward(['auth', 'status']) is None
+    monkeypatch.setenv('SITE24X7_NO_DAEMON', '1')
+    assert forward(['auth', 'status']) is None
+
+
+def test_daemon_serves_commands(server, monkeypatch):
+    monkeypatch.setattr(Site24x7Client, 'get', lambda self, endpoint, params=None, **kwargs: {
+        'code': 0, 'data': {'monitor_id': endpoint.rsplit('/', 1)[1], 'display_name': 'shop'}})
+
+    assert send({'command': 'ping'})['pid'] == os.getpid()
+    reply = send({'args': ['-o', 'json', 'monitor-management', 'website-monitors', 'get', '123456789'],
+                  'cwd': os.getcwd(), 'env': daemon.caller_env()})
+    assert reply['exit_code'] == 0, reply
+    assert '"display_name": "shop"' in reply['stdout']
+    assert send({'command': 'ping'})['served'] == 1
+
+
+def test_daemon_hands_prompts_back(server, monkeypatch):
+    monkeypatch.setattr(sys, 'stdin', daemon._NoInput())
+    monkeypatch.setattr(Site24x7Client, 'delete', lambda *args, **kwargs: pytest.fail('deleted'))
+    reply = send({'args': ['monitor-management', 'website-monitors', 'delete', '123456789'],
+                  'cwd': os.getcwd(), 'env': daemon.caller_env()})
+    assert reply == {'fallback': True}
+
+
+def test_forward_prints_the_daemon_reply(server, monkeypatch, capsys):
+    monkeypatch.setattr(sys.stdin, 'isatty', lambda: True, raising=False)
+    assert forward(['--help']) == 0
+    assert 'Commands:' in capsys.readouterr().out
+
+
+def test_daemon_against_the_mock_api(server, mock_api):
+    message = {'args': ['-o', 'ndjson', 'monitor-management', 'website-monitors', 'list', '--limit', '5'],
+               'cwd': os.getcwd(), 'env': daemon.caller_env()}
+    for _ in range(3):
+        reply = send(message)
+        assert reply['exit_code'] == 0, reply
+        assert len(reply['stdout'].splitlines()) == 5
+    assert mock_api.stats['requests'] == 3
+
+
+def test_reads_stdin():
+    assert daemon._reads_stdin(['monitor-management', 'website-monitors', 'get', '-'])
+    assert daemon._reads_stdin(['monitor-management', 'website-monitors', 'bulk-delete', '--ids-file=-'])
+    assert daemon._reads_stdin(['monitor-management', 'website-monitors', 'bulk-create'])
+    assert not daemon._reads_stdin(['monitor-management', 'website-monitors', 'list'])
+
+
+def test_piped_commands_are_forwarded_unless_they_read_stdin(server, mock_api, monkeypatch, capsys):
+    monkeypatch.setattr(sys.stdin, 'isatty', lambda: False, raising=False)
+    assert forward(['-o', 'ndjson', 'monitor-management', 'website-monitors', 'list', '--limit', '2']) == 0
+    assert len(capsys.readouterr().out.splitlines()) == 2
+    assert send({'command': 'ping'})['served'] == 1
+
+    assert forward(['monitor-management', 'website-monitors', 'get', '-']) is None
+    assert send({'command': 'ping'})['served'] == 1
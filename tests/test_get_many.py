@@ -0,0 +1,95 @@
+"""
+Fetching many IDs from the get commands
+"""
+
+import json
+import time
+
+import pytest
+from click.testing import CliRunner
+
+from site24x7_cli.base import BaseCommand
+from site24x7_cli.bulk import in_order, run_bulk
+
+
+def test_in_order():
+    results = run_bulk(lambda n: time.sleep(n / 1000) or n, [20, 1, 10, 5], concurrency=4)
+    assert [result.result for result in in_order(results)] == [20, 1, 10, 5]
+
+
+def _ndjson(output):
+    return [json.loads(line) for line in output.splitlines() if line.startswith('{')]
+
+
+def test_get_many_ids_against_the_mock_api(mock_api, tmp_path):
+    from site24x7_cli.main import cli
+
+    mock_api.latency = 0.01
+    ids_file = tmp_path / 'ids.txt'
+    ids_file.write_text('100007\n# skipped\n100003\n')
+    result = CliRunner().invoke(cli, ['-o', 'ndjson', 'monitor-management', 'website-monitors', 'get',
+                                      '100010', '100002', '--ids-file', str(ids_file), '-j', '4'])
+    assert result.exit_code == 0, result.output
+    assert [r['monitor_id'] for r in _ndjson(result.output)] == ['100010', '100002', '100007', '100003']
+    assert mock_api.stats['requests'] == 4
+
+
+def test_get_many_from_stdin_reports_failures(mock_api):
+    from site24x7_cli.main import cli
+
+    result = CliRunner().invoke(cli, ['-o', 'ndjson', 'monitor-management', 'api-monitors', 'get', '-',
+                                      '--unordered'], input='100001\n999\n100002\n')
+    assert result.exit_code != 0
+    assert sorted(r['monitor_id'] for r in _ndjson(result.output)) == ['100001', '100002']
+    assert '999' in result.output and '1 of 3' in result.output
+
+
+def test_get_many_reports_against_the_mock_api(mock_api):
+    from site24x7_cli.main import cli
+
+    result = CliRunner().invoke(cli, ['-o', 'json', 'reports', 'performance-reports', 'get',
+                                      '100001', '100002', '--parallel', '2'])
+    assert result.exit_code == 0, result.output
+    assert len(json.loads(result.output)) == 2
+
+
+def test_get_needs_an_id(mock_api):
+    from site24x7_cli.main import cli
+
+    result = CliRunner().invoke(cli, ['monitor-management', 'website-monitors', 'get'])
+    assert result.exit_code != 0 and mock_api.stats['requests'] == 0
+
+
+def test_concurrency_means_ids_in_both_get_commands(mock_api, monkeypatch):
+    from site24x7_cli.main import cli
+
+    peak = []
+    get_many = BaseCommand.get_many
+
+    def recording(self, fetch, ids, concurrency=8, unordered=False):
+        peak.append(concurrency)
+        return get_many(self, fetch, ids, concurrency, unordered)
+
+    monkeypatch.setattr(BaseCommand, 'get_many', recording)
+    runner = CliRunner()
+    for group in (['reports', 'performance-reports'], ['monitor-management', 'website-monitors']):
+        result = runner.invoke(cli, ['-o', 'json', *group, 'get', '100001', '100002', '-j', '3'])
+        assert result.exit_code == 0, result.output
+    assert peak == [3, 3]
+
+
+@pytest.mark.parametrize('args', [
+    ['reports', 'performance-reports', 'get', '100001', '-j', '0'],
+    ['reports', 'performance-reports', 'get', '100001', '--window-concurrency', '0'],
+    ['reports', 'performance-reports', 'aggregate', '-m', '100001', '-j', '0'],
+    ['monitor-management', 'website-monitors', 'get', '100001', '--concurrency', '0'],
+    ['monitor-management', 'api-monitors', 'bulk-delete', '--status', '0', '-j', '-1'],
+    ['apply', '-f', '-', '--concurrency', '0'],
+    ['batch', '-', '--parallel', '0'],
+])
+def test_concurrency_options_must_be_positive(mock_api, args):
+    from site24x7_cli.main import cli
+
+    result = CliRunner().invoke(cli, args, input='')
+    assert result.exit_code == 2 and 'Invalid value' in result.output
+    assert mock_api.stats['requests'] == 0
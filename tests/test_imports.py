@@ -0,0 +1,64 @@
+"""
+Every module of the package imports cleanly
+"""
+
+import importlib
+import os
+import pkgutil
+import subprocess
+import sys
+
+import pytest
+
+import site24x7_cli
+from import_time import eager_imports, measure
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULES = sorted(name for _, name, _ in pkgutil.walk_packages(site24x7_cli.__path__, 'site24x7_cli.'))
+COMMAND_MODULES = [name for name in MODULES if name.startswith('site24x7_cli.commands.')]
+# Only the asyncio engine may load these, and only when --async asks for it
+ASYNC_MODULES = ('aiohttp', 'site24x7_cli.async_client')
+
+
+@pytest.mark.parametrize('name', MODULES)
+def test_import(name):
+    importlib.import_module(name)
+
+
+def test_lazy_commands_resolve():
+    from site24x7_cli.main import LAZY_COMMANDS
+
+    for module, attribute, _ in LAZY_COMMANDS.values():
+        assert hasattr(importlib.import_module(module), attribute)
+
+
+def test_help_lists_commands_without_importing_them():
+    script = ('import sys\n'
+              'from click.testing import CliRunner\n'
+              'from site24x7_cli.main import LAZY_COMMANDS, cli\n'
+              'result = CliRunner().invoke(cli, ["--help"])\n'
+              'assert result.exit_code == 0, result.output\n'
+              'assert all(name in result.output for name in LAZY_COMMANDS)\n'
+              'loaded = [module for module, _, _ in LAZY_COMMANDS.values() if module in sys.modules]\n'
+              'assert not loaded, loaded\n')
+    subprocess.run([sys.executable, '-c', script], cwd=ROOT, check=True)
+
+
+def test_aggregate_loads_the_async_engine_on_demand():
+    script = ('import sys\n'
+              'import site24x7_cli.commands.reports\n'
+              'assert "aiohttp" not in sys.modules\n'
+              'assert "site24x7_cli.async_client" not in sys.modules\n')
+    subprocess.run([sys.executable, '-c', script], cwd=ROOT, check=True)
+
+
+def test_startup_stays_within_the_import_budget():
+    budget_ms = float(os.getenv('SITE24X7_IMPORT_BUDGET_MS', 150))
+    runs = [measure('site24x7_cli.main') for _ in range(3)]
+    assert eager_imports(runs) == []
+    assert min(run['site24x7_cli.main'] for run in runs) / 1000.0 <= budget_ms
+
+
+@pytest.mark.parametrize('name', COMMAND_MODULES)
+def test_command_modules_leave_the_async_engine_unloaded(name):
+    assert eager_imports([measure(name)], ASYNC_MODULES) == []
@@ -0,0 +1,153 @@
+"""
+Job journals and resuming bulk operations
+"""
+
+import json
+import os
+
+import pytest
+from click.testing import CliRunner
+
+from site24x7_cli.bulk import BulkResult
+from site24x7_cli.exceptions import ValidationError
+from site24x7_cli.journal import JobJournal
+from site24x7_cli.main import cli
+
+
+def _finish(journal, items, failed=()):
+    for index, item in journal.pending(items):
+        error = RuntimeError('boom') if index in failed else None
+        result = {'monitor_id': f'9{index}'} if isinstance(item, dict) else {'code': 0}
+        journal.record(index, item, BulkResult(index, item, result=result, error=error))
+    journal.close()
+
+
+def test_resume_skips_completed_items(tmp_path):
+    items = ['101', '102', '103', '104']
+    journal = JobJournal.start('bulk-delete', str(tmp_path))
+    _finish(journal, items, failed={2, 4})
+
+    resumed = JobJournal.resume(journal.job_id, 'bulk-delete', str(tmp_path))
+    assert list(resumed.pending(items)) == [(2, '102'), (4, '104')]
+    assert resumed.skipped == 2
+    resumed.close()
+
+
+def test_changed_records_are_redone(tmp_path):
+    records = [{'name': 'a'}, {'name': 'b'}]
+    journal = JobJournal.start('bulk-create', str(tmp_path))
+    _finish(journal, records)
+
+    resumed = JobJournal.resume(journal.job_id, 'bulk-create', str(tmp_path))
+    assert list(resumed.pending([{'name': 'a'}, {'name': 'b2'}])) == [(2, {'name': 'b2'})]
+    resumed.close()
+
+
+def test_journal_lines(tmp_path):
+    journal = JobJournal.start('bulk-create', str(tmp_path))
+    _finish(journal, [{'name': 'a'}, {'name': 'b'}], failed={2})
+
+    with open(journal.path) as f:
+        header, *entries = [json.loads(line) for line in f]
+    assert header['event'] == 'started' and header['operation'] == 'bulk-create'
+    assert entries[0]['ok'] and entries[0]['id'] == '91'
+    assert not entries[1]['ok'] and entries[1]['error'] == 'boom'
+
+
+def test_torn_lines_are_ignored(tmp_path):
+    journal = JobJournal.start('bulk-delete', str(tmp_path))
+    _finish(journal, ['101'])
+    with open(journal.path, 'a') as f:
+        f.write('{"key": "102", "o')
+
+    resumed = JobJournal.resume(journal.job_id, 'bulk-delete', str(tmp_path))
+    assert list(resumed.pending(['101', '102'])) == [(2, '102')]
+    _finish(resumed, ['101', '102'])
+    with open(journal.path) as f:
+        lines = f.read().splitlines()
+    assert json.loads(lines[-1])['key'] == '102'
+
+
+def test_resume_validation(tmp_path):
+    journal = JobJournal.start('bulk-delete', str(tmp_path))
+    journal.close()
+    with pytest.raises(ValidationError):
+        JobJournal.resume(journal.job_id, 'bulk-create', str(tmp_path))
+    with pytest.raises(ValidationError):
+        JobJournal.resume('../etc/passwd', 'bulk-delete', str(tmp_path))
+    with pytest.raises(ValidationError):
+        JobJournal.resume('20200101-000000-abcdef', 'bulk-delete', str(tmp_path))
+
+
+def test_resume_needs_the_same_payload(tmp_path):
+    journal = JobJournal.start('bulk-update', str(tmp_path), payload={'timeout': '15'})
+    _finish(journal, ['101'])
+    with pytest.raises(ValidationError, match='other parameters'):
+        JobJournal.resume(journal.job_id, 'bulk-update', str(tmp_path), payload={'timeout': '60'})
+    resumed = JobJournal.resume(journal.job_id, 'bulk-update', str(tmp_path), payload={'timeout': '15'})
+    assert list(resumed.pending(['101', '102'])) == [(2, '102')]
+    resumed.close()
+
+
+def test_discard_removes_only_new_journals(tmp_path):
+    journal = JobJournal.start('bulk-delete', str(tmp_path))
+    journal.discard()
+    assert not os.path.exists(journal.path)
+
+    journal = JobJournal.start('bulk-delete', str(tmp_path))
+    _finish(journal, ['101'])
+    JobJournal.resume(journal.job_id, 'bulk-delete', str(tmp_path)).discard()
+    assert os.path.exists(journal.path)
+
+
+def test_bulk_create_resume(mock_api):
+    definitions = ''.join(json.dumps({'name': f'new-{i}', 'website': f'https://{i}.example.com'}) + '\n'
+                          for i in range(5))
+    runner = CliRunner()
+    args = ['-o', 'ndjson', 'monitor-management', 'website-monitors', 'bulk-create']
+    result = runner.invoke(cli, args, input=definitions)
+    assert result.exit_code == 0, result.output
+    job_id = os.listdir(os.environ['SITE24X7_JOBS_DIR'])[0][:-len('.jsonl')]
+    created = len(mock_api.data['website-monitors'])
+
+    result = runner.invoke(cli, args + ['--resume', job_id], input=definitions)
+    assert result.exit_code == 0, result.output
+    assert len(mock_api.data['website-monitors']) == created
+
+
+def test_bulk_delete_resume_retries_failures(mock_api, tmp_path):
+    ids_file = tmp_path / 'ids.txt'
+    ids_file.write_text('100001\n999\n100002\n')
+    runner = CliRunner()
+    args = ['monitor-management', 'website-monitors', 'bulk-delete', '--ids-file', str(ids_file), '--force']
+    result = runner.invoke(cli, args)
+    assert result.exit_code != 0
+    job_id = os.listdir(os.environ['SITE24X7_JOBS_DIR'])[0][:-len('.jsonl')]
+    assert mock_api.stats['requests'] == 3
+
+    result = runner.invoke(cli, args + ['--resume', job_id])
+    assert result.exit_code != 0
+    # Only the failed ID is tried again
+    assert mock_api.stats['requests'] == 4
+
+
+def test_bulk_update_resume_confirms_the_remaining_ids(mock_api, tmp_path):
+    ids_file = tmp_path / 'ids.txt'
+    ids_file.write_text('100001\n999\n100002\n')
+    runner = CliRunner()
+    args = ['monitor-management', 'website-monitors', 'bulk-update', '--ids-file', str(ids_file),
+            '-p', 'timeout=15']
+    result = runner.invoke(cli, args, input='n\n')
+    assert 'Update 3 website-monitors?' in result.output
+    assert os.listdir(os.environ['SITE24X7_JOBS_DIR']) == []
+
+    result = runner.invoke(cli, args, input='y\n')
+    assert result.exit_code != 0
+    job_id = os.listdir(os.environ['SITE24X7_JOBS_DIR'])[0][:-len('.jsonl')]
+
+    result = runner.invoke(cli, args + ['--resume', job_id], input='n\n')
+    assert 'Update 1 website-monitors?' in result.output
+
+    result = runner.invoke(cli, args[:-1] + ['timeout=60', '--resume', job_id, '--force'])
+    assert result.exit_code != 0 and 'started with other parameters' in result.output
+    assert mock_api.stats['requests'] == 3
@@ -0,0 +1,85 @@
+"""
+Incremental decoding of list responses
+"""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from site24x7_cli.exceptions import ValidationError
+from site24x7_cli.jsonstream import iter_records, parse_fields, project
+
+RECORDS = [{'monitor_id': str(i), 'display_name': f'café-{i}', 'timeout': 12345 + i,
+            'location': {'region': 'eu', 'zone': i}} for i in range(20)]
+
+
+def _chunks(data, size):
+    return (data[i:i + size] for i in range(0, len(data), size))
+
+
+@pytest.mark.parametrize('size', [1, 2, 7, 64, 1 << 16])
+def test_records_survive_any_chunking(size):
+    body = json.dumps({'code': 0, 'message': 'success', 'data': RECORDS}).encode('utf-8')
+    assert list(iter_records(_chunks(body, size))) == RECORDS
+
+
+def test_numbers_split_across_chunks():
+    body = b'{"data": [123', b'45, 6', b'7]}'
+    assert list(iter_records(iter(body))) == [12345, 67]
+
+
+def test_top_level_array_and_custom_key():
+    assert list(iter_records([b' [1, 2] '])) == [1, 2]
+    body = json.dumps({'code': 0, 'monitors': RECORDS[:2]}).encode('utf-8')
+    assert list(iter_records(_chunks(body, 5), key='monitors')) == RECORDS[:2]
+
+
+def test_single_record_and_empty_responses():
+    assert list(iter_records([b'{"data": {"monitor_id": "1"}}'])) == [{'monitor_id': '1'}]
+    assert list(iter_records([b'{"data": []}'])) == []
+    assert list(iter_records([b'{}'])) == []
+    assert list(iter_records([b'{"code": 0}'])) == []
+
+
+def test_projection_while_decoding():
+    body = json.dumps({'data': RECORDS}).encode('utf-8')
+    records = list(iter_records(_chunks(body, 3), fields=['display_name', 'location.zone']))
+    assert records[3] == {'display_name': 'café-3', 'location.zone': 3}
+
+
+def test_malformed_bodies_raise():
+    with pytest.raises(ValueError):
+        list(iter_records([b'{"data": [1, 2']))
+    with pytest.raises(ValueError):
+        list(iter_records([b'<html>']))
+
+
+def test_project():
+    record = {'a': 1, 'b': {'c': 2}}
+    assert project(record, ['b.c', 'a', 'missing', 'b.x']) == {'b.c': 2, 'a': 1}
+    assert project('text', ['a']) == 'text'
+
+
+def test_parse_fields():
+    assert parse_fields(None) is None
+    assert parse_fields(' a, b ,a,,c.d ') == ['a', 'b', 'c.d']
+    with pytest.raises(ValidationError):
+        parse_fields(' , ')
+
+
+def test_fields_option_against_the_mock_api(mock_api):
+    from site24x7_cli.main import cli
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ['-o', 'ndjson', '--fields', 'monitor_id,display_name', 'monitor-management',
+                                 'website-monitors', 'list', '--all', '--where', 'group_id == 4'])
+    assert result.exit_code == 0, result.output
+    records = [json.loads(line) for line in result.output.splitlines()]
+    assert records[0] == {'monitor_id': '100004', 'display_name': 'website-000004'}
+    assert len(records) == 6
+
+    result = runner.invoke(cli, ['-o', 'json', '--fields', 'status', 'monitor-management',
+                                 'website-monitors', 'get', '100001'])
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output) == {'status': '1'}
@@ -0,0 +1,186 @@
+"""
+Inventory mirror and 'sync' / 'list --local'
+"""
+
+import json
+import os
+import sqlite3
+
+import pytest
+from click.testing import CliRunner
+
+from site24x7_cli.base import Site24x7Client
+from site24x7_cli.mirror import InventoryMirror, content_hash, record_group
+
+
+def _monitor(i, **changes):
+    record = {'monitor_id': str(100 + i), 'display_name': f'web-{i:02d}', 'status': i % 3,
+              'group_id': str(i % 2)}
+    record.update(changes)
+    return record
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    mirror = InventoryMirror(str(tmp_path / 'mirror.db'))
+    yield mirror
+    mirror.close()
+
+
+def test_content_hash_ignores_key_order():
+    assert content_hash({'a': 1, 'b': 2}) == content_hash({'b': 2, 'a': 1})
+    assert content_hash({'a': 1}) != content_hash({'a': '1'})
+
+
+def test_record_group():
+    assert record_group({'group_id': 7}) == '7'
+    assert record_group({'monitor_groups': ['5', '6']}) == '5'
+    assert record_group({}) is None
+
+
+def test_sync_rewrites_only_changed_rows(mirror):
+    counts = mirror.sync('website-monitors', [_monitor(i) for i in range(5)])
+    assert (counts['inserted'], counts['total']) == (5, 5)
+
+    listing = [_monitor(0), _monitor(1, display_name='renamed'), _monitor(2), _monitor(5)]
+    counts = mirror.sync('website-monitors', listing)
+    assert {key: counts[key] for key in ('inserted', 'updated', 'unchanged', 'deleted')} == \
+        {'inserted': 1, 'updated': 1, 'unchanged': 2, 'deleted': 2}
+    assert sorted(r['monitor_id'] for r in mirror.query('website-monitors')) == ['100', '101', '102', '105']
+    assert mirror.last_synced('website-monitors') is not None
+    assert mirror.last_synced('api-monitors') is None
+
+
+def test_types_are_synced_independently(mirror):
+    mirror.sync('website-monitors', [_monitor(0)])
+    mirror.sync('api-monitors', [_monitor(0), _monitor(1)])
+    mirror.sync('website-monitors', [])
+    assert list(mirror.query('website-monitors')) == []
+    assert len(list(mirror.query('api-monitors'))) == 2
+
+
+def test_query_filters(mirror):
+    mirror.sync('website-monitors', [_monitor(i) for i in range(10)])
+    assert [r['monitor_id'] for r in mirror.query('website-monitors', status='1')] == ['101', '104', '107']
+    assert [r['monitor_id'] for r in mirror.query(group_id='0', name_pattern='web-0[0-4]')] == \
+        ['100', '102', '104']
+    assert [r['display_name'] for r in mirror.query(limit=2, offset=3)] == ['web-03', 'web-04']
+
+
+@pytest.fixture
+def listing(monkeypatch):
+    monitors = {'/api/website-monitors': [_monitor(i) for i in range(30)],
+                '/api/api-monitors': [_monitor(i, display_name=f'api-{i}') for i in range(3)]}
+    requests = []
+
+    def get(self, endpoint, params=None, **kwargs):
+        requests.append(endpoint)
+        records = monitors[endpoint]
+        return {'data': records[params['offset']:params['offset'] + params['limit']]}
+
+    monkeypatch.setattr(Site24x7Client, 'get', get)
+    return requests
+
+
+def test_sync_then_list_locally(listing):
+    from site24x7_cli.main import cli
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ['-o', 'json', 'sync', '--page-size', '10'])
+    assert result.exit_code == 0, result.output
+    counts = {row['monitor_type']: row for row in json.loads(result.output)}
+    assert counts['website-monitors']['inserted'] == 30 and counts['api-monitors']['inserted'] == 3
+    assert os.path.exists(os.environ['SITE24X7_MIRROR_PATH'])
+
+    fetched = len(listing)
+    result = runner.invoke(cli, ['-o', 'ndjson', 'monitor-management', 'website-monitors', 'list',
+                                 '--local', '--limit', '5'])
+    assert result.exit_code == 0, result.output
+    assert [json.loads(line)['display_name'] for line in result.output.splitlines()] == \
+        ['web-00', 'web-01', 'web-02', 'web-03', 'web-04']
+    assert len(listing) == fetched
+
+
+def test_sync_from_the_mock_api(mock_api):
+    from site24x7_cli.main import cli
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ['-o', 'json', 'sync', '--page-size', '50'])
+    assert result.exit_code == 0, result.output
+    counts = {row['monitor_type']: row['inserted'] for row in json.loads(result.output)}
+    assert counts == {'website-monitors': 120, 'api-monitors': 120}
+
+    mock_api.data['website-monitors'][0]['display_name'] = 'renamed'
+    del mock_api.data['website-monitors'][1]
+    result = runner.invoke(cli, ['-o', 'json', 'sync', '--type', 'website-monitors'])
+    assert result.exit_code == 0, result.output
+    row = json.loads(result.output)[0]
+    assert (row['updated'], row['deleted'], row['unchanged']) == (1, 1, 118)
+
+    requests = mock_api.stats['requests']
+    result = runner.invoke(cli, ['-o', 'ndjson', 'monitor-management', 'website-monitors', 'list',
+                                 '--local', '--group-id', '0', '--limit', '100'])
+    assert result.exit_code == 0, result.output
+    names = [json.loads(line)['display_name'] for line in result.output.splitlines()]
+    assert names[0] == 'renamed' and len(names) == 6
+    assert mock_api.stats['requests'] == requests
+
+
+def test_status_names_match_mirrored_codes(mock_api):
+    from site24x7_cli.main import cli
+
+    runner = CliRunner()
+    assert runner.invoke(cli, ['sync', '--type', 'website-monitors']).exit_code == 0
+    for args in (['--status', 'down'], ['--where', 'status == down']):
+        result = runner.invoke(cli, ['-o', 'ndjson', 'monitor-management', 'website-monitors', 'list',
+                                     '--local', '--limit', '200', *args])
+        assert result.exit_code == 0, result.output
+        records = [json.loads(line) for line in result.output.splitlines()]
+        assert {r['status'] for r in records} == {'0'} and len(records) == 17
+
+
+def test_list_reads_the_mirror_named_by_db(mock_api, tmp_path):
+    from site24x7_cli.main import cli
+
+    path = str(tmp_path / 'elsewhere.db')
+    runner = CliRunner()
+    assert runner.invoke(cli, ['sync', '--type', 'api-monitors', '--db', path]).exit_code == 0
+    requests = mock_api.stats['requests']
+    result = runner.invoke(cli, ['-o', 'ndjson', 'monitor-management', 'api-monitors', 'list',
+                                 '--db', path, '--limit', '200'])
+    assert result.exit_code == 0, result.output
+    assert len(result.output.splitlines()) == 120
+    assert mock_api.stats['requests'] == requests
+
+    # The default mirror was never synced
+    result = runner.invoke(cli, ['-o', 'ndjson', 'monitor-management', 'api-monitors', 'list',
+                                 '--local', '--limit', '200'])
+    assert result.exit_code == 0 and result.output == ''
+
+
+def test_accounts_do_not_prune_each_other(tmp_path):
+    path = str(tmp_path / 'shared.db')
+    prod = InventoryMirror(path, account='prod')
+    staging = InventoryMirror(path, account='staging')
+    prod.sync('website-monitors', [_monitor(i) for i in range(3)])
+    counts = staging.sync('website-monitors', [_monitor(i) for i in range(5, 7)])
+
+    assert counts['deleted'] == 0
+    assert [r['monitor_id'] for r in prod.query('website-monitors')] == ['100', '101', '102']
+    assert [r['monitor_id'] for r in staging.query('website-monitors')] == ['105', '106']
+    prod.close()
+    staging.close()
+
+
+def test_old_mirror_layout_is_rebuilt(tmp_path):
+    path = str(tmp_path / 'old.db')
+    connection = sqlite3.connect(path)
+    connection.executescript("CREATE TABLE monitors (monitor_type TEXT, monitor_id TEXT, data TEXT, "
+                             "PRIMARY KEY (monitor_type, monitor_id));"
+                             "INSERT INTO monitors VALUES ('website-monitors', '1', '{}');")
+    connection.close()
+
+    mirror = InventoryMirror(path)
+    assert list(mirror.query('website-monitors')) == []
+    assert mirror.sync('website-monitors', [_monitor(1)])['inserted'] == 1
+    mirror.close()
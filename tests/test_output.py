@@ -0,0 +1,95 @@
+"""
+Streaming output sinks
+"""
+
+import csv
+import io
+import json
+
+import pytest
+
+from site24x7_cli.output import CSVSink, JSONSink, NDJSONSink, TableSink, YAMLSink, get_sink
+
+RECORDS = [{'monitor_id': '1', 'display_name': 'a', 'tags': ['x', 'y']},
+           {'monitor_id': '2', 'display_name': 'b', 'tags': []}]
+
+
+def _render(output_format, records):
+    stream = io.StringIO()
+    with get_sink(output_format, stream) as sink:
+        sink.write_all(iter(records))
+    return stream.getvalue(), sink.count
+
+
+@pytest.mark.parametrize('output_format, sink_class', [
+    ('table', TableSink), ('json', JSONSink), ('ndjson', NDJSONSink),
+    ('csv', CSVSink), ('yaml', YAMLSink), ('unknown', TableSink),
+])
+def test_get_sink(output_format, sink_class):
+    assert type(get_sink(output_format, io.StringIO())) is sink_class
+
+
+@pytest.mark.parametrize('records', [RECORDS, []])
+def test_json_is_a_valid_array(records):
+    text, count = _render('json', records)
+    assert json.loads(text) == records
+    assert count == len(records)
+
+
+def test_json_document():
+    stream = io.StringIO()
+    with JSONSink(stream) as sink:
+        sink.write_document({'code': 0})
+    assert json.loads(stream.getvalue()) == {'code': 0}
+
+
+def test_ndjson_writes_one_line_per_record():
+    text, _ = _render('ndjson', RECORDS)
+    assert [json.loads(line) for line in text.splitlines()] == RECORDS
+
+
+def test_csv_takes_columns_from_the_first_record():
+    text, _ = _render('csv', RECORDS + [{'monitor_id': '3', 'extra': 'ignored'}])
+    rows = list(csv.DictReader(io.StringIO(text)))
+    assert list(rows[0]) == ['monitor_id', 'display_name', 'tags']
+    assert [row['monitor_id'] for row in rows] == ['1', '2', '3']
+    assert rows[2]['display_name'] == ''
+
+
+def test_yaml_sequence():
+    yaml = pytest.importorskip('yaml')
+    text, _ = _render('yaml', RECORDS)
+    assert yaml.safe_load(text) == RECORDS
+
+
+def test_table_prints_in_batches():
+    stream = io.StringIO()
+    with TableSink(stream, chunk_size=2) as sink:
+        sink.write_all({'monitor_id': str(i)} for i in range(5))
+    text = stream.getvalue()
+    assert text.count('Monitor Id') == 3
+    assert all(str(i) in text for i in range(5))
+
+
+def test_table_without_records():
+    text, count = _render('table', [])
+    assert 'No data to display' in text
+    assert count == 0
+
+
+def test_list_command_streams_every_page(monkeypatch):
+    from click.testing import CliRunner
+
+    from site24x7_cli.base import Site24x7Client
+    from site24x7_cli.main import cli
+
+    monitors = [{'monitor_id': str(i), 'display_name': f'web-{i}'} for i in range(130)]
+
+    def get(self, endpoint, params=None, **kwargs):
+        return {'data': monitors[params['offset']:params['offset'] + params['limit']]}
+
+    monkeypatch.setattr(Site24x7Client, 'get', get)
+    result = CliRunner().invoke(cli, ['-o', 'ndjson', 'monitor-management', 'website-monitors',
+                                      'list', '--all', '--limit', '50'])
+    assert result.exit_code == 0, result.output
+    assert [json.loads(line) for line in result.output.splitlines()] == monitors
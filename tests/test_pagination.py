@@ -0,0 +1,100 @@
+"""
+Paginated listing with Site24x7Client.iter_pages
+"""
+
+import json
+import threading
+
+import pytest
+from click.testing import CliRunner
+
+from site24x7_cli.base import Site24x7Client
+from site24x7_cli.exceptions import ValidationError
+
+RECORDS = [{'monitor_id': str(100000 + i)} for i in range(120)]
+
+
+@pytest.fixture
+def client():
+    """A client whose GETs serve ``RECORDS`` by limit/offset, recording each request"""
+    client = Site24x7Client()
+    client.requests = []
+    lock = threading.Lock()
+
+    def get(endpoint, params=None, **kwargs):
+        with lock:
+            client.requests.append(dict(params))
+        offset, limit = params['offset'], params['limit']
+        return {'code': 0, 'data': RECORDS[offset:offset + limit]}
+
+    client.get = get
+    return client
+
+
+def test_iter_pages_walks_every_page(client):
+    records = list(client.iter_pages('/api/website-monitors', page_size=25))
+
+    assert records == RECORDS
+    # Four full pages and a short last one
+    assert [request['offset'] for request in client.requests] == [0, 25, 50, 75, 100]
+
+
+def test_iter_pages_stops_at_an_empty_page(client):
+    assert list(client.iter_pages('/api/website-monitors', page_size=40)) == RECORDS
+    assert len(client.requests) == 4
+
+
+def test_iter_pages_offset_and_params(client):
+    records = list(client.iter_pages('/api/website-monitors', params={'status': 'down'},
+                                     page_size=50, offset=100))
+
+    assert records == RECORDS[100:]
+    assert client.requests == [{'status': 'down', 'limit': 50, 'offset': 100}]
+
+
+def test_iter_pages_closed_early(client):
+    pages = client.iter_pages('/api/website-monitors', page_size=10, prefetch=1)
+    first = [next(pages) for _ in range(3)]
+    pages.close()
+
+    assert first == RECORDS[:3]
+    # The worker stops within the prefetch window instead of reading every page
+    assert len(client.requests) <= 3
+
+
+def test_iter_pages_raises_fetch_errors(client):
+    def get(endpoint, params=None, **kwargs):
+        if params['offset']:
+            raise RuntimeError('page failed')
+        return {'data': RECORDS[:10]}
+
+    client.get = get
+    pages = client.iter_pages('/api/website-monitors', page_size=10)
+    assert [next(pages) for _ in range(10)] == RECORDS[:10]
+    with pytest.raises(RuntimeError):
+        next(pages)
+
+
+def test_list_all_against_the_mock_api(mock_api):
+    from site24x7_cli.main import cli
+
+    result = CliRunner().invoke(cli, ['-o', 'ndjson', 'monitor-management', 'website-monitors', 'list',
+                                      '--all', '--limit', '25', '--offset', '10'])
+    assert result.exit_code == 0, result.output
+    ids = [json.loads(line)['monitor_id'] for line in result.output.splitlines()]
+    assert ids == [str(100000 + i) for i in range(10, 120)]
+    assert mock_api.stats['requests'] == 5
+
+
+def test_iter_pages_rejects_page_size_below_one(client):
+    with pytest.raises(ValidationError):
+        next(client.iter_pages('/api/website-monitors', page_size=0))
+    assert client.requests == []
+
+
+@pytest.mark.parametrize('args', [['--limit', '0'], ['--offset', '-1'], ['--prefetch', '-1']])
+def test_list_rejects_bad_paging_options(mock_api, args):
+    from site24x7_cli.main import cli
+
+    result = CliRunner().invoke(cli, ['monitor-management', 'website-monitors', 'list', '--all', *args])
+    assert result.exit_code == 2 and mock_api.stats['requests'] == 0
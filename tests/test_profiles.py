@@ -0,0 +1,176 @@
+"""
+Named credential profiles and --profiles fan-out
+"""
+
+import json
+import os
+import sys
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from site24x7_cli import base, daemon
+from site24x7_cli.auth import AuthManager
+from site24x7_cli.config import Config
+from site24x7_cli.exceptions import ValidationError
+from site24x7_cli.profiles import select_profiles
+
+
+@pytest.fixture(autouse=True)
+def restore_state(monkeypatch):
+    """Fan-out shares clients process-wide and swaps sys.stdout/sys.stderr"""
+    monkeypatch.setattr(base, '_shared_sessions', None)
+    monkeypatch.setattr(base, '_shared_clients', None)
+    monkeypatch.setattr(sys, 'stdout', sys.stdout)
+    monkeypatch.setattr(sys, 'stderr', sys.stderr)
+
+
+@pytest.fixture
+def accounts():
+    AuthManager.save_credentials('a' * 30, 'prod')
+    AuthManager.save_credentials('b' * 30, 'staging')
+
+
+def test_profiles_live_next_to_the_default_token(accounts):
+    assert AuthManager.list_profiles() == ['prod', 'staging']
+    AuthManager.save_credentials('d' * 30)
+    assert AuthManager.list_profiles() == ['default', 'prod', 'staging']
+    assert AuthManager.load_credentials() == 'd' * 30
+    assert AuthManager.load_credentials('prod') == 'a' * 30
+    assert AuthManager.load_credentials('missing') is None
+
+    AuthManager.clear_credentials('prod')
+    assert AuthManager.list_profiles() == ['default', 'staging']
+    assert AuthManager.load_credentials() == 'd' * 30
+
+
+def test_select_profiles(accounts):
+    assert select_profiles('all') == ['prod', 'staging']
+    assert select_profiles('staging, prod,staging') == ['staging', 'prod']
+    with pytest.raises(click.BadParameter):
+        select_profiles('prod,qa')
+    AuthManager.clear_credentials('prod')
+    AuthManager.clear_credentials('staging')
+    with pytest.raises(click.UsageError):
+        select_profiles('all')
+
+
+def test_clearing_one_profile_keeps_the_others(accounts):
+    from site24x7_cli.main import cli
+
+    AuthManager.save_credentials('d' * 30)
+    runner = CliRunner()
+    result = runner.invoke(cli, ['--account', 'staging', 'auth', 'clear'])
+    assert "Profile 'staging' cleared" in result.output
+    assert AuthManager.list_profiles() == ['default', 'prod']
+
+    AuthManager.clear_credentials()
+    assert AuthManager.list_profiles() == ['prod']
+    assert AuthManager.load_credentials('prod') == 'a' * 30
+
+    AuthManager.clear_credentials('prod')
+    assert not os.path.exists(AuthManager.CONFIG_FILE)
+    result = runner.invoke(cli, ['auth', 'clear', '--profile', 'prod'])
+    assert "Profile 'prod' is not configured" in result.output
+
+
+def test_named_profile_never_falls_back(accounts, monkeypatch, mock_api):
+    from site24x7_cli.main import cli
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ['--account', 'qa', 'monitor-management', 'website-monitors', 'list'])
+    assert result.exit_code == 1 and "Profile 'qa' is not configured" in result.output
+
+    monkeypatch.setenv('SITE24X7_PROFILE', 'prod')
+    result = runner.invoke(cli, ['auth', 'status'])
+    assert result.exit_code == 0 and 'aaaaaaaa' in result.output
+
+
+def test_auth_profiles_command(accounts):
+    from site24x7_cli.main import cli
+
+    result = CliRunner().invoke(cli, ['auth', 'profiles'])
+    assert result.output.splitlines() == ['prod\t***aaaaaaaa', 'staging\t***bbbbbbbb']
+
+
+def test_fan_out_against_the_mock_api(accounts, mock_api):
+    from site24x7_cli.main import cli
+
+    result = CliRunner().invoke(cli, ['-o', 'ndjson', '--profiles', 'all', 'monitor-management',
+                                      'website-monitors', 'list', '--limit', '3'])
+    assert result.exit_code == 0, result.output
+    records = [json.loads(line) for line in result.output.splitlines() if line.startswith('{')]
+    assert sorted((r['profile'], r['monitor_id']) for r in records) == [
+        (profile, str(100000 + i)) for profile in ('prod', 'staging') for i in range(3)]
+    # One pooled session per account token
+    assert {token for token, _ in base._shared_sessions} == {'a' * 30, 'b' * 30}
+
+
+def test_fan_out_reports_failing_profiles(accounts, mock_api):
+    from site24x7_cli.main import cli
+
+    result = CliRunner().invoke(cli, ['-o', 'json', '--profiles', 'prod,staging', 'monitor-management',
+                                      'website-monitors', 'get', '999'])
+    assert result.exit_code == 1
+    assert 'Failed for 2 of 2 profiles' in result.output
+
+
+def test_local_state_is_kept_per_profile(monkeypatch, tmp_path):
+    for name in ('MIRROR_PATH', 'REPORT_STORE_DIR', 'JOBS_DIR', 'DAEMON_SOCKET'):
+        monkeypatch.delenv(f'SITE24X7_{name}')
+    monkeypatch.setattr(Config, 'DEFAULT_DATA_DIR', str(tmp_path))
+
+    assert Config.get_mirror_path() == str(tmp_path / 'inventory.db')
+    assert Config.get_jobs_dir('default') == str(tmp_path / 'jobs')
+    assert Config.get_report_store_dir('prod') == str(tmp_path / 'profiles' / 'prod' / 'reports')
+    assert Config.get_daemon_socket('prod') == str(tmp_path / 'profiles' / 'prod' / 'daemon.sock')
+
+    monkeypatch.setenv('SITE24X7_JOBS_DIR', str(tmp_path / 'elsewhere'))
+    assert Config.get_jobs_dir('prod') == str(tmp_path / 'elsewhere')
+
+
+def test_daemon_socket_follows_the_account_option(monkeypatch):
+    assert daemon._profile(['--account', 'prod', 'sync']) == 'prod'
+    assert daemon._profile(['--account=staging', 'sync']) == 'staging'
+    assert daemon._profile(['sync']) is None
+    monkeypatch.setenv('SITE24X7_PROFILE', 'prod')
+    assert daemon._profile(['sync']) == 'prod'
+
+
+def test_accounts_sync_into_their_own_mirrors(accounts, monkeypatch, tmp_path, mock_api):
+    from site24x7_cli.main import cli
+
+    monkeypatch.delenv('SITE24X7_MIRROR_PATH')
+    monkeypatch.setattr(Config, 'DEFAULT_DATA_DIR', str(tmp_path))
+    result = CliRunner().invoke(cli, ['--account', 'prod', 'sync', '--type', 'website-monitors'])
+    assert result.exit_code == 0
+    assert os.path.exists(tmp_path / 'profiles' / 'prod' / 'inventory.db')
+    assert not os.path.exists(tmp_path / 'profiles' / 'staging' / 'inventory.db')
+    assert not os.path.exists(tmp_path / 'inventory.db')
+
+
+def test_credentials_file_is_private(tmp_path):
+    AuthManager.save_credentials('a' * 30)
+    assert os.stat(AuthManager.CONFIG_FILE).st_mode & 0o777 == 0o600
+
+    os.chmod(AuthManager.CONFIG_FILE, 0o644)
+    AuthManager.save_credentials('b' * 30, 'prod')
+    assert os.stat(AuthManager.CONFIG_FILE).st_mode & 0o777 == 0o600
+
+
+@pytest.mark.parametrize('name', ['../etc', 'a/b', '..', 'prod\n', 'a\\b', ''])
+def test_profile_names_are_validated(name):
+    with pytest.raises(ValidationError):
+        Config.validate_profile(name)
+    with pytest.raises(ValidationError):
+        AuthManager.save_credentials('a' * 30, name or '.')
+
+
+def test_invalid_account_is_a_usage_error(monkeypatch):
+    from site24x7_cli.main import cli
+
+    result = CliRunner().invoke(cli, ['--account', '../../tmp', 'sync'])
+    assert result.exit_code == 2 and 'Invalid profile name' in result.output
+    assert daemon.forward(['--account', '../../tmp', 'sync']) is None
+    assert Config.validate_profile('prod-eu_1.b') == 'prod-eu_1.b'
@@ -0,0 +1,202 @@
+"""
+Request and render timing with --profile and --timings
+"""
+
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from click.testing import CliRunner
+from urllib3 import connection
+from urllib3.util import connection as util_connection
+
+from site24x7_cli import profiling
+from site24x7_cli.base import Site24x7Client
+from site24x7_cli.profiling import Profiler
+
+
+@pytest.fixture(autouse=True)
+def no_profiler():
+    yield
+    profiling.disable()
+
+
+@pytest.fixture
+def server():
+    """Answers every GET with a small JSON document"""
+    body = json.dumps({'code': 0, 'data': [{'monitor_id': str(i)} for i in range(20)]}).encode('utf-8')
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True).start()
+    yield 'http://127.0.0.1:%d' % httpd.server_address[1], len(body)
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_profiler_summary_and_trace(tmp_path):
+    profiler = Profiler()
+    start = profiler.origin
+    profiler.record('GET /a', 'http', start, start + 0.010, bytes_in=100, bytes_out=0, attempt=0)
+    profiler.record('GET /a', 'http', start, start + 0.030, bytes_in=50, bytes_out=10, attempt=1)
+    profiler.record('server', 'phase', start, start + 0.020)
+    with profiler.span('render', 'render', format='json') as args:
+        args['records'] = 3
+
+    rows = {row['phase']: row for row in profiler.summary()}
+    assert [row['phase'] for row in profiler.summary()] == ['request', 'server', 'render']
+    request = rows['request']
+    assert (request['count'], request['total_ms'], request['max_ms']) == (2, 40.0, 30.0)
+    assert (request['bytes_in'], request['bytes_out'], request['retries']) == (150, 10, 1)
+
+    path = tmp_path / 'trace.json'
+    profiler.write_trace(str(path))
+    events = json.loads(path.read_text())['traceEvents']
+    assert events[-1]['args'] == {'format': 'json', 'records': 3}
+    assert all(event['ph'] == 'X' for event in events)
+
+
+def test_enable_reuses_the_running_profiler():
+    with profiling.span('render', 'render') as args:
+        assert args == {}
+    profiler = profiling.enable()
+    assert profiler is not None and profiling.enable() is None
+    assert profiling.get_profiler() is profiler
+    profiling.disable()
+    assert profiling.get_profiler() is None
+
+
+def test_profiled_request_records_phases(server):
+    url, size = server
+    profiler = profiling.enable()
+    client = Site24x7Client()
+    client.base_url = url
+
+    assert len(client.get('/monitors')['data']) == 20
+    http = [event for event in profiler.events if event['cat'] == 'http']
+    assert len(http) == 1
+    args = http[0]['args']
+    assert (args['status'], args['bytes_in'], args['attempt']) == (200, size, 0)
+    assert {'dns_ms', 'connect_ms', 'server_ms', 'body_ms'} <= set(args)
+    assert {event['name'] for event in profiler.events if event['cat'] == 'phase'} >= {'connect', 'server'}
+
+
+def test_profile_and_timings_options(monkeypatch, tmp_path):
+    from site24x7_cli.main import cli
+
+    monkeypatch.setattr(Site24x7Client, 'get', lambda *args, **kwargs: {
+        'code': 0, 'data': [{'monitor_id': '1'}, {'monitor_id': '2'}]})
+    trace = tmp_path / 'trace.json'
+    result = CliRunner().invoke(cli, ['--profile', str(trace), '--timings', '-o', 'json',
+                                      'monitor-management', 'website-monitors', 'list'])
+    assert result.exit_code == 0, result.output
+
+    events = json.loads(trace.read_text())['traceEvents']
+    assert [event['name'] for event in events] == ['render', 'command']
+    assert events[0]['args'] == {'format': 'json', 'records': 2}
+    assert 'render' in result.output and 'command' in result.output
+    assert profiling.get_profiler() is None
+
+
+def test_profile_against_the_mock_api(mock_api, tmp_path):
+    from site24x7_cli.main import cli
+
+    trace = tmp_path / 'trace.json'
+    result = CliRunner().invoke(cli, ['--profile', str(trace), '-o', 'ndjson', 'monitor-management',
+                                      'website-monitors', 'list', '--all', '--limit', '40'])
+    assert result.exit_code == 0, result.output
+    assert len(result.output.splitlines()) == 120
+
+    events = json.loads(trace.read_text())['traceEvents']
+    http = [event for event in events if event['cat'] == 'http']
+    assert len(http) == mock_api.stats['requests'] == 4
+    assert sum(event['args']['bytes_in'] for event in http) == mock_api.stats['bytes_out']
+    assert next(event for event in events if event['name'] == 'render')['args']['records'] == 120
+
+
+def test_disable_restores_the_connection_hooks():
+    originals = (socket.getaddrinfo, util_connection.create_connection, connection.HTTPSConnection.connect)
+    profiling.enable()
+    assert socket.getaddrinfo is not originals[0]
+    profiling.disable()
+    assert (socket.getaddrinfo, util_connection.create_connection,
+            connection.HTTPSConnection.connect) == originals
+
+
+def test_streamed_responses_are_timed_without_being_read(server):
+    url, size = server
+    profiler = profiling.enable()
+    client = Site24x7Client()
+    client.base_url = url
+
+    response = client.send('GET', '/monitors', stream=True)
+    assert not [event for event in profiler.events if event['cat'] == 'http']
+    assert not response._content_consumed
+    assert sum(len(chunk) for chunk in response.iter_content(8)) == size
+    http = [event for event in profiler.events if event['cat'] == 'http']
+    assert len(http) == 1 and http[0]['args']['bytes_in'] == size
+
+
+def test_profile_with_streamed_fields(mock_api, tmp_path):
+    from site24x7_cli.main import cli
+
+    trace = tmp_path / 'trace.json'
+    result = CliRunner().invoke(cli, ['--profile', str(trace), '--fields', 'monitor_id', '-o', 'ndjson',
+                                      'monitor-management', 'website-monitors', 'list', '--all',
+                                      '--limit', '40'])
+    assert result.exit_code == 0, result.output
+    assert [json.loads(line) for line in result.stdout.splitlines()][0] == {'monitor_id': '100000'}
+
+    events = json.loads(trace.read_text())['traceEvents']
+    http = [event for event in events if event['cat'] == 'http']
+    assert len(http) == mock_api.stats['requests']
+    assert sum(event['args']['bytes_in'] for event in http) == mock_api.stats['bytes_out']
+
+
+def test_threads_profile_separately():
+    profilers = {}
+    ready = threading.Barrier(2)
+
+    def command(name):
+        profiler = profiling.enable()
+        ready.wait()
+        with profiling.span(name, 'cli'):
+            pass
+        profilers[name] = profiler
+        ready.wait()
+        profiling.disable()
+
+    threads = [threading.Thread(target=command, args=(name,)) for name in ('first', 'second')]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert profilers['first'] is not profilers['second']
+    assert [event['name'] for event in profilers['first'].events] == ['first']
+    assert [event['name'] for event in profilers['second'].events] == ['second']
+    assert profiling.get_profiler() is None
+    assert socket.getaddrinfo.__name__ == 'getaddrinfo'
+
+
+def test_worker_threads_report_to_their_command(mock_api):
+    from site24x7_cli.bulk import run_bulk
+
+    profiler = profiling.enable()
+    client = Site24x7Client()
+    list(run_bulk(lambda i: client.get(f'/api/monitors/{i}'), ['100001', '100002'], concurrency=2))
+    assert len([event for event in profiler.events if event['cat'] == 'http']) == 2
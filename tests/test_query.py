@@ -0,0 +1,85 @@
+"""
+--where expression compiler and API pushdown
+"""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from site24x7_cli.exceptions import ValidationError
+from site24x7_cli.query import Query
+
+RECORDS = [
+    {'monitor_id': '1', 'display_name': 'web-shop', 'status': '1', 'group_id': '3', 'timeout': 30,
+     'type': 'URL', 'tags': ['prod', 'eu'], 'location': {'region': 'eu'}},
+    {'monitor_id': '2', 'display_name': 'web-blog', 'status': '0', 'group_id': '7', 'timeout': 10,
+     'type': 'URL', 'tags': ['dev']},
+    {'monitor_id': '3', 'display_name': 'api-orders', 'status': '2', 'group_id': '3', 'timeout': 60,
+     'type': 'RESTAPI', 'tags': []},
+]
+
+
+def _ids(expression):
+    return [record['monitor_id'] for record in Query(expression).filter(RECORDS)]
+
+
+@pytest.mark.parametrize('expression, expected', [
+    ('status == down', ['2']),
+    ('status = 1', ['1']),
+    ('status != up', ['2', '3']),
+    ('timeout >= 30', ['1', '3']),
+    ('timeout < 30 or type == RESTAPI', ['2', '3']),
+    ("display_name ~ '^web-'", ['1', '2']),
+    ("display_name !~ 'web'", ['3']),
+    ('group_id in (3, 7) and not type == RESTAPI', ['1', '2']),
+    ('tags == prod', ['1']),
+    ('location.region == eu', ['1']),
+    ("status == down and (display_name ~ '^web-' or group_id in (3, 7))", ['2']),
+    ('missing == 1', []),
+])
+def test_filter(expression, expected):
+    assert _ids(expression) == expected
+
+
+def test_numbers_compare_numerically():
+    assert Query('timeout > 9')({'timeout': '10'})
+    assert not Query('timeout > 9')({'timeout': 'n/a'})
+
+
+@pytest.mark.parametrize('expression', ['', 'status ==', 'status == 1 and', '(status == 1',
+                                        "display_name ~ '['", 'status ? 1'])
+def test_invalid_expressions(expression):
+    with pytest.raises(ValidationError):
+        Query(expression)
+
+
+@pytest.mark.parametrize('expression, params', [
+    ('status == down and group_id == 3', {'status': 'down', 'group_id': '3'}),
+    ('status = 1', {'status': '1'}),
+    ('group_id in (3) and timeout > 5', {'group_id': '3'}),
+    ('status == 1 or group_id == 3', {}),
+    ('not status == 1', {}),
+    ('group_id in (3, 7)', {}),
+    ('status != 1', {}),
+    ("display_name == 'x'", {}),
+])
+def test_pushdown(expression, params):
+    assert Query(expression).pushdown() == params
+
+
+
+@pytest.mark.parametrize('expression, requests', [
+    ('group_id == 3 and timeout >= 30', 1),
+    ('group_id == 3 or group_id == 3', 3),
+])
+def test_where_against_the_mock_api(mock_api, expression, requests):
+    from site24x7_cli.main import cli
+
+    result = CliRunner().invoke(cli, ['-o', 'ndjson', 'monitor-management', 'website-monitors', 'list',
+                                      '--all', '--where', expression])
+    assert result.exit_code == 0, result.output
+    ids = [json.loads(line)['monitor_id'] for line in result.output.splitlines()]
+    assert ids == [str(100000 + i) for i in range(3, 120, 20)]
+    # Pushed-down filters shrink the listing to a single page
+    assert mock_api.stats['requests'] == requests
@@ -0,0 +1,167 @@
+"""
+Desired-state planning
+"""
+
+import io
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from site24x7_cli.base import Site24x7Client
+from site24x7_cli.exceptions import ValidationError
+from site24x7_cli.reconcile import apply_change, load_desired, normalise, plan
+
+LIVE = {'website-monitors': [
+    {'monitor_id': '1', 'display_name': 'shop', 'website': 'https://shop', 'check_frequency': '5',
+     'user_group_ids': ['b', 'a']},
+    {'monitor_id': '2', 'display_name': 'blog', 'website': 'https://blog', 'check_frequency': '5'},
+    {'monitor_id': '3', 'display_name': 'old', 'website': 'https://old'},
+]}
+
+
+def _desired(*definitions, key='display_name'):
+    return {'key': key, 'monitors': {'website-monitors': list(definitions)}}
+
+
+def test_normalise():
+    assert normalise(5) == normalise(5.0) == normalise('5')
+    assert normalise(['b', 'a']) == normalise(['a', 'b'])
+    assert normalise({'b': True, 'a': None}) == {'a': None, 'b': 'true'}
+
+
+def test_matching_monitors_need_no_change():
+    desired = _desired({'display_name': 'shop', 'check_frequency': 5, 'user_group_ids': ['a', 'b']},
+                       {'display_name': 'blog', 'website': 'https://blog'})
+    assert plan(desired, LIVE) == []
+
+
+def test_creates_updates_and_prunes():
+    desired = _desired({'display_name': 'shop', 'check_frequency': 10},
+                       {'display_name': 'blog'},
+                       {'display_name': 'new', 'website': 'https://new'})
+    changes = plan(desired, LIVE, prune=True)
+
+    assert [(c.action, c.key, c.monitor_id) for c in changes] == [
+        ('update', 'shop', '1'), ('create', 'new', None), ('delete', 'old', '3')]
+    assert changes[0].fields == ['check_frequency']
+    assert changes[0].as_row()['fields'] == 'check_frequency'
+
+
+def test_without_prune_nothing_is_deleted():
+    changes = plan(_desired({'display_name': 'shop'}), LIVE)
+    assert changes == []
+
+
+def test_matching_on_another_key():
+    desired = _desired({'website': 'https://old', 'display_name': 'renamed'}, key='website')
+    [change] = plan(desired, LIVE)
+    assert (change.action, change.monitor_id, change.fields) == ('update', '3', ['display_name'])
+
+
+@pytest.mark.parametrize('definitions', [
+    [{'website': 'https://x'}],
+    [{'display_name': 'a'}, {'display_name': 'a'}],
+])
+def test_invalid_definitions(definitions):
+    with pytest.raises(ValidationError):
+        plan(_desired(*definitions), LIVE)
+
+
+def test_ambiguous_live_monitors():
+    live = {'website-monitors': LIVE['website-monitors'] + [{'monitor_id': '4', 'display_name': 'shop'}]}
+    with pytest.raises(ValidationError):
+        plan(_desired({'display_name': 'shop'}), live)
+
+
+def test_prune_deletes_every_live_duplicate():
+    live = {'website-monitors': LIVE['website-monitors'] + [{'monitor_id': '4', 'display_name': 'old'}]}
+    changes = plan(_desired({'display_name': 'shop'}, {'display_name': 'blog'}), live, prune=True)
+    assert [(change.action, change.monitor_id) for change in changes] == [('delete', '3'), ('delete', '4')]
+
+
+def test_load_desired():
+    stream = io.StringIO('{"key": "website", "website-monitors": [{"website": "https://a"}]}')
+    assert load_desired(stream) == {'key': 'website',
+                                    'monitors': {'website-monitors': [{'website': 'https://a'}]}}
+    with pytest.raises(ValidationError):
+        load_desired(io.StringIO('{"server-monitors": []}'))
+    with pytest.raises(ValidationError):
+        load_desired(io.StringIO('[]'))
+
+
+def test_load_desired_yaml():
+    pytest.importorskip('yaml')
+    stream = io.StringIO('website-monitors:\n  - display_name: a\n')
+    stream.name = 'desired.yaml'
+    assert load_desired(stream)['monitors'] == {'website-monitors': [{'display_name': 'a'}]}
+
+
+def test_apply_change_against_the_api(mock_api):
+    live = {'website-monitors': mock_api.data['website-monitors'][:3]}
+    desired = _desired({'display_name': 'website-000000', 'timeout': 60},
+                       {'display_name': 'website-000001'},
+                       {'display_name': 'brand-new'})
+    client = Site24x7Client()
+    for change in plan(desired, live, prune=True):
+        apply_change(client, change)
+
+    names = {record['display_name']: record for record in mock_api.data['website-monitors']}
+    assert names['website-000000']['timeout'] == 60
+    assert 'brand-new' in names and 'website-000002' not in names
+    assert plan(desired, {'website-monitors': list(names.values())[:2] + [names['brand-new']]}) == []
+
+
+def test_plan_and_apply_commands_against_the_mock_api(mock_api, tmp_path):
+    from site24x7_cli.main import cli
+
+    desired = tmp_path / 'monitors.json'
+    desired.write_text(json.dumps({'website-monitors': [
+        {'display_name': 'website-000005', 'check_frequency': '15'},
+        {'display_name': 'website-000006', 'check_frequency': '5'},
+        {'display_name': 'landing', 'website': 'https://landing'},
+    ]}))
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ['-o', 'json', 'plan', '-f', str(desired)])
+    assert result.exit_code == 0, result.output
+    rows = json.loads(result.output[:result.output.rindex(']') + 1])
+    assert [(row['action'], row['key']) for row in rows] == [('update', 'website-000005'),
+                                                             ('create', 'landing')]
+
+    result = runner.invoke(cli, ['apply', '-f', str(desired), '--concurrency', '2'])
+    assert result.exit_code == 0, result.output
+    assert mock_api.data['website-monitors'][5]['check_frequency'] == '15'
+    assert mock_api.data['website-monitors'][-1]['display_name'] == 'landing'
+
+    result = runner.invoke(cli, ['plan', '-f', str(desired)])
+    assert '0 to create, 0 to update, 0 to delete' in result.output
+
+
+def test_apply_prune_shows_the_plan_and_confirms_deletes(mock_api, tmp_path):
+    from site24x7_cli.main import cli
+
+    desired = tmp_path / 'monitors.json'
+    desired.write_text(json.dumps({'website-monitors': [
+        {'display_name': record['display_name']} for record in mock_api.data['website-monitors'][:118]]}))
+    args = ['apply', '-f', str(desired), '--prune']
+    runner = CliRunner()
+
+    result = runner.invoke(cli, args, input='n\n')
+    assert result.exit_code == 1
+    assert 'website-000118' in result.output and 'Delete 2 monitors?' in result.output
+    assert len(mock_api.data['website-monitors']) == 120
+
+    result = runner.invoke(cli, args + ['--yes'])
+    assert result.exit_code == 0, result.output
+    assert len(mock_api.data['website-monitors']) == 118
+
+
+def test_created_monitors_get_the_bulk_create_defaults(mock_api):
+    [change] = plan(_desired({'display_name': 'landing', 'website': 'https://landing'}),
+                    {'website-monitors': mock_api.data['website-monitors']})
+    created = apply_change(Site24x7Client(), change)
+
+    assert (created['monitor_type'], created['check_frequency'], created['timeout']) == (
+        'WEBSITE-MONITORS', '5', '30')
+    assert change.data == {'display_name': 'landing', 'website': 'https://landing'}
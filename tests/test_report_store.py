@@ -0,0 +1,179 @@
+"""
+Incremental report store behind 'performance-reports get --from/--to'
+"""
+
+import json
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from click.testing import CliRunner
+
+from site24x7_cli.base import Site24x7Client
+from site24x7_cli.report_store import ReportStore
+from site24x7_cli.windows import fetch_windows, format_time, sample_epoch
+
+UTC = timezone.utc
+DAY = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _samples(start, end, step=timedelta(minutes=30)):
+    samples = []
+    cursor = start
+    while cursor < end:
+        samples.append({'collection_time': format_time(cursor), 'response_time': cursor.minute})
+        cursor += step
+    return samples
+
+
+def test_sample_epoch():
+    assert sample_epoch({'timestamp': 1700000000}) == 1700000000
+    assert sample_epoch({'timestamp': 1700000000123}) == 1700000000.123
+    assert sample_epoch({'time': '2024-01-01T00:00:00Z'}) == DAY.timestamp()
+    assert sample_epoch({'time': 'soon'}) == 0.0
+    assert sample_epoch({}) == 0.0
+
+
+def test_fetch_windows_drops_boundary_duplicates():
+    windows = [(DAY, DAY + timedelta(hours=1)), (DAY + timedelta(hours=1), DAY + timedelta(hours=2))]
+
+    def fetch(start, end):
+        # Inclusive end, as the API does
+        return _samples(start, end + timedelta(minutes=1))
+
+    samples = [sample['collection_time'] for sample in fetch_windows(fetch, windows)]
+    assert len(samples) == len(set(samples)) == 4
+
+
+def test_missing_append_and_read(tmp_path):
+    store = ReportStore(str(tmp_path))
+    end = DAY + timedelta(hours=6)
+    assert store.missing('1', DAY, end) == [(DAY, end)]
+
+    store.append('1', DAY, DAY + timedelta(hours=2), _samples(DAY, DAY + timedelta(hours=2)))
+    store.append('1', DAY + timedelta(hours=4), end, _samples(DAY + timedelta(hours=4), end))
+    assert store.missing('1', DAY, end) == [(DAY + timedelta(hours=2), DAY + timedelta(hours=4))]
+    assert store.missing('1', DAY + timedelta(hours=1), DAY + timedelta(hours=2)) == []
+
+    samples = list(store.read('1', DAY + timedelta(hours=1), end))
+    assert len(samples) == 6
+    assert [sample_epoch(sample) for sample in samples] == sorted(sample_epoch(sample) for sample in samples)
+    assert list(store.read('2', DAY, end)) == []
+
+
+def test_adjacent_ranges_merge(tmp_path):
+    store = ReportStore(str(tmp_path))
+    store.append('1', DAY, DAY + timedelta(hours=1), [])
+    store.append('1', DAY + timedelta(hours=1), DAY + timedelta(hours=2), [])
+    with open(os.path.join(str(tmp_path), '1', 'index.json')) as f:
+        index = json.load(f)
+    assert index['covered'] == [[DAY.timestamp(), (DAY + timedelta(hours=2)).timestamp()]]
+    assert len(index['segments']) == 2
+
+
+def test_future_ranges_are_only_covered_up_to_now(tmp_path):
+    store = ReportStore(str(tmp_path), settle_margin=0)
+    now = datetime.now(UTC).replace(microsecond=0)
+    store.append('1', now - timedelta(hours=1), now + timedelta(hours=1), [])
+    gaps = store.missing('1', now - timedelta(hours=1), now + timedelta(hours=1))
+    assert len(gaps) == 1 and gaps[0][1] == now + timedelta(hours=1)
+    assert gaps[0][0] <= datetime.now(UTC)
+
+
+def test_recent_samples_are_never_covered(tmp_path):
+    store = ReportStore(str(tmp_path))
+    now = datetime.now(UTC).replace(microsecond=0)
+    store.append('1', now - timedelta(hours=1), now, [])
+    gaps = store.missing('1', now - timedelta(hours=1), now)
+    assert len(gaps) == 1 and gaps[0][1] == now
+    assert gaps[0][0] <= now - timedelta(minutes=14)
+
+
+def test_reversed_period_is_rejected(monkeypatch):
+    from site24x7_cli.main import cli
+
+    monkeypatch.setattr(Site24x7Client, 'get', lambda *args, **kwargs: pytest.fail('no request expected'))
+    result = CliRunner().invoke(cli, ['reports', 'performance-reports', 'get', '42',
+                                      '--from', format_time(DAY + timedelta(hours=1)),
+                                      '--to', format_time(DAY)])
+    assert result.exit_code == 1 and '--to must be later than --from' in result.output
+
+
+def test_get_fetches_only_the_gaps(monkeypatch):
+    from site24x7_cli.main import cli
+
+    requested = []
+
+    def get(self, endpoint, params=None, **kwargs):
+        requested.append((params['start_date'], params['end_date']))
+        start = datetime.strptime(params['start_date'], '%Y-%m-%dT%H:%M:%S%z')
+        end = datetime.strptime(params['end_date'], '%Y-%m-%dT%H:%M:%S%z')
+        return {'data': {'chart_data': _samples(start, end + timedelta(minutes=1))}}
+
+    monkeypatch.setattr(Site24x7Client, 'get', get)
+    runner = CliRunner()
+
+    def run(start, end, *extra):
+        result = runner.invoke(cli, ['-o', 'json', 'reports', 'performance-reports', 'get', '42',
+                                     '--from', format_time(start), '--to', format_time(end),
+                                     '--window', 'hour', *extra])
+        assert result.exit_code == 0, result.output
+        return json.loads(result.output[result.output.index('['):])
+
+    assert len(run(DAY, DAY + timedelta(hours=2))) == 4
+    assert len(requested) == 2
+
+    requested.clear()
+    rows = run(DAY, DAY + timedelta(hours=3))
+    assert len(rows) == 6
+    assert requested == [('2024-01-01T02:00:00+0000', '2024-01-01T03:00:00+0000')]
+
+    requested.clear()
+    assert len(run(DAY, DAY + timedelta(hours=3), '--no-store')) == 6
+    assert len(requested) == 3
+
+
+def test_refresh_against_the_mock_api(mock_api):
+    from site24x7_cli.main import cli
+
+    end = datetime.now(UTC).replace(microsecond=0)
+    args = ['-o', 'json', 'reports', 'performance-reports', 'get', '100000', '--window', 'hour',
+            '--from', format_time(end - timedelta(hours=4)), '--to', format_time(end)]
+    runner = CliRunner()
+    first = runner.invoke(cli, args)
+    assert first.exit_code == 0, first.output
+    # Four hourly windows up to the settle margin, then the unsettled tail
+    assert mock_api.stats['requests'] == 5
+
+    second = runner.invoke(cli, args)
+    assert second.exit_code == 0, second.output
+    # The stored part is not fetched again: only what settled since the first run,
+    # and the unsettled tail
+    assert mock_api.stats['requests'] == 7
+
+
+def test_unindexed_segments_are_not_kept(tmp_path):
+    store = ReportStore(str(tmp_path))
+    now = datetime.now(UTC)
+    # Entirely within the settle margin, so nothing is recorded as covered
+    assert store.append('1', now - timedelta(minutes=5), now, _samples(now - timedelta(minutes=5), now)) == 1
+    assert os.listdir(tmp_path / '1') == []
+
+    def failing():
+        yield from _samples(DAY, DAY + timedelta(hours=1))
+        raise ValueError('connection reset')
+
+    with pytest.raises(ValueError):
+        store.append('1', DAY, DAY + timedelta(hours=1), failing())
+    assert os.listdir(tmp_path / '1') == []
+    assert store.missing('1', DAY, DAY + timedelta(hours=1)) == [(DAY, DAY + timedelta(hours=1))]
+
+
+def test_untimed_samples_are_kept_by_fetch_and_read_alike(tmp_path):
+    samples = _samples(DAY, DAY + timedelta(hours=1)) + [{'response_time': 7}]
+    fetched = list(fetch_windows(lambda start, end: samples, [(DAY, DAY + timedelta(hours=1))]))
+    assert {'response_time': 7} in fetched
+
+    store = ReportStore(str(tmp_path))
+    store.append('1', DAY, DAY + timedelta(hours=1), fetched)
+    assert list(store.read('1', DAY, DAY + timedelta(hours=1))) == fetched
@@ -0,0 +1,141 @@
+"""
+Retry policy, backoff and client-side rate limiting
+"""
+
+import time
+
+import pytest
+import requests
+
+from site24x7_cli.base import Site24x7Client
+from site24x7_cli.ratelimit import TokenBucket
+from site24x7_cli.retry import RetryPolicy
+
+
+def _response(status, headers=None, body=b'{"code": 0}'):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    response._content = body
+    return response
+
+
+def test_throttled_requests_are_retried_for_any_method():
+    policy = RetryPolicy(max_retries=3)
+    assert policy.should_retry('POST', 0, response=_response(429))
+    assert not policy.should_retry('POST', 3, response=_response(429))
+
+
+def test_server_errors_are_retried_only_for_idempotent_methods():
+    policy = RetryPolicy()
+    assert policy.should_retry('GET', 0, response=_response(503))
+    assert policy.should_retry('delete', 0, response=_response(502))
+    assert not policy.should_retry('POST', 0, response=_response(503))
+    assert not policy.should_retry('GET', 0, response=_response(404))
+
+
+def test_connection_errors():
+    policy = RetryPolicy()
+    assert policy.should_retry('POST', 0, error=requests.exceptions.ConnectTimeout())
+    assert not policy.should_retry('POST', 0, error=requests.exceptions.ReadTimeout())
+    assert policy.should_retry('GET', 0, error=requests.exceptions.ConnectionError())
+    assert not policy.should_retry('GET', 0, error=ValueError())
+
+
+def test_backoff_is_jittered_and_capped():
+    policy = RetryPolicy(backoff_base=0.5, backoff_max=4.0)
+    for attempt in range(8):
+        assert 0 <= policy.delay(attempt) <= min(4.0, 0.5 * 2 ** attempt)
+
+
+@pytest.mark.parametrize('value, expected', [('7', 7.0), ('-3', 0.0), ('soon', None)])
+def test_retry_after_takes_precedence(value, expected):
+    response = _response(429, {'Retry-After': value})
+    assert RetryPolicy.retry_after(response) == expected
+    if expected is not None:
+        assert RetryPolicy().delay(5, response) == expected
+
+
+def test_retry_after_http_date():
+    response = _response(429, {'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'})
+    assert RetryPolicy.retry_after(response) == 0.0
+
+
+def test_token_bucket_limits_the_rate():
+    bucket = TokenBucket(rate=50, burst=1)
+    started = time.monotonic()
+    for _ in range(6):
+        bucket.acquire()
+    assert time.monotonic() - started >= 0.09
+
+
+def test_token_bucket_pause_applies_without_a_rate():
+    bucket = TokenBucket()
+    bucket.pause(0.05)
+    assert bucket.acquire() >= 0.04
+    assert bucket.acquire() == 0
+
+
+class _Session(requests.Session):
+    """Answers requests from a script of statuses and records them"""
+
+    def __init__(self, statuses):
+        super().__init__()
+        self.statuses = list(statuses)
+        self.sent = []
+
+    def request(self, method, url, **kwargs):
+        self.sent.append(method)
+        return _response(self.statuses.pop(0), {'Retry-After': '0'})
+
+
+def _client(statuses, max_retries=3):
+    client = Site24x7Client(max_retries=max_retries)
+    client.retry_policy.backoff_base = 0.001
+    client.session = _Session(statuses)
+    return client
+
+
+def test_client_retries_transient_failures():
+    client = _client([503, 429, 200])
+    assert client.request('GET', '/api/website-monitors') == {'code': 0}
+    assert client.session.sent == ['GET'] * 3
+
+
+def test_client_retries_posts_only_when_throttled():
+    client = _client([429, 200])
+    client.request('POST', '/api/website-monitors', json={})
+    assert len(client.session.sent) == 2
+
+    client = _client([503, 200])
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.request('POST', '/api/website-monitors', json={})
+    assert len(client.session.sent) == 1
+
+
+def test_client_gives_up_after_max_retries():
+    client = _client([503] * 5, max_retries=2)
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.request('GET', '/api/website-monitors')
+    assert len(client.session.sent) == 3
+
+
+def test_client_retries_injected_failures(mock_api):
+    mock_api.throttle_rate = 0.3
+    mock_api.error_rate = 0.2
+    client = Site24x7Client(max_retries=20)
+    client.retry_policy.backoff_base = 0.001
+    for _ in range(10):
+        assert client.get('/api/website-monitors/100001')['data']['monitor_id'] == '100001'
+
+    assert mock_api.stats['throttled'] + mock_api.stats['errors'] > 0
+    assert mock_api.stats['requests'] == 10 + mock_api.stats['throttled'] + mock_api.stats['errors']
+
+
+def test_mock_api_gives_up_after_max_retries(mock_api):
+    mock_api.error_rate = 1.0
+    client = Site24x7Client(max_retries=2)
+    client.retry_policy.backoff_base = 0.001
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.get('/api/website-monitors/100001')
+    assert mock_api.stats['requests'] == 3
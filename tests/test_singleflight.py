@@ -0,0 +1,95 @@
+"""
+Coalescing identical concurrent GETs
+"""
+
+import threading
+import time
+
+import pytest
+from click.testing import CliRunner
+
+from site24x7_cli.base import Site24x7Client
+from site24x7_cli.singleflight import SingleFlight
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        release.wait(1)
+        return {'data': [1]}
+
+    outcomes = []
+    threads = [threading.Thread(target=lambda: outcomes.append(flight.do('key', fetch)))
+               for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    while flight.hits < 4:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert sorted(shared for _, shared in outcomes) == [False, True, True, True, True]
+    results = [result for result, _ in outcomes]
+    assert all(result == {'data': [1]} for result in results)
+    # Every caller gets its own copy
+    assert len({id(result) for result in results}) == 5
+    assert flight.stats() == {'hits': 4, 'misses': 1, 'in_flight': 0, 'hit_rate': 0.8}
+
+
+def test_single_flight_shares_errors_but_keeps_nothing():
+    flight = SingleFlight()
+    with pytest.raises(KeyError):
+        flight.do('key', lambda: {}['missing'])
+    assert flight.do('key', lambda: 1) == (1, False)
+    assert flight.stats()['misses'] == 2
+
+
+def _concurrent_gets(client, count=8):
+    barrier = threading.Barrier(count)
+    results = []
+
+    def get():
+        barrier.wait()
+        results.append(client.get('/api/website-monitors/100001'))
+
+    threads = [threading.Thread(target=get) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_client_coalesces_against_the_mock_api(mock_api):
+    mock_api.latency = 0.1
+    client = Site24x7Client(coalesce=True)
+    results = _concurrent_gets(client)
+
+    assert len(results) == 8 and all(r['data']['monitor_id'] == '100001' for r in results)
+    assert mock_api.stats['requests'] == client.single_flight.stats()['misses'] < 8
+
+
+def test_coalescing_can_be_turned_off(mock_api, monkeypatch):
+    monkeypatch.setenv('SITE24X7_COALESCE', 'off')
+    mock_api.latency = 0.05
+    client = Site24x7Client()
+    assert client.single_flight is None
+    assert len(_concurrent_gets(client)) == 8
+    assert mock_api.stats['requests'] == 8
+
+
+def test_timings_report_coalesced_gets(mock_api):
+    from site24x7_cli.main import cli
+
+    mock_api.latency = 0.05
+    result = CliRunner().invoke(cli, ['--timings', '--no-cache', '-o', 'json', 'monitor-management',
+                                      'website-monitors', 'get', '100001', '100001', '100002', '-j', '3'])
+    assert result.exit_code == 0, result.output
+    assert 'single-flight' in result.stderr
+    assert mock_api.stats['requests'] == 2
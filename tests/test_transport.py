@@ -0,0 +1,106 @@
+"""
+HTTP transport settings: pools, timeouts, compression and keep-alive
+"""
+
+import socket
+
+from click.testing import CliRunner
+
+from site24x7_cli import base
+from site24x7_cli.base import Site24x7Client
+from site24x7_cli.transport import TransportConfig, keepalive_options
+
+
+def test_from_config_prefers_explicit_values(monkeypatch):
+    monkeypatch.setenv('SITE24X7_POOL_MAXSIZE', '32')
+    monkeypatch.setenv('SITE24X7_READ_TIMEOUT', '5')
+    monkeypatch.setenv('SITE24X7_COMPRESSION', 'off')
+    transport = TransportConfig.from_config(connect_timeout=2, keepalive=False)
+    assert (transport.pool_maxsize, transport.connect_timeout, transport.read_timeout) == (32, 2, 5.0)
+    assert not transport.compression and not transport.keepalive
+    assert transport.headers == {'Accept-Encoding': 'identity'}
+
+
+def test_timeout():
+    assert TransportConfig().timeout == (10.0, 60.0)
+    assert TransportConfig(connect_timeout=0, read_timeout=5).timeout == (None, 5)
+    assert TransportConfig(connect_timeout=0, read_timeout=0).timeout is None
+
+
+def test_keepalive_options():
+    options = keepalive_options()
+    assert options[0] == (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    assert TransportConfig().adapter().socket_options == options
+    assert TransportConfig(keepalive=False).adapter().socket_options is None
+
+
+def test_replace_and_equality():
+    transport = TransportConfig()
+    bigger = transport.replace(pool_maxsize=50)
+    assert bigger.pool_maxsize == 50 and transport.pool_maxsize == 10
+    assert transport == TransportConfig() and hash(transport) == hash(TransportConfig())
+    assert bigger != transport
+
+
+def test_size_pool_only_grows():
+    client = Site24x7Client(transport=TransportConfig(pool_maxsize=4))
+    assert client.session.get_adapter('https://x')._pool_maxsize == 4
+    client.size_pool(2)
+    assert client.transport.pool_maxsize == 4
+    client.size_pool(16)
+    assert client.transport.pool_maxsize == 16
+    assert client.session.get_adapter('https://x')._pool_maxsize == 16
+
+
+def test_shared_sessions_are_keyed_by_transport(monkeypatch):
+    monkeypatch.setattr(base, '_shared_sessions', None)
+    base.share_sessions()
+    first = Site24x7Client(transport=TransportConfig())
+    assert Site24x7Client(transport=TransportConfig()).session is first.session
+    assert Site24x7Client(transport=TransportConfig(read_timeout=5)).session is not first.session
+
+
+def test_compression_header_against_the_mock_api(mock_api):
+    response = Site24x7Client().send('GET', '/api/website-monitors/100001')
+    assert response.request.headers['Accept-Encoding'] == 'gzip, deflate'
+    response = Site24x7Client(transport=TransportConfig(compression=False)).send(
+        'GET', '/api/website-monitors/100001')
+    assert response.request.headers['Accept-Encoding'] == 'identity'
+
+
+def test_read_timeout_option_against_the_mock_api(mock_api):
+    from site24x7_cli.main import cli
+
+    mock_api.latency = 0.3
+    result = CliRunner().invoke(cli, ['--read-timeout', '0.05', '--max-retries', '0', 'monitor-management',
+                                      'website-monitors', 'get', '100001'])
+    assert result.exit_code != 0
+    assert 'timed out' in result.output.lower()
+
+    result = CliRunner().invoke(cli, ['--read-timeout', '5', 'monitor-management', 'website-monitors',
+                                      'get', '100001'])
+    assert result.exit_code == 0, result.output
+
+
+def test_size_pool_closes_the_replaced_adapter():
+    client = Site24x7Client(transport=TransportConfig(pool_maxsize=4))
+    old = client.session.get_adapter('https://x')
+    closed = []
+    old.close = lambda: closed.append(old)
+    client.size_pool(16)
+    assert closed == [old]
+
+
+def test_size_pool_leaves_shared_sessions_alone(monkeypatch):
+    monkeypatch.setattr(base, '_shared_sessions', None)
+    base.share_sessions()
+    first = Site24x7Client(transport=TransportConfig(pool_maxsize=4))
+    second = Site24x7Client(transport=TransportConfig(pool_maxsize=4))
+    shared = first.session
+
+    first.size_pool(16)
+    assert first.session is not shared and second.session is shared
+    assert shared.get_adapter('https://x')._pool_maxsize == 4
+    assert first.session.get_adapter('https://x')._pool_maxsize == 16
+    assert first.session.headers['Authorization'] == shared.headers['Authorization']
+    assert Site24x7Client(transport=TransportConfig(pool_maxsize=16)).session is first.session
@@ -0,0 +1,140 @@
+"""
+Status snapshots, transition diffing, flap detection and 'status watch'
+"""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from site24x7_cli.base import Site24x7Client
+from site24x7_cli.utils import status_name
+from site24x7_cli.watch import AdaptiveInterval, FlapDetector, diff_snapshots, snapshot
+
+
+def _status(*monitors, groups=()):
+    return {'code': 0, 'data': {
+        'monitors': [{'monitor_id': id, 'name': f'm{id}', 'status': status} for id, status in monitors],
+        'monitor_groups': [{'monitors': [{'monitor_id': id, 'display_name': f'g{id}', 'status': status}
+                                         for id, status in group]} for group in groups],
+    }}
+
+
+def test_status_name():
+    assert [status_name(code) for code in (0, '1', 2, 5)] == ['down', 'up', 'trouble', 'suspended']
+    assert status_name(42) == '42' and status_name(None) == 'None'
+
+
+def test_snapshot_includes_grouped_monitors():
+    assert snapshot(_status(('1', 1), groups=[[('2', 0)]])) == {
+        '1': {'name': 'm1', 'status': 'up'}, '2': {'name': 'g2', 'status': 'down'}}
+
+
+def test_diff_reports_changes_additions_and_removals():
+    before = snapshot(_status(('1', 1), ('2', 1), ('3', 1)))
+    after = snapshot(_status(('1', 1), ('2', 0), ('4', 2)))
+    assert sorted(diff_snapshots(before, after), key=lambda t: t['monitor_id']) == [
+        {'monitor_id': '2', 'name': 'm2', 'from': 'up', 'to': 'down'},
+        {'monitor_id': '3', 'name': 'm3', 'from': 'up', 'to': None},
+        {'monitor_id': '4', 'name': 'm4', 'from': None, 'to': 'trouble'},
+    ]
+    assert diff_snapshots(after, after) == []
+
+
+def test_flap_detector():
+    flaps = FlapDetector(threshold=3, window=10)
+    transition = [{'monitor_id': '1'}]
+    assert flaps.record(transition, now=0) == []
+    assert flaps.record(transition, now=5) == []
+    assert flaps.record(transition, now=9) == ['1']
+    # The first two transitions age out of the window
+    assert flaps.record([], now=16) == []
+    assert '1' in flaps.history
+    assert flaps.record([], now=30) == [] and not flaps.history
+
+
+def test_adaptive_interval():
+    interval = AdaptiveInterval(minimum=2, maximum=10, factor=2)
+    assert [interval.next(False) for _ in range(4)] == [4, 8, 10, 10]
+    assert interval.next(True) == 2.5
+    assert interval.next(True) == 2
+    interval.next(False)
+    assert interval.next(True, flapping=True) == 2
+
+
+@pytest.fixture
+def polls(monkeypatch):
+    """Serve a scripted sequence of /current_status responses"""
+    responses = [_status(('1', 1), ('2', 1)), _status(('1', 0), ('2', 1)), _status(('1', 1))]
+
+    def request(self, method, endpoint, **kwargs):
+        assert (method, endpoint) == ('GET', '/current_status')
+        return responses.pop(0)
+
+    monkeypatch.setattr(Site24x7Client, 'request', request)
+    monkeypatch.setattr('time.sleep', lambda seconds: None)
+    return responses
+
+
+def test_watch_prints_transitions(polls):
+    from site24x7_cli.main import cli
+
+    result = CliRunner().invoke(cli, ['-o', 'ndjson', 'status', 'watch', '--count', '3'])
+    assert result.exit_code == 0, result.output
+    transitions = [json.loads(line) for line in result.output.splitlines()]
+    assert [(t['monitor_id'], t['from'], t['to']) for t in transitions] == [
+        ('1', 'up', 'down'), ('1', 'down', 'up'), ('2', 'up', None)]
+    assert not polls
+
+
+def test_watch_against_the_mock_api(mock_api, monkeypatch):
+    from site24x7_cli.main import cli
+
+    monitors = mock_api.data['website-monitors']
+    changes = [lambda: monitors[0].update(status='0'), lambda: monitors.pop(1)]
+    monkeypatch.setattr('time.sleep', lambda seconds: changes.pop(0)())
+
+    result = CliRunner().invoke(cli, ['-o', 'ndjson', 'status', 'watch', '--count', '3'])
+    assert result.exit_code == 0, result.output
+    transitions = [json.loads(line) for line in result.output.splitlines()]
+    assert [(t['monitor_id'], t['from'], t['to']) for t in transitions] == [
+        ('100000', 'up', 'down'), ('100001', 'up', None)]
+    assert mock_api.stats['requests'] == 3
+
+
+def test_watch_survives_a_failed_poll(monkeypatch):
+    from site24x7_cli.main import cli
+
+    responses = [_status(('1', 1)), RuntimeError('gateway timeout'), _status(('1', 0))]
+
+    def request(self, method, endpoint, **kwargs):
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    monkeypatch.setattr(Site24x7Client, 'request', request)
+    monkeypatch.setattr('time.sleep', lambda seconds: None)
+
+    result = CliRunner().invoke(cli, ['-o', 'json', 'status', 'watch', '--count', '3'])
+    assert result.exit_code == 0, result.output
+    assert 'Poll failed: gateway timeout' in result.stderr
+    # The transition across the failed poll is still reported, in a closed array
+    assert [(t['from'], t['to']) for t in json.loads(result.stdout)] == [('up', 'down')]
+
+
+def test_interrupted_watch_closes_its_output(mock_api, monkeypatch):
+    from site24x7_cli.main import cli
+
+    monitors = mock_api.data['website-monitors']
+    changes = [lambda: monitors[0].update(status='0'), KeyboardInterrupt]
+
+    def sleep(seconds):
+        change = changes.pop(0)
+        if change is KeyboardInterrupt:
+            raise KeyboardInterrupt
+        change()
+
+    monkeypatch.setattr('time.sleep', sleep)
+    result = CliRunner().invoke(cli, ['-o', 'json', 'status', 'watch'])
+    assert [t['monitor_id'] for t in json.loads(result.stdout)] == ['100000']
@@ -0,0 +1,114 @@
+"""
+Time-window sharding of performance report periods
+"""
+
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from click.testing import CliRunner
+
+from site24x7_cli.base import Site24x7Client
+from site24x7_cli.exceptions import ValidationError
+from site24x7_cli.windows import (fetch_windows, format_time, parse_time, report_samples,
+                                  sample_time, split_windows)
+
+UTC = timezone.utc
+
+
+def test_parse_time_accepts_iso_and_epoch():
+    assert parse_time('1700000000') == datetime.fromtimestamp(1700000000, tz=UTC)
+    assert parse_time('2024-01-01T00:00:00Z') == datetime(2024, 1, 1, tzinfo=UTC)
+    assert parse_time('2024-01-01') == datetime(2024, 1, 1, tzinfo=UTC)
+    assert parse_time('2024-01-01T02:00:00+02:00') == datetime(2024, 1, 1, tzinfo=UTC)
+    with pytest.raises(ValidationError):
+        parse_time('yesterday')
+
+
+def test_format_time():
+    assert format_time(datetime(2024, 1, 1, 6, tzinfo=UTC)) == '2024-01-01T06:00:00+0000'
+
+
+def test_split_windows_covers_the_range_without_overlap():
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    windows = split_windows(start, start + timedelta(hours=50), timedelta(days=1))
+    assert [(w[1] - w[0]).total_seconds() / 3600 for w in windows] == [24, 24, 2]
+    assert all(a[1] == b[0] for a, b in zip(windows, windows[1:]))
+    with pytest.raises(ValidationError):
+        split_windows(start, start, timedelta(hours=1))
+
+
+def test_report_samples_and_sample_time():
+    assert report_samples({'data': {'chart_data': [1, 2]}}) == [1, 2]
+    assert report_samples({'data': [{'a': 1}]}) == [{'a': 1}]
+    assert report_samples({'data': {'a': 1}}) == [{'a': 1}]
+    assert sample_time({'collection_time': '2024'}) == '2024'
+    assert sample_time([1700000000, 5]) == '1700000000'
+    assert sample_time('junk') == ''
+
+
+def test_fetch_windows_orders_samples_and_bounds_in_flight():
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    windows = split_windows(start, start + timedelta(hours=8), timedelta(hours=1))
+    lock = threading.Lock()
+    state = {'active': 0, 'peak': 0}
+
+    def fetch(window_start, window_end):
+        with lock:
+            state['active'] += 1
+            state['peak'] = max(state['peak'], state['active'])
+        # Later windows finish first, the stream must still come out in order
+        time.sleep(0.01 * (8 - window_start.hour))
+        with lock:
+            state['active'] -= 1
+        return [{'timestamp': format_time(window_start + timedelta(minutes=m))} for m in (30, 0)]
+
+    samples = [sample['timestamp'] for sample in fetch_windows(fetch, windows, concurrency=3)]
+    assert samples == sorted(samples) and len(samples) == 16
+    assert state['peak'] <= 3
+
+
+def test_get_with_period_fetches_each_window(monkeypatch):
+    from site24x7_cli.main import cli
+
+    requested = []
+
+    def get(self, endpoint, params=None, **kwargs):
+        requested.append(params)
+        return {'data': {'chart_data': [{'timestamp': params['start_date'], 'response_time': 1}]}}
+
+    monkeypatch.setattr(Site24x7Client, 'get', get)
+    result = CliRunner().invoke(cli, ['-o', 'json', 'reports', 'performance-reports', 'get', '123',
+                                      '--from', '2024-01-01T00:00:00Z', '--to', '2024-01-01T03:00:00Z',
+                                      '--window', 'hour', '--window-concurrency', '2'])
+    assert result.exit_code == 0, result.output
+    rows = json.loads(result.output[result.output.index('['):])
+    assert [row['timestamp'] for row in rows] == [
+        '2024-01-01T00:00:00+0000', '2024-01-01T01:00:00+0000', '2024-01-01T02:00:00+0000']
+    assert sorted(params['end_date'] for params in requested) == [
+        '2024-01-01T01:00:00+0000', '2024-01-01T02:00:00+0000', '2024-01-01T03:00:00+0000']
+
+
+def test_get_needs_both_ends_of_the_period(monkeypatch):
+    from site24x7_cli.main import cli
+
+    monkeypatch.setattr(Site24x7Client, 'get', lambda *args, **kwargs: pytest.fail('no request expected'))
+    result = CliRunner().invoke(cli, ['reports', 'performance-reports', 'get', '123', '--from', '1700000000'])
+    assert result.exit_code != 0
+
+
+def test_get_period_against_the_mock_api(mock_api):
+    from site24x7_cli.main import cli
+
+    end = datetime.now(UTC)
+    start = end - timedelta(hours=3)
+    result = CliRunner().invoke(cli, ['-o', 'json', 'reports', 'performance-reports', 'get', '100000',
+                                      '--from', format_time(start), '--to', format_time(end),
+                                      '--window', 'hour', '--no-store'])
+    assert result.exit_code == 0, result.output
+    times = [row['collection_time'] for row in json.loads(result.output[result.output.index('['):])]
+    assert times == sorted(times) and len(times) == len(set(times))
+    assert all(int(start.timestamp()) <= t < end.timestamp() for t in times)
+    assert len(times) >= 30 and mock_api.stats['requests'] == 3